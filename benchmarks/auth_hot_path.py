@@ -0,0 +1,307 @@
+"""Per-call CPU cost of each step on the protected-request path.
+
+Times the pieces a protected request runs through outside I/O: reading
+the bearer token, verifying the access JWT (cold and through the verify
+cache), the auth-user cache codec, ``PermissionGuard.require``, the
+``Result`` helpers, ``BaseSchema.from_dto`` and ``_app_error_handler``.
+Each case is calibrated to ``--min-time`` per round and cases alternate
+within each of ``--repeat`` rounds. The median per case is compared with
+``benchmarks/baselines/auth_hot_path.json``; the run exits non-zero when
+a case is slower by more than ``--tolerance`` and ``--min-delta-ns``.
+Baselines are only comparable on the machine that recorded them.
+
+    uv run python benchmarks/auth_hot_path.py [--filter S] [--update-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Final
+
+from starlette.requests import Request
+from uuid_utils.compat import UUID
+
+from backend.application.common.dtos.users import UserResponseDTO
+from backend.application.common.exceptions.application import (
+    AppError,
+    AuthorizationError,
+    TooManyRequestsError,
+)
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.tools.permission_guard import (
+    PermissionGuard,
+)
+from backend.application.handlers.result import ResultImpl, capture
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.security.auth.cache_codec import (
+    decode_cached_user,
+    encode_cached_user,
+)
+from backend.infrastructure.security.auth.jwt import JwtConfig, JwtImpl
+from backend.presentation.app import _app_error_handler
+from backend.presentation.di.request_provider import _extract_bearer_token
+from backend.presentation.http.api.schemas.users import UserResponse
+
+_BASELINE: Final[Path] = (
+    Path(__file__).resolve().parent / "baselines" / "auth_hot_path.json"
+)
+_USER_ID: Final[UUID] = UUID("12345678-1234-5678-1234-567812345678")
+
+type Case = Callable[[], object]
+
+
+def _jwt() -> JwtImpl:
+    cfg = JwtConfig(
+        issuer="bench",
+        audience="bench",
+        alg="HS256",
+        access_ttl=timedelta(minutes=15),
+        refresh_ttl=timedelta(days=14),
+        secret="".join(("bench", "-secret") * 4),
+    )
+    return JwtImpl(cfg)
+
+
+def _request(token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/users/me",
+            "headers": [
+                (b"host", b"bench"),
+                (b"accept", b"application/json"),
+                (b"user-agent", b"bench/1.0"),
+                (b"authorization", f"Bearer {token}".encode()),
+            ],
+        }
+    )
+
+
+def _drive(coro: Coroutine[None, None, None]) -> None:
+    # The guard never suspends, so one send() runs it to completion
+    # without paying for an event loop round-trip.
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    raise RuntimeError("Coroutine suspended")
+
+
+def _cases() -> dict[str, Case]:
+    jwt = _jwt()
+    token = jwt.issue_access(user_id=_USER_ID)
+    cached_jwt = JwtImpl(
+        jwt.cfg,
+        access_cache=LocalTTLCache(
+            max_entries=1024, max_weight=1024, ttl_s=900.0
+        ),
+    )
+    cached_jwt.verify_access(token).unwrap()
+    scope = _request(token).scope
+
+    member = AuthUser(
+        id=_USER_ID,
+        role_codes=frozenset({"user", "admin"}),
+        permission_codes=frozenset(
+            {PermissionCode.USERS_READ, PermissionCode.RBAC_READ_ROLES}
+        ),
+        is_active=True,
+        is_admin=True,
+        email="bench@example.com",
+    )
+    entry = CachedAuthUser(user=member, refresh_at=time.time() + 60)
+    raw_entry = encode_cached_user(entry)
+    guard = PermissionGuard()
+
+    def _guard_denied() -> None:
+        try:
+            _drive(guard.require(member, PermissionCode.RBAC_ASSIGN_ROLE))
+        except AuthorizationError:
+            return
+
+    def _boom() -> int:
+        raise ValueError("boom")
+
+    def _to_app_error(exc: Exception) -> AppError:
+        return AuthorizationError(str(exc))
+
+    dto = UserResponseDTO(
+        id=_USER_ID,
+        email="bench@example.com",
+        login="bench",
+        username="bench",
+    )
+    error_request = _request(token)
+    forbidden = AuthorizationError("Access denied by policy for users:read")
+    throttled = TooManyRequestsError(retry_after_s=30)
+
+    return {
+        "extract_bearer_token": lambda: _extract_bearer_token(Request(scope)),
+        "jwt_verify_access": lambda: jwt.verify_access(token),
+        "jwt_verify_access_cached": lambda: cached_jwt.verify_access(token),
+        "encode_cached_user": lambda: encode_cached_user(entry),
+        "decode_cached_user": lambda: decode_cached_user(raw_entry),
+        "permission_guard_allowed": lambda: _drive(
+            guard.require(member, PermissionCode.USERS_READ)
+        ),
+        "permission_guard_denied": _guard_denied,
+        "result_ok_unwrap": lambda: ResultImpl.ok(1).unwrap(),
+        "result_ok_map": lambda: ResultImpl.ok(1).map(str).unwrap(),
+        "capture_ok": lambda: capture(int, _to_app_error),
+        "capture_err": lambda: capture(_boom, _to_app_error),
+        "schema_from_dto": lambda: UserResponse.from_dto(dto),
+        "app_error_handler": lambda: _app_error_handler(
+            error_request, forbidden
+        ),
+        "app_error_handler_retry_after": lambda: _app_error_handler(
+            error_request, throttled
+        ),
+    }
+
+
+def _loops_for(case: Case, min_time_ns: int) -> int:
+    loops = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            case()
+        if time.perf_counter_ns() - started >= min_time_ns:
+            return loops
+        loops *= 2
+
+
+def _measure(
+    cases: Mapping[str, Case], *, repeat: int, min_time_s: float
+) -> dict[str, list[float]]:
+    loops = {
+        name: _loops_for(case, int(min_time_s * 1e9))
+        for name, case in cases.items()
+    }
+    rounds: dict[str, list[float]] = {name: [] for name in cases}
+    # Cases take turns within each round so machine drift over the run
+    # spreads across all of them; GC is off while timing, as in timeit.
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for name, case in cases.items():
+                started = time.perf_counter_ns()
+                for _ in range(loops[name]):
+                    case()
+                elapsed = time.perf_counter_ns() - started
+                rounds[name].append(elapsed / loops[name])
+    finally:
+        gc.enable()
+    return rounds
+
+
+def _regressions(
+    report: Mapping[str, Mapping[str, float]],
+    baseline: Mapping[str, Mapping[str, float]],
+    tolerance: float,
+    min_delta_ns: float,
+) -> list[str]:
+    found: list[str] = []
+    for name, now in report.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        limit = max(
+            base["median_ns"] * (1 + tolerance),
+            base["median_ns"] + min_delta_ns,
+        )
+        if now["median_ns"] > limit:
+            found.append(
+                f"{name}: {now['median_ns']:.0f} ns"
+                f" > {base['median_ns']:.0f} ns (limit {limit:.0f})"
+            )
+    return found
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--min-delta-ns", type=float, default=100.0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    # The error handler logs every call; keep the records, drop the output.
+    logging.getLogger("backend").addHandler(logging.NullHandler())
+    logging.getLogger("backend").propagate = False
+
+    cases = {
+        name: case for name, case in _cases().items() if args.filter in name
+    }
+    rounds = _measure(cases, repeat=args.repeat, min_time_s=args.min_time)
+    report = {
+        name: {
+            "median_ns": round(statistics.median(values), 1),
+            "min_ns": round(min(values), 1),
+        }
+        for name, values in rounds.items()
+    }
+    out = sys.stdout
+    out.write(f"{'case':<30} {'median ns':>10} {'min ns':>10}\n")
+    for name, stats in report.items():
+        out.write(
+            f"{name:<30} {stats['median_ns']:>10.0f}"
+            f" {stats['min_ns']:>10.0f}\n"
+        )
+
+    document = {
+        "machine": f"{platform.node()} {platform.machine()}",
+        "python": platform.python_version(),
+        "cases": report,
+    }
+    text = json.dumps(document, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(text)
+    if args.update_baseline:
+        if args.filter:
+            previous = json.loads(args.baseline.read_text())
+            document["cases"] = {**previous["cases"], **report}
+            text = json.dumps(document, indent=2) + "\n"
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text)
+        out.write(f"baseline written to {args.baseline}\n")
+        return 0
+    if not args.baseline.exists():
+        out.write(f"no baseline at {args.baseline}\n")
+        return 0
+    found = _regressions(
+        report,
+        json.loads(args.baseline.read_text())["cases"],
+        args.tolerance,
+        args.min_delta_ns,
+    )
+    if found:
+        sys.stderr.write(
+            f"REGRESSION against {args.baseline}:\n"
+            + "".join(f"  {line}\n" for line in found)
+        )
+        return 1
+    out.write(f"within {args.tolerance:.0%} of {args.baseline}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
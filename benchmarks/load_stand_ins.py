@@ -0,0 +1,600 @@
+"""In-process stand-ins for Postgres and Redis, used by ``load_test.py``.
+
+``StandInProvider`` overrides the storage- and Redis-backed providers of
+``create_app`` so routing, DI, auth, handlers and serialization run for
+real while nothing leaves the process. Numbers measured on it are the
+app's own per-request cost, not database or network latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
+
+from dishka import Provider, Scope, provide
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import (
+    NotFoundStorageError,
+    StorageError,
+)
+from backend.application.common.interfaces.auth.ports import (
+    Authenticator,
+    RefreshStore,
+    RefreshSwapOutcome,
+)
+from backend.application.common.interfaces.ports.cache import (
+    BytesCache,
+    StrCache,
+)
+from backend.application.common.interfaces.ports.persistence.gateway import (
+    PersistenceGateway,
+    ReadPersistenceGateway,
+)
+from backend.application.common.interfaces.ports.persistence.manager import (
+    Query,
+    TransactionManager,
+    TransactionScope,
+)
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserListFilter,
+    UserPageKey,
+    UserSummary,
+)
+from backend.application.common.interfaces.ports.rate_limit import (
+    RateLimit,
+    RateLimiter,
+)
+from backend.application.common.tools.refresh_tokens import refresh_key
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.domain.core.constants.rbac_registry import ROLE_PERMISSIONS
+from backend.domain.core.entities.user import User
+from backend.domain.core.types.rbac import PermissionCode, RoleCode
+from backend.infrastructure.persistence.cache.redis_pubsub import (
+    RedisInvalidationBus,
+    RedisReloadSignal,
+)
+from backend.infrastructure.security.auth.authenticator import (
+    AuthenticatorImpl,
+)
+from backend.infrastructure.security.auth.refresh_store import (
+    RefreshStoreImpl,
+)
+from backend.infrastructure.security.auth.role_permissions import (
+    RolePermissionIndexLoader,
+)
+from backend.infrastructure.security.auth.user_resolver import (
+    AuthenticatorFactory,
+)
+
+_UNIQUE_FIELDS: tuple[str, ...] = ("email", "login", "username")
+
+
+def _not_found() -> NotFoundStorageError:
+    return NotFoundStorageError(
+        code="user.not_found", message="User not found", detail="not found"
+    )
+
+
+@dataclass(slots=True)
+class StandInStore:
+    """Users and RBAC tables, seeded with the migration's roles."""
+
+    users: dict[UUID, User] = field(default_factory=dict)
+    user_roles: dict[UUID, set[RoleCode]] = field(default_factory=dict)
+    role_permissions: dict[RoleCode, set[PermissionCode]] = field(
+        default_factory=lambda: {
+            str(role): set(codes) for role, codes in ROLE_PERMISSIONS.items()
+        }
+    )
+
+    def user(self: StandInStore, user: User, *, with_roles: bool) -> User:
+        roles = set(self.user_roles.get(user.id, ())) if with_roles else set()
+        return dataclasses.replace(user, roles=roles)
+
+    def find(self: StandInStore, match: Callable[[User], bool]) -> User | None:
+        return next((u for u in self.users.values() if match(u)), None)
+
+
+@dataclass(slots=True)
+class StandInUsersAdapter:
+    store: StandInStore
+
+    async def get_by_id(
+        self: StandInUsersAdapter,
+        user_id: UUID,
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Result[User, StorageError]:
+        user = self.store.users.get(user_id)
+        if user is None:
+            return ResultImpl.err(_not_found(), User)
+        return ResultImpl.ok(self.store.user(user, with_roles=include_roles))
+
+    async def get_many_by_ids(
+        self: StandInUsersAdapter,
+        user_ids: Sequence[UUID],
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Result[list[User], StorageError]:
+        users = [
+            self.store.user(
+                self.store.users[user_id], with_roles=include_roles
+            )
+            for user_id in dict.fromkeys(user_ids)
+            if user_id in self.store.users
+        ]
+        return ResultImpl.ok(users)
+
+    async def list_page(
+        self: StandInUsersAdapter,
+        filters: UserListFilter,
+        /,
+        *,
+        after: UserPageKey | None,
+        limit: int,
+    ) -> Result[list[UserSummary], StorageError]:
+        users = [
+            user
+            for user in self.store.users.values()
+            if (
+                filters.is_active is None
+                or user.is_active == filters.is_active
+            )
+            and (
+                filters.role is None
+                or filters.role in self.store.user_roles.get(user.id, ())
+            )
+            and (
+                not filters.email_prefix
+                or user.email.startswith(filters.email_prefix)
+            )
+        ]
+        if filters.email_prefix:
+            users.sort(key=lambda user: user.email)
+            if after is not None:
+                users = [user for user in users if user.email > after.email]
+        else:
+            users.sort(key=lambda user: user.id)
+            if after is not None:
+                users = [user for user in users if user.id > after.id]
+        return ResultImpl.ok(
+            [
+                UserSummary(
+                    id=user.id,
+                    email=user.email,
+                    login=user.login,
+                    username=user.username,
+                )
+                for user in users[:limit]
+            ]
+        )
+
+    async def get_with_permissions(
+        self: StandInUsersAdapter, user_id: UUID, /
+    ) -> Result[tuple[User, set[PermissionCode]], StorageError]:
+        found = self.store.users.get(user_id)
+        if found is None:
+            return ResultImpl.err(
+                _not_found(), tuple[User, set[PermissionCode]]
+            )
+        user = self.store.user(found, with_roles=True)
+        permissions = {
+            code
+            for role in user.roles
+            for code in self.store.role_permissions.get(role, ())
+        }
+        return ResultImpl.ok((user, permissions))
+
+    async def get_by_email(
+        self: StandInUsersAdapter,
+        email: str,
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Result[User, StorageError]:
+        user = self.store.find(lambda user: user.email == email)
+        if user is None:
+            return ResultImpl.err(_not_found(), User)
+        return ResultImpl.ok(self.store.user(user, with_roles=include_roles))
+
+    async def save(
+        self: StandInUsersAdapter,
+        user: User,
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Result[User, StorageError]:
+        for name in _UNIQUE_FIELDS:
+            value = getattr(user, name)
+            taken = self.store.find(
+                lambda other, name=name, value=value: (
+                    other.id != user.id and getattr(other, name) == value
+                )
+            )
+            if taken is not None:
+                return ResultImpl.err(
+                    StorageError(
+                        code="db.unique_violation",
+                        message="Unique constraint violated",
+                        meta={"constraint": f"users_{name}_key"},
+                    ),
+                    User,
+                )
+        self.store.users[user.id] = dataclasses.replace(user, roles=set())
+        if include_roles:
+            return ResultImpl.ok(self.store.user(user, with_roles=True))
+        return ResultImpl.ok(dataclasses.replace(user, roles=set(user.roles)))
+
+    async def delete(
+        self: StandInUsersAdapter, user_id: UUID, /
+    ) -> Result[bool, StorageError]:
+        self.store.user_roles.pop(user_id, None)
+        return ResultImpl.ok(self.store.users.pop(user_id, None) is not None)
+
+
+@dataclass(slots=True)
+class StandInRbacAdapter:
+    store: StandInStore
+
+    async def get_user_roles(
+        self: StandInRbacAdapter, user_id: UUID, /
+    ) -> Result[set[RoleCode], StorageError]:
+        return ResultImpl.ok(set(self.store.user_roles.get(user_id, ())))
+
+    async def get_user_permission_codes(
+        self: StandInRbacAdapter, user_id: UUID, /
+    ) -> Result[set[PermissionCode], StorageError]:
+        return ResultImpl.ok(
+            {
+                code
+                for role in self.store.user_roles.get(user_id, ())
+                for code in self.store.role_permissions.get(role, ())
+            }
+        )
+
+    async def replace_user_roles(
+        self: StandInRbacAdapter, user_id: UUID, roles: set[RoleCode], /
+    ) -> Result[None, StorageError]:
+        if not roles <= self.store.role_permissions.keys():
+            return ResultImpl.err(
+                StorageError(
+                    code="rbac.seed_mismatch",
+                    message="RBAC roles are missing in DB (seed mismatch)",
+                ),
+                type(None),
+            )
+        self.store.user_roles[user_id] = set(roles)
+        return ResultImpl.ok(None)
+
+    async def list_role_permissions(
+        self: StandInRbacAdapter,
+    ) -> Result[dict[RoleCode, set[PermissionCode]], StorageError]:
+        return ResultImpl.ok(
+            {
+                role: set(codes)
+                for role, codes in self.store.role_permissions.items()
+            }
+        )
+
+    def _member_ids(self: StandInRbacAdapter, role: RoleCode) -> list[UUID]:
+        return sorted(
+            user_id
+            for user_id, roles in self.store.user_roles.items()
+            if role in roles
+        )
+
+    async def list_user_ids_by_role(
+        self: StandInRbacAdapter,
+        role: RoleCode,
+        /,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
+    ) -> Result[list[UUID], StorageError]:
+        ids = [
+            user_id
+            for user_id in self._member_ids(role)
+            if after is None or user_id > after
+        ]
+        return ResultImpl.ok(ids if limit is None else ids[:limit])
+
+    async def stream_users_by_role(
+        self: StandInRbacAdapter, role: RoleCode, /, *, chunk_size: int
+    ) -> Result[AsyncIterator[list[User]], StorageError]:
+        ids = self._member_ids(role)
+        store = self.store
+
+        async def _chunks() -> AsyncIterator[list[User]]:
+            for start in range(0, len(ids), chunk_size):
+                yield [
+                    store.user(store.users[user_id], with_roles=False)
+                    for user_id in ids[start : start + chunk_size]
+                ]
+
+        return ResultImpl.ok(_chunks())
+
+
+class _NoopTransaction(AbstractAsyncContextManager[TransactionManager]):
+    __slots__: tuple[str, ...] = ("_manager",)
+
+    def __init__(self: _NoopTransaction, manager: TransactionManager) -> None:
+        self._manager = manager
+
+    async def __aenter__(self: _NoopTransaction) -> TransactionManager:
+        return self._manager
+
+    async def __aexit__(
+        self: _NoopTransaction,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class StandInTransactionManager:
+    """The stand-in adapters never send SQL; transactions are no-ops."""
+
+    def transaction(
+        self: StandInTransactionManager, *, nested: bool = False
+    ) -> TransactionScope:
+        del nested
+        return _NoopTransaction(self)
+
+    async def send[T](
+        self: StandInTransactionManager, query: Query[T], /
+    ) -> T:
+        del query
+        raise RuntimeError("The stand-in storage has no SQL session")
+
+
+@dataclass(slots=True)
+class StandInGateway:
+    manager: TransactionManager
+    users: StandInUsersAdapter
+    rbac: StandInRbacAdapter
+
+    @classmethod
+    def over(cls: type[StandInGateway], store: StandInStore) -> StandInGateway:
+        return cls(
+            manager=StandInTransactionManager(),
+            users=StandInUsersAdapter(store),
+            rbac=StandInRbacAdapter(store),
+        )
+
+
+@dataclass(slots=True)
+class MemoryCache:
+    """``StrCache`` and ``BytesCache`` over a dict with lazy expiry."""
+
+    entries: dict[str, tuple[str | bytes | int, float | None]] = field(
+        default_factory=dict
+    )
+
+    def _read(self: MemoryCache, key: str) -> str | bytes | int | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+        return value
+
+    def _write(
+        self: MemoryCache,
+        key: str,
+        value: str | bytes | int,
+        ttl_s: int | None,
+    ) -> None:
+        expires_at = None if ttl_s is None else time.monotonic() + ttl_s
+        self.entries[key] = (value, expires_at)
+
+    async def get(self: MemoryCache, key: str) -> str | bytes | None:
+        value = self._read(key)
+        return str(value) if isinstance(value, int) else value
+
+    async def set(
+        self: MemoryCache,
+        key: str,
+        value: str | bytes,
+        *,
+        ttl_s: int | None = None,
+    ) -> None:
+        self._write(key, value, ttl_s)
+
+    async def delete(self: MemoryCache, key: str) -> None:
+        self.entries.pop(key, None)
+
+    async def increment(self: MemoryCache, key: str, *, delta: int = 1) -> int:
+        current = self._read(key)
+        value = (int(current) if current is not None else 0) + delta
+        self.entries[key] = (value, self.entries.get(key, (0, None))[1])
+        return value
+
+
+@dataclass(slots=True)
+class MemoryRefreshStore(RefreshStoreImpl, RefreshStore):
+    async def compare_and_swap(
+        self: MemoryRefreshStore,
+        *,
+        user_id: UUID,
+        fingerprint: str,
+        expected: str,
+        value: str,
+        ttl_s: int,
+    ) -> RefreshSwapOutcome:
+        # No await between the read and the write: atomic on one loop.
+        key = refresh_key(user_id, fingerprint)
+        if expected:
+            current = await self.cache.get(key)
+            if current is None:
+                return "missing"
+            if current != expected:
+                await self.cache.delete(key)
+                return "replay"
+        await self.cache.set(key, value, ttl_s=ttl_s)
+        return "ok"
+
+
+@dataclass(slots=True)
+class MemoryRateLimiter(RateLimiter):
+    hits: dict[str, deque[float]] = field(default_factory=dict)
+
+    async def hit(
+        self: MemoryRateLimiter, limits: Sequence[RateLimit]
+    ) -> int | None:
+        now = time.monotonic()
+        windows: list[deque[float]] = []
+        for limit in limits:
+            window = self.hits.setdefault(limit.key, deque())
+            while window and window[0] <= now - limit.window_s:
+                window.popleft()
+            if len(window) >= limit.limit:
+                return max(1, int(window[0] + limit.window_s - now))
+            windows.append(window)
+        for window in windows:
+            window.append(now)
+        return None
+
+
+@dataclass(slots=True)
+class LocalInvalidationBus:
+    """Delivers invalidations to this process's listener directly."""
+
+    listeners: list[Callable[[UUID], None]] = field(default_factory=list)
+
+    async def publish(self: LocalInvalidationBus, user_id: UUID) -> None:
+        for listener in self.listeners:
+            listener(user_id)
+
+    async def listen(
+        self: LocalInvalidationBus,
+        *,
+        on_invalidate: Callable[[UUID], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        on_reset()
+        self.listeners.append(on_invalidate)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self.listeners.remove(on_invalidate)
+
+
+@dataclass(slots=True)
+class IdleReloadSignal:
+    """Roles never change during a run, so no reload is ever signalled."""
+
+    async def listen(
+        self: IdleReloadSignal, *, on_reload: Callable[[], Awaitable[object]]
+    ) -> None:
+        del on_reload
+        await asyncio.Event().wait()
+
+
+@dataclass(slots=True)
+class StandInRoleLoader:
+    index: RolePermissionIndex
+    store: StandInStore
+
+    async def reload(self: StandInRoleLoader) -> bool:
+        result = await StandInRbacAdapter(self.store).list_role_permissions()
+        self.index.replace(result.unwrap())
+        return True
+
+
+class StandInProvider(Provider):
+    """Overrides every provider of ``create_app`` that needs Postgres/Redis.
+
+    The engine and Redis client are still built, but nothing connects:
+    set ``DB_POOL_PREWARM=false`` so startup does not try to.
+    """
+
+    def __init__(self: Self, store: StandInStore) -> None:
+        super().__init__()
+        self._store = store
+
+    @provide(scope=Scope.APP)
+    def store(self: Self) -> StandInStore:
+        return self._store
+
+    @provide(scope=Scope.APP)
+    def memory_cache(self: Self) -> MemoryCache:
+        return MemoryCache()
+
+    @provide(scope=Scope.APP)
+    def str_cache(self: Self, cache: MemoryCache) -> StrCache:
+        return cache  # type: ignore[return-value]
+
+    @provide(scope=Scope.APP)
+    def bytes_cache(self: Self, cache: MemoryCache) -> BytesCache:
+        return cache  # type: ignore[return-value]
+
+    @provide(scope=Scope.APP)
+    def refresh_store(self: Self, cache: StrCache) -> RefreshStore:
+        return MemoryRefreshStore(cache=cache)
+
+    @provide(scope=Scope.APP)
+    def rate_limiter(self: Self) -> RateLimiter:
+        return MemoryRateLimiter()
+
+    @provide(scope=Scope.APP)
+    def invalidation_bus(self: Self) -> RedisInvalidationBus:
+        return LocalInvalidationBus()  # type: ignore[return-value]
+
+    @provide(scope=Scope.APP)
+    def role_permission_reload_signal(self: Self) -> RedisReloadSignal:
+        return IdleReloadSignal()  # type: ignore[return-value]
+
+    @provide(scope=Scope.APP)
+    def role_permission_loader(
+        self: Self, index: RolePermissionIndex, store: StandInStore
+    ) -> RolePermissionIndexLoader:
+        return StandInRoleLoader(index=index, store=store)  # type: ignore[return-value]
+
+    @provide(scope=Scope.APP)
+    def authenticators(
+        self: Self,
+        store: StandInStore,
+        role_permissions: RolePermissionIndex,
+    ) -> AuthenticatorFactory:
+        @asynccontextmanager
+        async def _open() -> AsyncIterator[Authenticator]:
+            gateway = StandInGateway.over(store)
+            yield AuthenticatorImpl(
+                users=gateway.users,
+                rbac=gateway.rbac,
+                role_permissions=role_permissions,
+            )
+
+        return _open
+
+    @provide(scope=Scope.REQUEST)
+    def transaction_manager(self: Self) -> TransactionManager:
+        return StandInTransactionManager()
+
+    @provide(scope=Scope.REQUEST)
+    def persistence_gateway(
+        self: Self, store: StandInStore
+    ) -> PersistenceGateway:
+        return StandInGateway.over(store)
+
+    @provide(scope=Scope.REQUEST)
+    def read_gateway(
+        self: Self, store: StandInStore
+    ) -> ReadPersistenceGateway:
+        return StandInGateway.over(store)
@@ -0,0 +1,128 @@
+"""Cost of turning fetched rows into persistence records.
+
+Fetches ``--rows`` user rows from an in-memory SQLite table (UUIDs come
+back already typed, as with asyncpg) and times only the decoding step.
+``legacy`` is what the rawadapter queries used to do: ``mappings()``,
+``dict(row)`` at the call site and again inside ``convert_record``, then
+a keyed ``msgspec.convert`` per row. ``positional`` is ``convert_rows``
+over row tuples into the ``array_like`` records.
+
+    uv run python benchmarks/row_decoding.py [--rows N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+
+import msgspec
+import sqlalchemy as sa
+from uuid_utils.compat import UUID
+
+from backend.infrastructure.persistence.records import UserRowRecord
+from backend.infrastructure.tools.msgspec_convert import (
+    _row_dec_hook,
+    convert_rows,
+)
+
+
+class _KeyedUserRowRecord(msgspec.Struct, frozen=True):
+    id: UUID
+    email: str
+    login: str
+    username: str
+    password_hash: str
+    is_active: bool
+
+
+def _legacy_convert_record(
+    row: Mapping[str, object],
+) -> _KeyedUserRowRecord:
+    return msgspec.convert(
+        dict(row),
+        _KeyedUserRowRecord,
+        strict=True,
+        dec_hook=_row_dec_hook,
+    )
+
+
+def _fetch_rows(count: int) -> Sequence[sa.Row[tuple[object, ...]]]:
+    metadata = sa.MetaData()
+    users = sa.Table(
+        "users",
+        metadata,
+        sa.Column("id", sa.Uuid, primary_key=True),
+        sa.Column("email", sa.String),
+        sa.Column("login", sa.String),
+        sa.Column("username", sa.String),
+        sa.Column("password_hash", sa.String),
+        sa.Column("is_active", sa.Boolean),
+    )
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            users.insert(),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "email": f"user{n}@example.com",
+                    "login": f"user{n}",
+                    "username": f"user{n}",
+                    "password_hash": "$argon2id$bench",
+                    "is_active": True,
+                }
+                for n in range(count)
+            ],
+        )
+        # Plain string labels, as the rawadapter statements use.
+        columns = [column.label(str(column.key)) for column in users.c]
+        return conn.execute(sa.select(*columns)).all()
+
+
+def _legacy(rows: Sequence[sa.Row[tuple[object, ...]]]) -> int:
+    return len([_legacy_convert_record(dict(row._mapping)) for row in rows])
+
+
+def _positional(rows: Sequence[sa.Row[tuple[object, ...]]]) -> int:
+    return len(convert_rows(rows, UserRowRecord))
+
+
+def _best_ms(
+    decode: Callable[[Sequence[sa.Row[tuple[object, ...]]]], int],
+    rows: Sequence[sa.Row[tuple[object, ...]]],
+    *,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(rows)
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = _fetch_rows(args.rows)
+    before = _best_ms(_legacy, rows, repeat=args.repeat)
+    after = _best_ms(_positional, rows, repeat=args.repeat)
+
+    out = sys.stdout
+    out.write(f"{args.rows} rows\n")
+    out.write(f"{'decoder':<12} {'ms':>9} {'us/row':>8}\n")
+    for name, ms in (("legacy", before), ("positional", after)):
+        out.write(f"{name:<12} {ms:>9.1f} {ms * 1e3 / args.rows:>8.2f}\n")
+    out.write(f"saved {1 - after / before:.0%}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""Per-call CPU cost of building and compiling rawadapter statements.
+
+Runs each query function against a session that performs SQLAlchemy's
+per-execute compile step (cache key + compiled-cache lookup) and never
+reaches a driver, so the numbers are pure Python overhead. ``legacy``
+rebuilds the statement on every call, as the rawadapter queries used to;
+``prebuilt`` is the current module-level statement.
+
+    uv run python benchmarks/statement_cache.py [--calls N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Final
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.util import LRUCache
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.ports.persistence.manager import (
+    SessionProtocol,
+)
+from backend.infrastructure.persistence.rawadapter.users import (
+    q_get_user_access_by_id,
+    q_get_user_row_by_email,
+    q_get_user_row_by_id,
+)
+from backend.infrastructure.persistence.sqlalchemy.session_db import (
+    require_async_session,
+)
+from backend.infrastructure.persistence.sqlalchemy.tables.role import (
+    roles_table,
+)
+from backend.infrastructure.persistence.sqlalchemy.tables.role_permission import (
+    role_permissions_table,
+    user_roles_table,
+)
+from backend.infrastructure.persistence.sqlalchemy.tables.users import (
+    users_table,
+)
+
+_USER_ID: Final[UUID] = UUID("12345678-1234-5678-1234-567812345678")
+_EMAIL: Final[str] = "bench@example.com"
+
+type _Query = Callable[[SessionProtocol], Awaitable[object]]
+
+
+class _NoRows:
+    def mappings(self: _NoRows) -> _NoRows:
+        return self
+
+    def first(self: _NoRows) -> None:
+        return None
+
+
+class _CompileOnlySession(AsyncSession):
+    """Does what ``Connection.execute`` does before calling the driver."""
+
+    def __init__(self: _CompileOnlySession) -> None:
+        self._dialect = PGDialect_asyncpg()
+        self._compiled_cache: LRUCache[object, object] = LRUCache(500)
+
+    async def execute(  # type: ignore[override]
+        self: _CompileOnlySession,
+        statement: sa.Executable,
+        params: Mapping[str, object] | None = None,
+    ) -> _NoRows:
+        statement._compile_w_cache(  # type: ignore[attr-defined]
+            self._dialect,
+            compiled_cache=self._compiled_cache,
+            column_keys=sorted(params or ()),
+        )
+        return _NoRows()
+
+
+def _user_row_columns() -> tuple[sa.Label[object], ...]:
+    return (
+        users_table.c.id.label("id"),
+        users_table.c.email.label("email"),
+        users_table.c.login.label("login"),
+        users_table.c.username.label("username"),
+        users_table.c.password_hash.label("password_hash"),
+        users_table.c.is_active.label("is_active"),
+    )
+
+
+def _legacy_row_by(where: sa.ColumnElement[bool]) -> _Query:
+    async def _q(session: SessionProtocol) -> object:
+        stmt = (
+            sa.select(*_user_row_columns())
+            .select_from(users_table)
+            .where(where)
+        )
+        return await require_async_session(session).execute(stmt)
+
+    return _q
+
+
+def _legacy_row_by_id(user_id: UUID) -> _Query:
+    return _legacy_row_by(users_table.c.id == user_id)
+
+
+def _legacy_row_by_email(email: str) -> _Query:
+    return _legacy_row_by(users_table.c.email == email)
+
+
+def _legacy_access_by_id(user_id: UUID) -> _Query:
+    async def _q(session: SessionProtocol) -> object:
+        role_code = roles_table.c.code
+        permission_code = role_permissions_table.c.permission_code
+        join_stmt = (
+            users_table.outerjoin(
+                user_roles_table,
+                user_roles_table.c.user_id == users_table.c.id,
+            )
+            .outerjoin(
+                roles_table, roles_table.c.id == user_roles_table.c.role_id
+            )
+            .outerjoin(
+                role_permissions_table,
+                role_permissions_table.c.role_id == roles_table.c.id,
+            )
+        )
+        stmt = (
+            sa.select(
+                *_user_row_columns(),
+                sa.func.array_agg(sa.distinct(role_code))
+                .filter(role_code.is_not(None))
+                .label("roles"),
+                sa.func.array_agg(sa.distinct(permission_code))
+                .filter(permission_code.is_not(None))
+                .label("permission_codes"),
+            )
+            .select_from(join_stmt)
+            .where(users_table.c.id == user_id)
+            .group_by(users_table.c.id)
+        )
+        return await require_async_session(session).execute(stmt)
+
+    return _q
+
+
+_CASES: Final[
+    tuple[tuple[str, Callable[[], _Query], Callable[[], _Query]], ...]
+] = (
+    (
+        "user_row_by_id",
+        lambda: _legacy_row_by_id(_USER_ID),
+        lambda: q_get_user_row_by_id(_USER_ID),
+    ),
+    (
+        "user_row_by_email",
+        lambda: _legacy_row_by_email(_EMAIL),
+        lambda: q_get_user_row_by_email(_EMAIL),
+    ),
+    (
+        "user_access_by_id",
+        lambda: _legacy_access_by_id(_USER_ID),
+        lambda: q_get_user_access_by_id(_USER_ID),
+    ),
+)
+
+
+async def _per_call_us(
+    make_query: Callable[[], _Query], *, calls: int, repeat: int
+) -> float:
+    session = _CompileOnlySession()
+    await make_query()(session)  # warm the compiled cache
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await make_query()(session)
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e6
+
+
+async def _run(calls: int, repeat: int) -> list[tuple[str, float, float]]:
+    rows: list[tuple[str, float, float]] = []
+    for name, legacy, prebuilt in _CASES:
+        before = await _per_call_us(legacy, calls=calls, repeat=repeat)
+        after = await _per_call_us(prebuilt, calls=calls, repeat=repeat)
+        rows.append((name, before, after))
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_run(args.calls, args.repeat))
+    out = sys.stdout
+    out.write(
+        f"{'query':<20} {'legacy us':>10} {'prebuilt us':>12} {'saved':>8}\n"
+    )
+    for name, before, after in rows:
+        out.write(
+            f"{name:<20} {before:>10.1f} {after:>12.1f} "
+            f"{1 - after / before:>8.0%}\n"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+"""Index user_roles by (role_id, user_id) for keyset role listings.
+
+Revision ID: 20260212_0005
+Revises: 20260210_0004
+Create Date: 2026-02-12 00:05:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260212_0005"
+down_revision: str | None = "20260210_0004"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps role assignment writable while the index builds;
+    # the composite index also serves every role_id-only lookup.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_roles_role_id_user_id",
+            "user_roles",
+            ["role_id", "user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_user_roles_role_id",
+            table_name="user_roles",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_roles_role_id",
+            "user_roles",
+            ["role_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_user_roles_role_id_user_id",
+            table_name="user_roles",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
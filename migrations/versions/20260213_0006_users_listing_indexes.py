@@ -0,0 +1,55 @@
+"""Add indexes backing keyset pages of the users listing.
+
+Revision ID: 20260213_0006
+Revises: 20260212_0005
+Create Date: 2026-02-13 00:06:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260213_0006"
+down_revision: str | None = "20260212_0005"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_is_active_id",
+            "users",
+            ["is_active", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Byte-order copy of email: prefix filters become plain range
+        # predicates that also work in generic prepared plans.
+        op.create_index(
+            "ix_users_email_c",
+            "users",
+            [sa.text('(email COLLATE "C")')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_email_c",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_is_active_id",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
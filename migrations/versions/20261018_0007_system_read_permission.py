@@ -0,0 +1,76 @@
+"""Add the system:read permission and grant it to admin roles.
+
+Revision ID: 20261018_0007
+Revises: 20260213_0006
+Create Date: 2026-10-18 00:07:00.000000
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from typing import Final
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0007"
+down_revision: str | None = "20260213_0006"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_PERMISSION_CODE: Final[str] = "system:read"
+_ROLE_CODES: Final[tuple[str, ...]] = ("admin", "super_admin")
+
+_PERMISSIONS_TABLE = sa.table(
+    "permissions",
+    sa.column("code", sa.String(length=64)),
+    sa.column("description", sa.String(length=255)),
+)
+_ROLE_PERMISSIONS_TABLE = sa.table(
+    "role_permissions",
+    sa.column("role_id", postgresql.UUID(as_uuid=True)),
+    sa.column("permission_code", sa.String(length=64)),
+)
+
+
+def _role_id(role_code: str) -> uuid.UUID:
+    return uuid.uuid5(uuid.NAMESPACE_OID, f"role:{role_code}")
+
+
+def upgrade() -> None:
+    # Fresh databases already got these rows from the bootstrap revision.
+    op.execute(
+        pg_insert(_PERMISSIONS_TABLE)
+        .values(code=_PERMISSION_CODE, description=None)
+        .on_conflict_do_nothing(index_elements=["code"])
+    )
+    op.execute(
+        pg_insert(_ROLE_PERMISSIONS_TABLE)
+        .values(
+            [
+                {
+                    "role_id": _role_id(code),
+                    "permission_code": _PERMISSION_CODE,
+                }
+                for code in _ROLE_CODES
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["role_id", "permission_code"])
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        sa.delete(_ROLE_PERMISSIONS_TABLE).where(
+            _ROLE_PERMISSIONS_TABLE.c.permission_code == _PERMISSION_CODE
+        )
+    )
+    op.execute(
+        sa.delete(_PERMISSIONS_TABLE).where(
+            _PERMISSIONS_TABLE.c.code == _PERMISSION_CODE
+        )
+    )
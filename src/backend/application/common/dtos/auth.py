@@ -11,6 +11,11 @@ class TokenPairDTO:
     refresh_token: str
 
 
+@dto
+class RegisteredUserDTO(TokenPairDTO):
+    user_id: UUID
+
+
 @dto
 class RegisterUserDTO:
     email: str
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from uuid_utils.compat import UUID
 
 from backend.application.common.dtos.base import dto
@@ -44,9 +46,24 @@ class UserRolesResponseDTO:
 @dto
 class GetUsersByRoleDTO:
     role: str
+    limit: int | None = None
+    after: UUID | None = None
 
 
 @dto
 class UsersByRoleResponseDTO:
     role: str
     users: list[UserResponseDTO]
+    next_after: UUID | None = None
+
+
+@dto
+class StreamUsersByRoleDTO:
+    role: str
+    chunk_size: int
+
+
+@dto
+class UsersByRoleStreamDTO:
+    role: str
+    chunks: AsyncIterator[list[UserResponseDTO]]
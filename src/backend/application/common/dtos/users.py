@@ -3,6 +3,9 @@ from __future__ import annotations
 from uuid_utils.compat import UUID
 
 from backend.application.common.dtos.base import dto
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserPageKey,
+)
 
 
 @dto
@@ -38,6 +41,21 @@ class GetUserDTO:
     user_id: UUID
 
 
+@dto
+class ListUsersDTO:
+    limit: int
+    after: UserPageKey | None = None
+    is_active: bool | None = None
+    role: str | None = None
+    email_prefix: str | None = None
+
+
+@dto
+class UsersPageDTO:
+    users: list[UserResponseDTO]
+    next_after: UserPageKey | None = None
+
+
 @dto
 class GetUserWithRolesDTO:
     user_id: UUID
@@ -7,4 +7,9 @@ class RefreshTokenReplayError(PermissionError): ...
 class InvalidRefreshTokenError(PermissionError): ...
 
 
-class RefreshTokenLockTimeoutError(TimeoutError): ...
+class PasswordHashingBusyError(Exception):
+    def __init__(
+        self: PasswordHashingBusyError, *, retry_after_s: int
+    ) -> None:
+        super().__init__("Password hashing capacity exhausted")
+        self.retry_after_s = retry_after_s
@@ -4,12 +4,12 @@ from collections.abc import Callable
 
 from backend.application.common.exceptions.application import (
     AppError,
-    ConflictError,
+    TooManyRequestsError,
     UnauthenticatedError,
 )
 from backend.application.common.exceptions.auth import (
     InvalidRefreshTokenError,
-    RefreshTokenLockTimeoutError,
+    PasswordHashingBusyError,
     RefreshTokenReplayError,
 )
 
@@ -33,16 +33,17 @@ def unauthenticated(message: str) -> Callable[[Exception], AppError]:
     return factory
 
 
-def conflict(message: str) -> Callable[[Exception], AppError]:
-    def factory(_exc: Exception) -> AppError:
-        return ConflictError(message)
-
-    return factory
+def too_many_requests(exc: Exception) -> AppError:
+    retry_after_s = 1
+    if isinstance(exc, PasswordHashingBusyError):
+        retry_after_s = exc.retry_after_s
+    return TooManyRequestsError(retry_after_s=retry_after_s)
 
 
 def map_invalid_credentials() -> Callable[[Exception], AppError]:
     return map_auth_error(
-        (ValueError, unauthenticated("Invalid email or password"))
+        (PasswordHashingBusyError, too_many_requests),
+        (ValueError, unauthenticated("Invalid email or password")),
     )
 
 
@@ -52,10 +53,6 @@ def map_refresh_replay() -> Callable[[Exception], AppError]:
             RefreshTokenReplayError,
             unauthenticated("Refresh token replay detected"),
         ),
-        (
-            RefreshTokenLockTimeoutError,
-            conflict("Refresh token operation timeout, retry"),
-        ),
     )
 
 
@@ -72,8 +69,4 @@ def map_refresh_token_error() -> Callable[[Exception], AppError]:
             RefreshTokenReplayError,
             unauthenticated("Refresh token replay detected"),
         ),
-        (
-            RefreshTokenLockTimeoutError,
-            conflict("Refresh token operation timeout, retry"),
-        ),
     )
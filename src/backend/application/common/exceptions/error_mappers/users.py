@@ -5,12 +5,18 @@ from collections.abc import Callable
 from backend.application.common.exceptions.application import (
     AppError,
     ConflictError,
+    TooManyRequestsError,
+)
+from backend.application.common.exceptions.auth import (
+    PasswordHashingBusyError,
 )
 from backend.domain.core.exceptions.base import DomainError, DomainTypeError
 
 
 def map_user_input_error() -> Callable[[Exception], AppError]:
     def mapper(exc: Exception) -> AppError:
+        if isinstance(exc, PasswordHashingBusyError):
+            return TooManyRequestsError(retry_after_s=exc.retry_after_s)
         if isinstance(
             exc, (ValueError, DomainTypeError, DomainError, RuntimeError)
         ):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Literal, Protocol
 
 from uuid_utils.compat import UUID
 
@@ -11,6 +11,7 @@ from backend.application.common.interfaces.auth.types import (
     PermissionSpec,
 )
 from backend.application.handlers.result import Result
+from backend.domain.core.constants.permission_codes import permission_bit
 from backend.domain.core.types.rbac import (
     PermissionCode,
     RoleCode,
@@ -21,6 +22,7 @@ _ADMIN_ROLE: RoleCode = "admin"
 
 
 class Authenticator(Protocol):
+    # None means the user does not exist; storage failures raise.
     async def authenticate(
         self: Authenticator, user_id: UUID
     ) -> AuthUser | None: ...
@@ -48,6 +50,9 @@ class JwtVerifier(Protocol):
     ) -> Result[tuple[UUID, str, str], AppError]: ...
 
 
+type RefreshSwapOutcome = Literal["ok", "missing", "replay"]
+
+
 class RefreshStore(Protocol):
     async def get(
         self: RefreshStore, *, user_id: UUID, fingerprint: str
@@ -66,6 +71,28 @@ class RefreshStore(Protocol):
         self: RefreshStore, *, user_id: UUID, fingerprint: str
     ) -> None: ...
 
+    # Single round trip: an empty ``expected`` sets unconditionally,
+    # a mismatch deletes the stored token and reports a replay.
+    async def compare_and_swap(
+        self: RefreshStore,
+        *,
+        user_id: UUID,
+        fingerprint: str,
+        expected: str,
+        value: str,
+        ttl_s: int,
+    ) -> RefreshSwapOutcome: ...
+
+
+class PasswordRehashScheduler(Protocol):
+    def schedule(
+        self: PasswordRehashScheduler,
+        *,
+        user_id: UUID,
+        raw_password: str,
+        current_hash: str,
+    ) -> None: ...
+
 
 def derive_auth_flags(
     role_codes: frozenset[RoleCode],
@@ -75,8 +102,5 @@ def derive_auth_flags(
     return is_admin, is_superuser
 
 
-def has_permission(
-    permission_codes: frozenset[PermissionCode],
-    code: PermissionCode,
-) -> bool:
-    return code in permission_codes
+def has_permission(permission_mask: int, code: PermissionCode) -> bool:
+    return bool(permission_mask & permission_bit(code))
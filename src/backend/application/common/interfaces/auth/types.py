@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from uuid_utils.compat import UUID
 
+from backend.domain.core.constants.permission_codes import (
+    permissions_to_mask,
+)
 from backend.domain.core.types.rbac import (
     PermissionCode,
     RoleCode,
@@ -19,6 +22,19 @@ class AuthUser:
     is_admin: bool = False
     is_superuser: bool = False
     email: str | None = None
+    permission_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self: AuthUser) -> None:
+        object.__setattr__(
+            self, "permission_mask", permissions_to_mask(self.permission_codes)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAuthUser:
+    user: AuthUser
+    refresh_at: float
+    load_s: float = 0.0
 
 
 @dataclass(frozen=True, slots=True)
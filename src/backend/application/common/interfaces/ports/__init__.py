@@ -3,6 +3,6 @@ from __future__ import annotations
 __all__: tuple[str, ...] = (
     "cache",
     "persistence",
+    "rate_limit",
     "serialization",
-    "shared_lock",
 )
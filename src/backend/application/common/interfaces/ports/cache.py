@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+
 
 class StrCache(Protocol):
     async def get(self: StrCache, key: str) -> str | None: ...
@@ -15,3 +22,31 @@ class StrCache(Protocol):
     async def increment(
         self: StrCache, key: str, *, delta: int = 1
     ) -> int: ...
+
+
+class BytesCache(Protocol):
+    async def get(self: BytesCache, key: str) -> bytes | None: ...
+
+    async def set(
+        self: BytesCache, key: str, value: bytes, *, ttl_s: int | None = None
+    ) -> None: ...
+
+    async def delete(self: BytesCache, key: str) -> None: ...
+
+
+class AuthUserCache(Protocol):
+    async def get(
+        self: AuthUserCache, user_id: UUID, *, shared_only: bool = False
+    ) -> CachedAuthUser | None: ...
+
+    async def set(
+        self: AuthUserCache, user: AuthUser, *, load_s: float = 0.0
+    ) -> None: ...
+
+    async def invalidate(self: AuthUserCache, user_id: UUID) -> None: ...
+
+
+class AuthCacheInvalidationBus(Protocol):
+    async def publish(
+        self: AuthCacheInvalidationBus, user_id: UUID
+    ) -> None: ...
@@ -18,3 +18,8 @@ class PersistenceGateway(Protocol):
     manager: TransactionManager
     users: UsersAdapter
     rbac: RbacAdapter
+
+
+@runtime_checkable
+class ReadPersistenceGateway(PersistenceGateway, Protocol):
+    """Gateway for read-mode handlers; may be backed by a replica."""
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
+from collections.abc import AsyncIterator, Awaitable
 from typing import Protocol
 
 from uuid_utils.compat import UUID
 
 from backend.application.common.exceptions.storage import StorageError
 from backend.application.handlers.result import Result
+from backend.domain.core.entities.user import User
 from backend.domain.core.types.rbac import (
     PermissionCode,
     RoleCode,
@@ -26,6 +27,21 @@ class RbacAdapter(Protocol):
         self: RbacAdapter, user_id: UUID, roles: set[RoleCode], /
     ) -> Awaitable[Result[None, StorageError]]: ...
 
+    def list_role_permissions(
+        self: RbacAdapter,
+    ) -> Awaitable[
+        Result[dict[RoleCode, set[PermissionCode]], StorageError]
+    ]: ...
+
     def list_user_ids_by_role(
-        self: RbacAdapter, role: RoleCode, /
+        self: RbacAdapter,
+        role: RoleCode,
+        /,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
     ) -> Awaitable[Result[list[UUID], StorageError]]: ...
+
+    def stream_users_by_role(
+        self: RbacAdapter, role: RoleCode, /, *, chunk_size: int
+    ) -> Awaitable[Result[AsyncIterator[list[User]], StorageError]]: ...
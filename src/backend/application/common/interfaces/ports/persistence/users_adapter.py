@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
+from dataclasses import dataclass
 from typing import Protocol
 
 from uuid_utils.compat import UUID
@@ -8,6 +9,33 @@ from uuid_utils.compat import UUID
 from backend.application.common.exceptions.storage import StorageError
 from backend.application.handlers.result import Result
 from backend.domain.core.entities.user import User
+from backend.domain.core.types.rbac import PermissionCode, RoleCode
+
+
+@dataclass(frozen=True, slots=True)
+class UserSummary:
+    id: UUID
+    email: str
+    login: str
+    username: str
+
+
+@dataclass(frozen=True, slots=True)
+class UserListFilter:
+    is_active: bool | None = None
+    role: RoleCode | None = None
+    email_prefix: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class UserPageKey:
+    # Carries both sort keys so a cursor stays valid under either order.
+    id: UUID
+    email: str
+
+    @classmethod
+    def of(cls: type[UserPageKey], user: UserSummary) -> UserPageKey:
+        return cls(id=user.id, email=user.email)
 
 
 class UsersAdapter(Protocol):
@@ -19,6 +47,27 @@ class UsersAdapter(Protocol):
         include_roles: bool = True,
     ) -> Awaitable[Result[User, StorageError]]: ...
 
+    def get_many_by_ids(
+        self: UsersAdapter,
+        user_ids: Sequence[UUID],
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Awaitable[Result[list[User], StorageError]]: ...
+
+    def list_page(
+        self: UsersAdapter,
+        filters: UserListFilter,
+        /,
+        *,
+        after: UserPageKey | None,
+        limit: int,
+    ) -> Awaitable[Result[list[UserSummary], StorageError]]: ...
+
+    def get_with_permissions(
+        self: UsersAdapter, user_id: UUID, /
+    ) -> Awaitable[Result[tuple[User, set[PermissionCode]], StorageError]]: ...
+
     def get_by_email(
         self: UsersAdapter,
         email: str,
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    key: str
+    limit: int
+    window_s: int
+
+
+class RateLimiter(Protocol):
+    # Counts one attempt against every limit, or none if any is exhausted.
+    # Returns the seconds to wait when rejected.
+    async def hit(
+        self: RateLimiter, limits: Sequence[RateLimit]
+    ) -> int | None: ...
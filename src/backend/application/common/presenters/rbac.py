@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 
 from uuid_utils.compat import UUID
 
@@ -8,8 +8,11 @@ from backend.application.common.dtos.rbac import (
     RoleAssignmentResultDTO,
     UserRolesResponseDTO,
     UsersByRoleResponseDTO,
+    UsersByRoleStreamDTO,
 )
 from backend.application.common.dtos.users import UserResponseDTO
+from backend.application.common.presenters.users import present_user_response
+from backend.domain.core.entities.user import User
 from backend.domain.core.types.rbac import (
     PermissionCode,
     RoleCode,
@@ -45,15 +48,41 @@ def present_user_roles(
 
 
 def present_users_by_role(
-    role: RoleCode, users: list[UserResponseDTO]
+    role: RoleCode,
+    users: list[UserResponseDTO],
+    *,
+    next_after: UUID | None = None,
 ) -> UsersByRoleResponseDTO:
-    return UsersByRoleResponseDTO(role=role, users=users)
+    return UsersByRoleResponseDTO(
+        role=role, users=users, next_after=next_after
+    )
 
 
 def present_users_by_role_from(
-    role: RoleCode, users: list[UserResponseDTO]
+    role: RoleCode,
+    users: list[UserResponseDTO],
+    *,
+    next_after: UUID | None = None,
 ) -> Callable[[object], UsersByRoleResponseDTO]:
     def presenter(_unused: object) -> UsersByRoleResponseDTO:
-        return present_users_by_role(role, users)
+        return present_users_by_role(role, users, next_after=next_after)
+
+    return presenter
+
+
+async def _present_user_chunks(
+    chunks: AsyncIterator[list[User]],
+) -> AsyncIterator[list[UserResponseDTO]]:
+    async for users in chunks:
+        yield [present_user_response(user) for user in users]
+
+
+def present_users_by_role_stream_from(
+    role: RoleCode,
+) -> Callable[[AsyncIterator[list[User]]], UsersByRoleStreamDTO]:
+    def presenter(chunks: AsyncIterator[list[User]]) -> UsersByRoleStreamDTO:
+        return UsersByRoleStreamDTO(
+            role=role, chunks=_present_user_chunks(chunks)
+        )
 
     return presenter
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 from backend.application.common.dtos.users import (
     UserResponseDTO,
+    UsersPageDTO,
     UserWithRolesDTO,
 )
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserPageKey,
+    UserSummary,
+)
 from backend.application.common.tools.response_mappings import (
     DEFAULT_RESPONSE_MAPPER,
 )
@@ -16,3 +21,15 @@ def present_user_response(user: User) -> UserResponseDTO:
 
 def present_user_with_roles(user: User) -> UserWithRolesDTO:
     return DEFAULT_RESPONSE_MAPPER.present(user, UserWithRolesDTO)
+
+
+def present_users_page(
+    users: list[UserSummary], *, next_after: UserPageKey | None = None
+) -> UsersPageDTO:
+    return UsersPageDTO(
+        users=[
+            DEFAULT_RESPONSE_MAPPER.present(user, UserResponseDTO)
+            for user in users
+        ],
+        next_after=next_after,
+    )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = (
     "auth_cache",
+    "auth_throttle",
     "permission_guard",
     "response_mapper",
     "response_mappings",
+    "role_permissions",
     "tx_result",
 )
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from dataclasses import dataclass
+from typing import Final
 
 from uuid_utils.compat import UUID
 
-from backend.application.common.interfaces.ports.cache import StrCache
+from backend.application.common.interfaces.ports.cache import (
+    AuthCacheInvalidationBus,
+    AuthUserCache,
+)
+
+AUTH_USER_PREFIX: Final[str] = "auth:user"
+AUTH_USER_INVALIDATION_CHANNEL: Final[str] = f"{AUTH_USER_PREFIX}:invalidate"
+
+
+def auth_user_key(user_id: UUID) -> str:
+    return f"{AUTH_USER_PREFIX}:{user_id}"
 
 
 @dataclass(slots=True)
 class AuthCacheInvalidator:
-    cache: StrCache
+    cache: AuthUserCache
+    bus: AuthCacheInvalidationBus
+    pin_primary: Callable[[UUID], Awaitable[None]] | None = None
 
     async def invalidate_user(self, user_id: UUID) -> None:
-        try:
-            await self.cache.delete(f"auth:user:{user_id}")
-        except Exception:
-            return
+        # Pin before evicting: the reload after the eviction must not come
+        # from a replica that has not seen the change yet.
+        if self.pin_primary is not None:
+            with suppress(Exception):
+                await self.pin_primary(user_id)
+        with suppress(Exception):
+            await self.cache.invalidate(user_id)
+        # Other workers drop their local copies when they see the message.
+        with suppress(Exception):
+            await self.bus.publish(user_id)
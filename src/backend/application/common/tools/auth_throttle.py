@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Final, Literal
+
+from backend.application.common.exceptions.application import (
+    TooManyRequestsError,
+)
+from backend.application.common.interfaces.ports.rate_limit import (
+    RateLimit,
+    RateLimiter,
+)
+
+AUTH_RATE_LIMIT_PREFIX: Final[str] = "auth:rl"
+
+_LOGGER = logging.getLogger(__name__)
+
+type AuthThrottleAction = Literal["login", "register"]
+
+
+def rate_limit_key(action: AuthThrottleAction, scope: str, value: str) -> str:
+    # Hashed so raw emails and IPs never end up in Redis key space.
+    digest = hashlib.sha256(value.encode()).hexdigest()[:32]
+    return f"{AUTH_RATE_LIMIT_PREFIX}:{action}:{scope}:{digest}"
+
+
+@dataclass(frozen=True, slots=True)
+class AuthThrottlePolicy:
+    window_s: int = 60
+    per_ip: int = 30
+    per_email: int = 10
+    per_fingerprint: int = 20
+
+
+@dataclass(slots=True)
+class AuthThrottle:
+    limiter: RateLimiter
+    policy: AuthThrottlePolicy
+
+    async def check(
+        self: AuthThrottle,
+        action: AuthThrottleAction,
+        *,
+        client_ip: str | None,
+        email: str,
+        fingerprint: str,
+    ) -> None:
+        window_s = self.policy.window_s
+        limits = [
+            RateLimit(
+                key=rate_limit_key(action, "email", email.strip().casefold()),
+                limit=self.policy.per_email,
+                window_s=window_s,
+            ),
+            RateLimit(
+                key=rate_limit_key(action, "fp", fingerprint),
+                limit=self.policy.per_fingerprint,
+                window_s=window_s,
+            ),
+        ]
+        if client_ip:
+            limits.append(
+                RateLimit(
+                    key=rate_limit_key(action, "ip", client_ip),
+                    limit=self.policy.per_ip,
+                    window_s=window_s,
+                )
+            )
+        try:
+            retry_after_s = await self.limiter.hit(limits)
+        except Exception:
+            # Fail open: the limiter guards CPU, it must not gate logins.
+            _LOGGER.warning("Auth rate limiter unavailable", exc_info=True)
+            return
+        if retry_after_s is not None:
+            raise TooManyRequestsError(retry_after_s=retry_after_s)
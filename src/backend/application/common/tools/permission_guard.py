@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from backend.application.common.exceptions.application import (
     AuthorizationError,
 )
+from backend.application.common.interfaces.auth.ports import has_permission
 from backend.application.common.interfaces.auth.types import AuthUser
 from backend.domain.core.types.rbac import (
     PermissionCode,
@@ -16,7 +17,7 @@ class PermissionGuard:
     async def require(self, user: AuthUser, code: PermissionCode) -> None:
         if user.is_superuser:
             return
-        if code not in user.permission_codes:
+        if not has_permission(user.permission_mask, code):
             raise AuthorizationError(
                 f"Access denied by policy for {code.value}"
             )
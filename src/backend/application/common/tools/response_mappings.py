@@ -4,6 +4,9 @@ from backend.application.common.dtos.users import (
     UserResponseDTO,
     UserWithRolesDTO,
 )
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserSummary,
+)
 from backend.application.common.tools.response_mapper import ResponseMapper
 from backend.domain.core.entities.user import User
 
@@ -17,6 +20,15 @@ def _user_to_response_dto(user: User) -> UserResponseDTO:
     )
 
 
+def _summary_to_response_dto(summary: UserSummary) -> UserResponseDTO:
+    return UserResponseDTO(
+        id=summary.id,
+        email=summary.email,
+        login=summary.login,
+        username=summary.username,
+    )
+
+
 def _user_to_with_roles_dto(user: User) -> UserWithRolesDTO:
     roles = list(user.roles)
     return UserWithRolesDTO(
@@ -33,6 +45,7 @@ def build_response_mapper() -> ResponseMapper:
     mapper = ResponseMapper()
     mapper.register(User, UserResponseDTO, _user_to_response_dto)
     mapper.register(User, UserWithRolesDTO, _user_to_with_roles_dto)
+    mapper.register(UserSummary, UserResponseDTO, _summary_to_response_dto)
     return mapper
 
 
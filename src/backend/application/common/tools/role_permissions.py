@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+from backend.domain.core.types.rbac import PermissionCode, RoleCode
+
+
+class RolePermissionIndex:
+    """Process-wide role -> permission map, swapped whole on reload."""
+
+    __slots__: tuple[str, ...] = ("_permissions", "version")
+
+    def __init__(self: RolePermissionIndex) -> None:
+        self._permissions: Mapping[RoleCode, frozenset[PermissionCode]] = {}
+        self.version = 0
+
+    @property
+    def loaded(self: RolePermissionIndex) -> bool:
+        return self.version > 0
+
+    def replace(
+        self: RolePermissionIndex,
+        permissions: Mapping[RoleCode, Iterable[PermissionCode]],
+    ) -> None:
+        self._permissions = {
+            role: frozenset(codes) for role, codes in permissions.items()
+        }
+        self.version += 1
+
+    def resolve(
+        self: RolePermissionIndex, roles: Iterable[RoleCode]
+    ) -> frozenset[PermissionCode] | None:
+        """Union of role permissions, or None if any role is unknown."""
+        resolved: set[PermissionCode] = set()
+        for role in roles:
+            codes = self._permissions.get(role)
+            if codes is None:
+                return None
+            resolved |= codes
+        return frozenset(resolved)
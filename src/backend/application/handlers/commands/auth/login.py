@@ -15,6 +15,7 @@ from backend.application.common.exceptions.error_mappers.storage import (
 from backend.application.common.exceptions.storage import NotFoundStorageError
 from backend.application.common.interfaces.auth.ports import (
     JwtIssuer,
+    PasswordRehashScheduler,
 )
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
@@ -41,6 +42,7 @@ class LoginUserHandler(CommandHandler[LoginUserCommand, TokenPairDTO]):
     password_hasher: PasswordHasherPort
     jwt_issuer: JwtIssuer
     refresh_tokens: RefreshTokenService
+    password_rehash: PasswordRehashScheduler | None = None
 
     async def __call__(
         self: LoginUserHandler,
@@ -94,6 +96,15 @@ class LoginUserHandler(CommandHandler[LoginUserCommand, TokenPairDTO]):
         if rotate_result.is_err():
             return ResultImpl.err_from(rotate_result)
 
+        if self.password_rehash is not None and (
+            await self.password_hasher.needs_rehash(user.password)
+        ):
+            self.password_rehash.schedule(
+                user_id=user_id,
+                raw_password=cmd.raw_password,
+                current_hash=user.password,
+            )
+
         return ResultImpl.ok(
             TokenPairDTO(
                 access_token=access_token,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from backend.application.common.dtos.auth import (
+    RegisteredUserDTO,
     RegisterUserDTO,
-    TokenPairDTO,
 )
 from backend.application.common.exceptions.application import AppError
 from backend.application.common.exceptions.error_mappers.auth import (
@@ -34,7 +34,9 @@ class RegisterUserCommand(RegisterUserDTO): ...
 
 
 @handler(mode="write")
-class RegisterUserHandler(CommandHandler[RegisterUserCommand, TokenPairDTO]):
+class RegisterUserHandler(
+    CommandHandler[RegisterUserCommand, RegisteredUserDTO]
+):
     gateway: PersistenceGateway
     password_hasher: PasswordHasherPort
     default_registration_role: RoleCode
@@ -45,7 +47,7 @@ class RegisterUserHandler(CommandHandler[RegisterUserCommand, TokenPairDTO]):
         self: RegisterUserHandler,
         cmd: RegisterUserCommand,
         /,
-    ) -> Result[TokenPairDTO, AppError]:
+    ) -> Result[RegisteredUserDTO, AppError]:
         create_handler = CreateUserHandler(
             gateway=self.gateway,
             password_hasher=self.password_hasher,
@@ -59,7 +61,7 @@ class RegisterUserHandler(CommandHandler[RegisterUserCommand, TokenPairDTO]):
         )
         create_result = await create_handler(create_cmd)
         if create_result.is_err():
-            return ResultImpl.err_from(create_result, TokenPairDTO)
+            return ResultImpl.err_from(create_result, RegisteredUserDTO)
 
         user = create_result.unwrap()
         access_token = self.jwt_issuer.issue_access(user_id=user.id)
@@ -77,12 +79,13 @@ class RegisterUserHandler(CommandHandler[RegisterUserCommand, TokenPairDTO]):
             map_refresh_replay(),
         )
         if rotate_result.is_err():
-            return ResultImpl.err_from(rotate_result, TokenPairDTO)
+            return ResultImpl.err_from(rotate_result, RegisteredUserDTO)
 
         return ResultImpl.ok(
-            TokenPairDTO(
+            RegisteredUserDTO(
                 access_token=access_token,
                 refresh_token=refresh_token,
+                user_id=user.id,
             ),
             AppError,
         )
@@ -1,3 +1,7 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("get_user_roles", "get_users_by_role")
+__all__: tuple[str, ...] = (
+    "get_user_roles",
+    "get_users_by_role",
+    "stream_users_by_role",
+)
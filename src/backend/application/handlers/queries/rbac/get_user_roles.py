@@ -31,24 +31,18 @@ class GetUserRolesHandler(
         query: GetUserRolesQuery,
         /,
     ) -> Result[UserRolesResponseDTO, AppError]:
-        user_result = (
-            await self.gateway.users.get_by_id(query.user_id)
+        access_result = (
+            await self.gateway.users.get_with_permissions(query.user_id)
         ).map_err(map_storage_error_to_app())
-        if user_result.is_err():
-            return ResultImpl.err_from(user_result)
-        user = user_result.unwrap()
-
-        permissions_result = (
-            await self.gateway.rbac.get_user_permission_codes(query.user_id)
-        ).map_err(map_storage_error_to_app())
-        if permissions_result.is_err():
-            return ResultImpl.err_from(permissions_result)
+        if access_result.is_err():
+            return ResultImpl.err_from(access_result)
+        user, permission_codes = access_result.unwrap()
 
         return ResultImpl.ok(
             present_user_roles(
                 user_id=user.id,
                 roles=frozenset(user.roles),
-                permissions=frozenset(permissions_result.unwrap()),
+                permissions=frozenset(permission_codes),
             ),
             AppError,
         )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from uuid_utils.compat import UUID
+
 from backend.application.common.dtos.rbac import (
     GetUsersByRoleDTO,
     UsersByRoleResponseDTO,
@@ -37,20 +39,33 @@ class GetUsersByRoleHandler(
         /,
     ) -> Result[UsersByRoleResponseDTO, AppError]:
         role: RoleCode = query.role
+        # One extra id tells whether another page exists without a COUNT.
+        fetch = None if query.limit is None else query.limit + 1
         ids_result = (
-            await self.gateway.rbac.list_user_ids_by_role(role)
+            await self.gateway.rbac.list_user_ids_by_role(
+                role, after=query.after, limit=fetch
+            )
         ).map_err(map_storage_error_to_app())
         if ids_result.is_err():
             return ResultImpl.err_from(ids_result)
+        user_ids = ids_result.unwrap()
+        next_after: UUID | None = None
+        if query.limit is not None and len(user_ids) > query.limit:
+            user_ids = user_ids[: query.limit]
+            next_after = user_ids[-1]
 
-        users: list[UserResponseDTO] = []
-        for user_id in ids_result.unwrap():
-            user_result = (
-                await self.gateway.users.get_by_id(user_id)
-            ).map_err(map_storage_error_to_app())
-            if user_result.is_err():
-                return ResultImpl.err_from(user_result)
-            users.append(present_user_response(user_result.unwrap()))
+        users_result = (
+            await self.gateway.users.get_many_by_ids(
+                user_ids, include_roles=False
+            )
+        ).map_err(map_storage_error_to_app())
+        if users_result.is_err():
+            return ResultImpl.err_from(users_result)
+        users: list[UserResponseDTO] = [
+            present_user_response(user) for user in users_result.unwrap()
+        ]
 
-        presenter = present_users_by_role_from(role, users)
+        presenter = present_users_by_role_from(
+            role, users, next_after=next_after
+        )
         return ids_result.map(presenter)
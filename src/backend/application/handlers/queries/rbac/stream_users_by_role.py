@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from backend.application.common.dtos.rbac import (
+    StreamUsersByRoleDTO,
+    UsersByRoleStreamDTO,
+)
+from backend.application.common.exceptions.application import AppError
+from backend.application.common.exceptions.error_mappers.storage import (
+    map_storage_error_to_app,
+)
+from backend.application.common.interfaces.ports.persistence.gateway import (
+    PersistenceGateway,
+)
+from backend.application.common.presenters.rbac import (
+    present_users_by_role_stream_from,
+)
+from backend.application.handlers.base import QueryHandler
+from backend.application.handlers.result import Result
+from backend.application.handlers.transform import handler
+
+
+class StreamUsersByRoleQuery(StreamUsersByRoleDTO): ...
+
+
+@handler(mode="read")
+class StreamUsersByRoleHandler(
+    QueryHandler[StreamUsersByRoleQuery, UsersByRoleStreamDTO]
+):
+    gateway: PersistenceGateway
+
+    async def __call__(
+        self: StreamUsersByRoleHandler,
+        query: StreamUsersByRoleQuery,
+        /,
+    ) -> Result[UsersByRoleStreamDTO, AppError]:
+        return (
+            (
+                await self.gateway.rbac.stream_users_by_role(
+                    query.role, chunk_size=query.chunk_size
+                )
+            )
+            .map_err(map_storage_error_to_app())
+            .map(present_users_by_role_stream_from(query.role))
+        )
@@ -1,3 +1,3 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("get_user", "get_user_with_roles")
+__all__: tuple[str, ...] = ("get_user", "get_user_with_roles", "list_users")
@@ -30,21 +30,15 @@ class GetUserWithRolesHandler(
         query: GetUserWithRolesQuery,
         /,
     ) -> Result[UserWithRolesDTO, AppError]:
-        user_result = (
-            await self.gateway.users.get_by_id(query.user_id)
+        access_result = (
+            await self.gateway.users.get_with_permissions(query.user_id)
         ).map_err(map_storage_error_to_app())
-        if user_result.is_err():
-            return ResultImpl.err_from(user_result)
-        user = user_result.unwrap()
-
-        permissions_result = (
-            await self.gateway.rbac.get_user_permission_codes(query.user_id)
-        ).map_err(map_storage_error_to_app())
-        if permissions_result.is_err():
-            return ResultImpl.err_from(permissions_result)
+        if access_result.is_err():
+            return ResultImpl.err_from(access_result)
+        user, permission_codes = access_result.unwrap()
 
         permissions = sorted(
-            permission.value for permission in permissions_result.unwrap()
+            permission.value for permission in permission_codes
         )
         roles = sorted(user.roles)
         return ResultImpl.ok(
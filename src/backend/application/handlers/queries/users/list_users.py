@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from backend.application.common.dtos.users import ListUsersDTO, UsersPageDTO
+from backend.application.common.exceptions.application import AppError
+from backend.application.common.exceptions.error_mappers.storage import (
+    map_storage_error_to_app,
+)
+from backend.application.common.interfaces.ports.persistence.gateway import (
+    PersistenceGateway,
+)
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserListFilter,
+    UserPageKey,
+)
+from backend.application.common.presenters.users import present_users_page
+from backend.application.handlers.base import QueryHandler
+from backend.application.handlers.result import Result, ResultImpl
+from backend.application.handlers.transform import handler
+
+
+class ListUsersQuery(ListUsersDTO): ...
+
+
+@handler(mode="read")
+class ListUsersHandler(QueryHandler[ListUsersQuery, UsersPageDTO]):
+    gateway: PersistenceGateway
+
+    async def __call__(
+        self: ListUsersHandler, query: ListUsersQuery, /
+    ) -> Result[UsersPageDTO, AppError]:
+        filters = UserListFilter(
+            is_active=query.is_active,
+            role=query.role,
+            email_prefix=query.email_prefix,
+        )
+        # One extra row tells whether another page exists without a COUNT.
+        page_result = (
+            await self.gateway.users.list_page(
+                filters, after=query.after, limit=query.limit + 1
+            )
+        ).map_err(map_storage_error_to_app())
+        if page_result.is_err():
+            return ResultImpl.err_from(page_result)
+        users = page_result.unwrap()
+        next_after: UserPageKey | None = None
+        if len(users) > query.limit:
+            users = users[: query.limit]
+            next_after = UserPageKey.of(users[-1])
+
+        return ResultImpl.ok(present_users_page(users, next_after=next_after))
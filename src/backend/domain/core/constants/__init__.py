@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 __all__: tuple[str, ...] = (
+    "permission_codes",
     "rbac",
     "rbac_registry",
 )
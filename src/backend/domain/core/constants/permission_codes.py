@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
+from backend.domain.core.types.rbac import PermissionCode
+
+ALL_PERMISSION_CODES: Final[frozenset[PermissionCode]] = frozenset(
+    PermissionCode
+)
+
+# Bit positions are persisted in cached auth payloads: append new codes,
+# never renumber or reuse a retired index.
+PERMISSION_BIT_INDEX: Final[Mapping[PermissionCode, int]] = MappingProxyType(
+    {
+        PermissionCode.USERS_READ: 0,
+        PermissionCode.USERS_CREATE: 1,
+        PermissionCode.USERS_UPDATE: 2,
+        PermissionCode.USERS_DELETE: 3,
+        PermissionCode.RBAC_READ_ROLES: 4,
+        PermissionCode.RBAC_ASSIGN_ROLE: 5,
+        PermissionCode.RBAC_REVOKE_ROLE: 6,
+        PermissionCode.SYSTEM_READ: 7,
+    }
+)
+PERMISSION_BITS: Final[Mapping[PermissionCode, int]] = MappingProxyType(
+    {code: 1 << index for code, index in PERMISSION_BIT_INDEX.items()}
+)
+ALL_PERMISSIONS_MASK: Final[int] = sum(PERMISSION_BITS.values())
+
+
+def permission_bit(code: PermissionCode) -> int:
+    return PERMISSION_BITS[code]
+
+
+def permissions_to_mask(codes: Iterable[PermissionCode]) -> int:
+    mask = 0
+    for code in codes:
+        mask |= PERMISSION_BITS[code]
+    return mask
+
+
+@lru_cache(maxsize=256)
+def mask_to_permissions(mask: int) -> frozenset[PermissionCode]:
+    if mask & ~ALL_PERMISSIONS_MASK:
+        raise ValueError(f"Unknown permission bits in mask {mask:#x}")
+    return frozenset(
+        code for code, bit in PERMISSION_BITS.items() if mask & bit
+    )
@@ -17,6 +17,7 @@ ADMIN_PERMISSIONS: Final[frozenset[PermissionCode]] = frozenset(
         PermissionCode.RBAC_READ_ROLES,
         PermissionCode.RBAC_ASSIGN_ROLE,
         PermissionCode.RBAC_REVOKE_ROLE,
+        PermissionCode.SYSTEM_READ,
     }
 )
 SUPER_ADMIN_PERMISSIONS: Final[frozenset[PermissionCode]] = ADMIN_PERMISSIONS
@@ -14,6 +14,7 @@ class PermissionCode(Enum):
     RBAC_READ_ROLES = "rbac:read_roles"
     RBAC_ASSIGN_ROLE = "rbac:assign_role"
     RBAC_REVOKE_ROLE = "rbac:revoke_role"
+    SYSTEM_READ = "system:read"
 
 
 __all__: tuple[str, ...] = (
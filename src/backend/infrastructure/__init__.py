@@ -2,8 +2,8 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = (
     "errors",
-    "lock",
     "persistence",
+    "rate_limit",
     "security",
     "tools",
 )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 from uuid_utils.compat import UUID
@@ -9,6 +10,7 @@ from backend.application.common.interfaces.ports.persistence.rbac_adapter import
     RbacAdapter,
 )
 from backend.application.handlers.result import Result
+from backend.domain.core.entities.user import User
 from backend.domain.core.types.rbac import (
     PermissionCode,
     RoleCode,
@@ -16,14 +18,19 @@ from backend.domain.core.types.rbac import (
 from backend.infrastructure.persistence.adapters.base import UnboundAdapter
 from backend.infrastructure.persistence.mappers.users import (
     role_records_to_set,
+    row_record_to_user,
 )
 from backend.infrastructure.persistence.rawadapter.rbac import (
     q_get_role_ids_by_codes,
     q_get_user_permission_codes,
     q_get_user_role_codes,
+    q_list_role_permissions,
     q_list_user_ids_by_role_id,
     q_replace_user_roles,
 )
+from backend.infrastructure.persistence.rawadapter.users import (
+    q_stream_user_rows_by_role_id,
+)
 from backend.infrastructure.persistence.records import UserRoleCodeRecord
 from backend.infrastructure.tools.storage_result import storage_result
 
@@ -82,17 +89,64 @@ class SqlRbacAdapter(UnboundAdapter, RbacAdapter):
 
         return await storage_result(_call)
 
+    async def list_role_permissions(
+        self: SqlRbacAdapter,
+    ) -> Result[dict[RoleCode, set[PermissionCode]], StorageError]:
+        async def _call() -> dict[RoleCode, set[PermissionCode]]:
+            rows = await self.manager.send(q_list_role_permissions())
+            return {
+                row.role: {
+                    PermissionCode(code) for code in row.permission_codes
+                }
+                for row in rows
+            }
+
+        return await storage_result(_call)
+
+    async def _role_id(self: SqlRbacAdapter, role: RoleCode) -> UUID:
+        pairs = await self.manager.send(q_get_role_ids_by_codes([role]))
+        if not pairs:
+            raise StorageError(
+                code="rbac.seed_mismatch",
+                message="RBAC roles are missing in DB (seed mismatch)",
+            )
+        return pairs[0][1]
+
     async def list_user_ids_by_role(
-        self: SqlRbacAdapter, role: RoleCode
+        self: SqlRbacAdapter,
+        role: RoleCode,
+        /,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
     ) -> Result[list[UUID], StorageError]:
         async def _call() -> list[UUID]:
-            pairs = await self.manager.send(q_get_role_ids_by_codes([role]))
-            if not pairs:
-                raise StorageError(
-                    code="rbac.seed_mismatch",
-                    message="RBAC roles are missing in DB (seed mismatch)",
-                )
-            role_id = pairs[0][1]
-            return await self.manager.send(q_list_user_ids_by_role_id(role_id))
+            role_id = await self._role_id(role)
+            return await self.manager.send(
+                q_list_user_ids_by_role_id(role_id, after=after, limit=limit)
+            )
+
+        return await storage_result(_call)
+
+    async def stream_users_by_role(
+        self: SqlRbacAdapter, role: RoleCode, /, *, chunk_size: int
+    ) -> Result[AsyncIterator[list[User]], StorageError]:
+        """Yield members in ``user_id`` order, ``chunk_size`` at a time.
+
+        Only opening the cursor is reported through the result; a failure
+        mid-stream propagates from the iterator itself.
+        """
+
+        async def _call() -> AsyncIterator[list[User]]:
+            role_id = await self._role_id(role)
+            chunks = await self.manager.send(
+                q_stream_user_rows_by_role_id(role_id, chunk_size=chunk_size)
+            )
+
+            async def _users() -> AsyncIterator[list[User]]:
+                async for rows in chunks:
+                    yield [row_record_to_user(row) for row in rows]
+
+            return _users()
 
         return await storage_result(_call)
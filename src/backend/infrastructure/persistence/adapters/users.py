@@ -1,32 +1,44 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 
 from uuid_utils.compat import UUID
 
 from backend.application.common.exceptions.storage import StorageError
 from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserListFilter,
+    UserPageKey,
     UsersAdapter,
+    UserSummary,
 )
 from backend.application.handlers.result import Result
 from backend.domain.core.entities.user import User
-from backend.domain.core.types.rbac import RoleCode
+from backend.domain.core.types.rbac import PermissionCode, RoleCode
 from backend.infrastructure.persistence.adapters.base import UnboundAdapter
 from backend.infrastructure.persistence.mappers.users import (
+    access_record_to_user,
     role_records_to_set,
+    roles_record_to_user,
     row_record_to_user,
+    row_records_to_users,
+    summary_record_to_summary,
     user_to_row_record,
 )
 from backend.infrastructure.persistence.rawadapter.rbac import (
+    q_get_role_codes_by_user_ids,
     q_get_user_role_codes,
 )
 from backend.infrastructure.persistence.rawadapter.users import (
     q_delete_user,
+    q_get_user_access_by_id,
     q_get_user_row_by_email,
     q_get_user_row_by_id,
+    q_get_user_rows_by_ids,
+    q_get_user_with_roles_by_email,
+    q_get_user_with_roles_by_id,
+    q_list_user_summaries,
     q_upsert_user_row,
 )
-from backend.infrastructure.persistence.records import UserRowRecord
 from backend.infrastructure.tools.storage_result import storage_result
 
 
@@ -35,22 +47,15 @@ class SqlUsersAdapter(UnboundAdapter, UsersAdapter):
 
     async def _fetch_user(
         self: SqlUsersAdapter,
-        fetch_row: Callable[[], Awaitable[UserRowRecord | None]],
-        *,
-        include_roles: bool,
+        fetch_user: Callable[[], Awaitable[User | None]],
     ) -> User:
-        rec = await fetch_row()
-        rec = self.require_found(
-            rec,
+        user = await fetch_user()
+        return self.require_found(
+            user,
             code="user.not_found",
             message="User not found",
             detail="not found",
         )
-        roles: set[RoleCode] = set()
-        if include_roles:
-            role_rows = await self.manager.send(q_get_user_role_codes(rec.id))
-            roles = role_records_to_set(role_rows)
-        return row_record_to_user(rec, roles=roles)
 
     async def get_by_id(
         self: SqlUsersAdapter,
@@ -60,13 +65,78 @@ class SqlUsersAdapter(UnboundAdapter, UsersAdapter):
         include_roles: bool = True,
     ) -> Result[User, StorageError]:
         async def _call() -> User:
-            async def fetch_row() -> UserRowRecord | None:
-                return await self.manager.send(q_get_user_row_by_id(user_id))
+            async def fetch_user() -> User | None:
+                if include_roles:
+                    rec = await self.manager.send(
+                        q_get_user_with_roles_by_id(user_id)
+                    )
+                    return None if rec is None else roles_record_to_user(rec)
+                row = await self.manager.send(q_get_user_row_by_id(user_id))
+                return None if row is None else row_record_to_user(row)
+
+            return await self._fetch_user(fetch_user)
+
+        return await storage_result(_call)
+
+    async def get_many_by_ids(
+        self: SqlUsersAdapter,
+        user_ids: Sequence[UUID],
+        /,
+        *,
+        include_roles: bool = True,
+    ) -> Result[list[User], StorageError]:
+        """Load users in the order of ``user_ids``; unknown ids are skipped."""
+
+        async def _call() -> list[User]:
+            ids = list(dict.fromkeys(user_ids))
+            rows = await self.manager.send(q_get_user_rows_by_ids(ids))
+            role_rows = (
+                await self.manager.send(q_get_role_codes_by_user_ids(ids))
+                if include_roles and rows
+                else None
+            )
+            by_id = {
+                user.id: user for user in row_records_to_users(rows, role_rows)
+            }
+            return [by_id[user_id] for user_id in ids if user_id in by_id]
+
+        return await storage_result(_call)
 
-            return await self._fetch_user(
-                fetch_row,
-                include_roles=include_roles,
+    async def list_page(
+        self: SqlUsersAdapter,
+        filters: UserListFilter,
+        /,
+        *,
+        after: UserPageKey | None,
+        limit: int,
+    ) -> Result[list[UserSummary], StorageError]:
+        async def _call() -> list[UserSummary]:
+            rows = await self.manager.send(
+                q_list_user_summaries(
+                    limit=limit,
+                    after_id=None if after is None else after.id,
+                    after_email=None if after is None else after.email,
+                    is_active=filters.is_active,
+                    role=filters.role,
+                    email_prefix=filters.email_prefix,
+                )
             )
+            return [summary_record_to_summary(row) for row in rows]
+
+        return await storage_result(_call)
+
+    async def get_with_permissions(
+        self: SqlUsersAdapter, user_id: UUID, /
+    ) -> Result[tuple[User, set[PermissionCode]], StorageError]:
+        async def _call() -> tuple[User, set[PermissionCode]]:
+            rec = await self.manager.send(q_get_user_access_by_id(user_id))
+            rec = self.require_found(
+                rec,
+                code="user.not_found",
+                message="User not found",
+                detail="not found",
+            )
+            return access_record_to_user(rec)
 
         return await storage_result(_call)
 
@@ -78,13 +148,16 @@ class SqlUsersAdapter(UnboundAdapter, UsersAdapter):
         include_roles: bool = True,
     ) -> Result[User, StorageError]:
         async def _call() -> User:
-            async def fetch_row() -> UserRowRecord | None:
-                return await self.manager.send(q_get_user_row_by_email(email))
-
-            return await self._fetch_user(
-                fetch_row,
-                include_roles=include_roles,
-            )
+            async def fetch_user() -> User | None:
+                if include_roles:
+                    rec = await self.manager.send(
+                        q_get_user_with_roles_by_email(email)
+                    )
+                    return None if rec is None else roles_record_to_user(rec)
+                row = await self.manager.send(q_get_user_row_by_email(email))
+                return None if row is None else row_record_to_user(row)
+
+            return await self._fetch_user(fetch_user)
 
         return await storage_result(_call)
 
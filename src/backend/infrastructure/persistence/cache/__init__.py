@@ -1,3 +1,3 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("redis",)
+__all__: tuple[str, ...] = ("local", "redis", "redis_pubsub")
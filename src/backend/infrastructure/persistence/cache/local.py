@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self: CacheStats) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+@dataclass(frozen=True, slots=True)
+class LocalCacheSnapshot:
+    entries: int
+    weight: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_rate: float
+
+
+@dataclass(slots=True)
+class _Entry[V]:
+    value: V
+    expires_at: float
+    weight: int
+
+
+class LocalTTLCache[K: Hashable, V]:
+    """In-process LRU with TTL, bounded by entry count and summed weight."""
+
+    __slots__: tuple[str, ...] = (
+        "_clock",
+        "_entries",
+        "_max_entries",
+        "_max_weight",
+        "_ttl_s",
+        "_weight",
+        "stats",
+    )
+
+    def __init__(
+        self: LocalTTLCache[K, V],
+        *,
+        max_entries: int,
+        max_weight: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0 or max_weight <= 0:
+            raise ValueError("Local cache limits must be positive")
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_weight = max_weight
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._weight = 0
+        self.stats = CacheStats()
+
+    def __len__(self: LocalTTLCache[K, V]) -> int:
+        return len(self._entries)
+
+    @property
+    def weight(self: LocalTTLCache[K, V]) -> int:
+        return self._weight
+
+    def snapshot(self: LocalTTLCache[K, V]) -> LocalCacheSnapshot:
+        stats = self.stats
+        return LocalCacheSnapshot(
+            entries=len(self._entries),
+            weight=self._weight,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            hit_rate=stats.hit_rate,
+        )
+
+    def get(self: LocalTTLCache[K, V], key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(key, entry)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(
+        self: LocalTTLCache[K, V],
+        key: K,
+        value: V,
+        *,
+        weight: int = 1,
+        ttl_s: float | None = None,
+    ) -> None:
+        if weight > self._max_weight:
+            self.delete(key)
+            return
+        ttl = self._ttl_s if ttl_s is None else min(ttl_s, self._ttl_s)
+        if ttl <= 0:
+            self.delete(key)
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._weight -= previous.weight
+        self._entries[key] = _Entry(
+            value=value, expires_at=self._clock() + ttl, weight=weight
+        )
+        self._weight += weight
+        self._evict()
+
+    def delete(self: LocalTTLCache[K, V], key: K) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._drop(key, entry)
+
+    def clear(self: LocalTTLCache[K, V]) -> None:
+        self._entries.clear()
+        self._weight = 0
+
+    def _drop(self: LocalTTLCache[K, V], key: K, entry: _Entry[V]) -> None:
+        del self._entries[key]
+        self._weight -= entry.weight
+
+    def _evict(self: LocalTTLCache[K, V]) -> None:
+        while (
+            len(self._entries) > self._max_entries
+            or self._weight > self._max_weight
+        ):
+            _key, entry = self._entries.popitem(last=False)
+            self._weight -= entry.weight
+            self.stats.evictions += 1
@@ -4,7 +4,10 @@ from dataclasses import dataclass
 
 from redis.asyncio import Redis
 
-from backend.application.common.interfaces.ports.cache import StrCache
+from backend.application.common.interfaces.ports.cache import (
+    BytesCache,
+    StrCache,
+)
 
 
 @dataclass(slots=True)
@@ -31,3 +34,26 @@ class RedisCache(StrCache):
 
     async def increment(self: RedisCache, key: str, *, delta: int = 1) -> int:
         return int(await self.client.incrby(key, delta))
+
+
+@dataclass(slots=True)
+class RedisBytesCache(BytesCache):
+    client: Redis
+
+    async def get(self: RedisBytesCache, key: str) -> bytes | None:
+        value = await self.client.get(key)
+        if value is None or isinstance(value, bytes):
+            return value
+        raise TypeError(f"Unexpected cache value type: {type(value).__name__}")
+
+    async def set(
+        self: RedisBytesCache,
+        key: str,
+        value: bytes,
+        *,
+        ttl_s: int | None = None,
+    ) -> None:
+        await self.client.set(key, value, ex=ttl_s)
+
+    async def delete(self: RedisBytesCache, key: str) -> None:
+        await self.client.delete(key)
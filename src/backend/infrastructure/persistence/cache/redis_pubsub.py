@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.ports.cache import (
+    AuthCacheInvalidationBus,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_RECONNECT_DELAY_S: float = 1.0
+_MAX_RECONNECT_DELAY_S: float = 30.0
+
+
+def _parse_user_id(data: object) -> UUID | None:
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    if not isinstance(data, str):
+        return None
+    try:
+        return UUID(data)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class RedisInvalidationBus(AuthCacheInvalidationBus):
+    client: Redis
+    channel: str
+
+    async def publish(self: RedisInvalidationBus, user_id: UUID) -> None:
+        await self.client.publish(self.channel, str(user_id))
+
+    async def listen(
+        self: RedisInvalidationBus,
+        *,
+        on_invalidate: Callable[[UUID], None],
+        on_reset: Callable[[], None],
+    ) -> None:
+        delay = _RECONNECT_DELAY_S
+        while True:
+            try:
+                async with self.client.pubsub(
+                    ignore_subscribe_messages=True
+                ) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Messages published while we were not subscribed are
+                    # lost, so local state cannot be trusted after that.
+                    on_reset()
+                    delay = _RECONNECT_DELAY_S
+                    async for message in pubsub.listen():
+                        user_id = _parse_user_id(message.get("data"))
+                        if user_id is None:
+                            _LOGGER.warning(
+                                "Ignoring malformed invalidation message: %r",
+                                message,
+                            )
+                            continue
+                        on_invalidate(user_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception(
+                    "Invalidation subscriber failed, retrying in %.1fs", delay
+                )
+                on_reset()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RECONNECT_DELAY_S)
+
+
+@dataclass(slots=True)
+class RedisReloadSignal:
+    """Channel whose messages, of any payload, ask every process to reload."""
+
+    client: Redis
+    channel: str
+
+    async def publish(self: RedisReloadSignal) -> None:
+        await self.client.publish(self.channel, "reload")
+
+    async def listen(
+        self: RedisReloadSignal, *, on_reload: Callable[[], Awaitable[object]]
+    ) -> None:
+        delay = _RECONNECT_DELAY_S
+        missed = False
+        while True:
+            try:
+                async with self.client.pubsub(
+                    ignore_subscribe_messages=True
+                ) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    delay = _RECONNECT_DELAY_S
+                    if missed:
+                        # A signal may have come while we were away.
+                        missed = False
+                        await on_reload()
+                    async for _message in pubsub.listen():
+                        await on_reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception(
+                    "Reload subscriber failed, retrying in %.1fs", delay
+                )
+                missed = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RECONNECT_DELAY_S)
@@ -11,6 +11,10 @@ from backend.application.common.interfaces.ports.persistence.manager import (
     TransactionManager,
     TransactionScope,
 )
+from backend.infrastructure.persistence.sqlalchemy.raw_driver import (
+    DriverQuery,
+    run_on_driver,
+)
 
 
 class _NoopTxScope(AbstractAsyncContextManager["TransactionManagerImpl"]):
@@ -32,13 +36,17 @@ class _NoopTxScope(AbstractAsyncContextManager["TransactionManagerImpl"]):
 
 
 class _TxScope(AbstractAsyncContextManager["TransactionManagerImpl"]):
-    __slots__: tuple[str, ...] = ("_tm", "_tx")
+    __slots__: tuple[str, ...] = ("_on_commit", "_tm", "_tx")
 
     def __init__(
-        self: _TxScope, tm: TransactionManagerImpl, tx: AsyncSessionTransaction
+        self: _TxScope,
+        tm: TransactionManagerImpl,
+        tx: AsyncSessionTransaction,
+        on_commit: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         self._tm = tm
         self._tx = tx
+        self._on_commit = on_commit
 
     async def __aenter__(self: _TxScope) -> TransactionManagerImpl:
         await self._tx.__aenter__()
@@ -51,15 +59,70 @@ class _TxScope(AbstractAsyncContextManager["TransactionManagerImpl"]):
         traceback: TracebackType | None,
     ) -> None:
         await self._tx.__aexit__(exc_type, exc_value, traceback)
+        if exc_type is None and self._on_commit is not None:
+            await self._on_commit()
 
 
 class TransactionManagerImpl(TransactionManager):
-    __slots__: tuple[str, ...] = ("conn",)
+    __slots__: tuple[str, ...] = (
+        "_conn",
+        "_on_commit",
+        "_raw_driver",
+        "_session_factory",
+    )
 
-    def __init__(self: TransactionManagerImpl, conn: AsyncSession) -> None:
-        self.conn = conn
+    def __init__(
+        self: TransactionManagerImpl,
+        conn: AsyncSession | None = None,
+        *,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        raw_driver: bool = False,
+        on_commit: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        if conn is None and session_factory is None:
+            raise ValueError("Either a session or a session factory is needed")
+        self._conn = conn
+        self._session_factory = session_factory
+        self._raw_driver = raw_driver
+        self._on_commit = on_commit
+
+    @classmethod
+    def lazy(
+        cls: type[TransactionManagerImpl],
+        session_factory: Callable[[], AsyncSession],
+        *,
+        raw_driver: bool = False,
+        on_commit: Callable[[], Awaitable[None]] | None = None,
+    ) -> TransactionManagerImpl:
+        """Open the session on first use and own it until ``aclose``."""
+        return cls(
+            session_factory=session_factory,
+            raw_driver=raw_driver,
+            on_commit=on_commit,
+        )
+
+    @property
+    def conn(self: TransactionManagerImpl) -> AsyncSession:
+        if self._conn is None:
+            if self._session_factory is None:
+                raise RuntimeError("Transaction manager is closed")
+            self._conn = self._session_factory()
+        return self._conn
+
+    @property
+    def opened(self: TransactionManagerImpl) -> bool:
+        return self._conn is not None
+
+    async def aclose(self: TransactionManagerImpl) -> None:
+        # Borrowed sessions are closed by whoever opened them.
+        if self._session_factory is None or self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        await conn.close()
 
     async def send[T](self: TransactionManagerImpl, query: Query[T], /) -> T:
+        if self._raw_driver and isinstance(query, DriverQuery):
+            return await run_on_driver(self.conn, query)
         return await query(self.conn)
 
     __call__: Callable[
@@ -80,4 +143,5 @@ class TransactionManagerImpl(TransactionManager):
         if self.conn.in_transaction():
             return _NoopTxScope(self)
 
-        return _TxScope(self, self.conn.begin())
+        # Only the outermost scope commits, so only it runs on_commit.
+        return _TxScope(self, self.conn.begin(), self._on_commit)
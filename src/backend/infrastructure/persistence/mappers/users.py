@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserSummary,
+)
 from backend.domain.core.entities.user import User
 from backend.domain.core.services.users import rehydrate_user
-from backend.domain.core.types.rbac import RoleCode
+from backend.domain.core.types.rbac import PermissionCode, RoleCode
 from backend.infrastructure.persistence.records import (
+    UserAccessRecord,
     UserRoleCodeRecord,
     UserRowRecord,
+    UserSummaryRecord,
+    UserWithRolesRecord,
 )
 
 
@@ -36,8 +44,57 @@ def row_record_to_user(
     )
 
 
+def roles_record_to_user(rec: UserWithRolesRecord) -> User:
+    return rehydrate_user(
+        id=rec.id,
+        email=rec.email,
+        login=rec.login,
+        username=rec.username,
+        password_hash=rec.password_hash,
+        is_active=rec.is_active,
+        roles=set(rec.roles),
+    )
+
+
 def role_records_to_set(records: list[UserRoleCodeRecord]) -> set[RoleCode]:
     role_codes: set[RoleCode] = set()
     for record in records:
         role_codes.add(record.role)
     return role_codes
+
+
+def row_records_to_users(
+    rows: list[UserRowRecord],
+    role_rows: list[UserRoleCodeRecord] | None = None,
+) -> list[User]:
+    roles_by_user: dict[UUID, set[RoleCode]] = {}
+    for record in role_rows or ():
+        roles_by_user.setdefault(record.user_id, set()).add(record.role)
+    return [
+        row_record_to_user(row, roles=roles_by_user.get(row.id))
+        for row in rows
+    ]
+
+
+def summary_record_to_summary(rec: UserSummaryRecord) -> UserSummary:
+    return UserSummary(
+        id=rec.id,
+        email=rec.email,
+        login=rec.login,
+        username=rec.username,
+    )
+
+
+def access_record_to_user(
+    rec: UserAccessRecord,
+) -> tuple[User, set[PermissionCode]]:
+    user = rehydrate_user(
+        id=rec.id,
+        email=rec.email,
+        login=rec.login,
+        username=rec.username,
+        password_hash=rec.password_hash,
+        is_active=rec.is_active,
+        roles=set(rec.roles),
+    )
+    return user, {PermissionCode(code) for code in rec.permission_codes}
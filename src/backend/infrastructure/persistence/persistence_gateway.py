@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
+    ReadPersistenceGateway,
 )
 from backend.application.common.interfaces.ports.persistence.manager import (
     TransactionManager,
@@ -17,3 +18,9 @@ class PersistenceGatewayImpl(PersistenceGateway):
         self.manager = manager
         self.users = SqlUsersAdapter(manager)
         self.rbac = SqlRbacAdapter(manager)
+
+
+class ReadPersistenceGatewayImpl(
+    PersistenceGatewayImpl, ReadPersistenceGateway
+):
+    pass
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, Sequence
+from typing import Final
 
 import sqlalchemy as sa
-from sqlalchemy import RowMapping
+from sqlalchemy.dialects.postgresql import ARRAY
 from uuid_utils.compat import UUID
 
 from backend.application.common.interfaces.ports.persistence.manager import (
@@ -11,7 +12,10 @@ from backend.application.common.interfaces.ports.persistence.manager import (
 )
 from backend.domain.core.types.rbac import RoleCode
 from backend.infrastructure.persistence.mappers.rbac import value_to_uuid
-from backend.infrastructure.persistence.records import UserRoleCodeRecord
+from backend.infrastructure.persistence.records import (
+    RolePermissionsRecord,
+    UserRoleCodeRecord,
+)
 from backend.infrastructure.persistence.sqlalchemy.session_db import (
     require_async_session,
 )
@@ -22,7 +26,101 @@ from backend.infrastructure.persistence.sqlalchemy.tables.role_permission import
     role_permissions_table,
     user_roles_table,
 )
-from backend.infrastructure.tools.msgspec_convert import convert_record
+from backend.infrastructure.tools.msgspec_convert import convert_rows
+
+# Built once at import, like the statements in rawadapter.users.
+_NIL_UUID: Final[UUID] = UUID(int=0)
+
+_USER_ROLE_CODES_JOIN: Final[sa.Join] = user_roles_table.join(
+    roles_table, user_roles_table.c.role_id == roles_table.c.id
+)
+
+_USER_ROLE_CODES: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(
+        user_roles_table.c.user_id.label("user_id"),
+        roles_table.c.code.label("role"),
+    )
+    .select_from(_USER_ROLE_CODES_JOIN)
+    .where(user_roles_table.c.user_id == sa.bindparam("user_id"))
+)
+
+_ROLE_CODES_BY_USER_IDS: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(
+        user_roles_table.c.user_id.label("user_id"),
+        roles_table.c.code.label("role"),
+    )
+    .select_from(_USER_ROLE_CODES_JOIN)
+    .where(
+        user_roles_table.c.user_id
+        == sa.any_(
+            sa.bindparam(
+                "user_ids", type_=ARRAY(user_roles_table.c.user_id.type)
+            )
+        )
+    )
+)
+
+_ROLE_IDS_BY_CODES: Final[sa.Select[tuple[object, ...]]] = sa.select(
+    roles_table.c.code, roles_table.c.id
+).where(
+    roles_table.c.code
+    == sa.any_(sa.bindparam("codes", type_=ARRAY(roles_table.c.code.type)))
+)
+
+_USER_ROLES_DELETE: Final[sa.Delete] = sa.delete(user_roles_table).where(
+    user_roles_table.c.user_id == sa.bindparam("user_id")
+)
+
+_USER_ROLES_INSERT: Final[sa.Insert] = sa.insert(user_roles_table)
+
+# Ordered by user_id so both the full list and keyset pages read
+# ix_user_roles_role_id_user_id as one range starting after the cursor.
+_USER_IDS_BY_ROLE_ID: Final[sa.Select[tuple[object]]] = (
+    sa.select(user_roles_table.c.user_id)
+    .where(
+        user_roles_table.c.role_id == sa.bindparam("role_id"),
+        user_roles_table.c.user_id > sa.bindparam("after"),
+    )
+    .order_by(user_roles_table.c.user_id)
+)
+
+_USER_IDS_BY_ROLE_ID_PAGE: Final[sa.Select[tuple[object]]] = (
+    _USER_IDS_BY_ROLE_ID.limit(sa.bindparam("limit", type_=sa.Integer))
+)
+
+
+def _role_permissions_stmt() -> sa.Select[tuple[object, ...]]:
+    permission_code = role_permissions_table.c.permission_code
+    join_stmt = roles_table.outerjoin(
+        role_permissions_table,
+        role_permissions_table.c.role_id == roles_table.c.id,
+    )
+    return (
+        sa.select(
+            roles_table.c.code.label("role"),
+            sa.func.array_agg(permission_code)
+            .filter(permission_code.is_not(None))
+            .label("permission_codes"),
+        )
+        .select_from(join_stmt)
+        .group_by(roles_table.c.code)
+    )
+
+
+_ROLE_PERMISSIONS: Final[sa.Select[tuple[object, ...]]] = (
+    _role_permissions_stmt()
+)
+
+_USER_PERMISSION_CODES: Final[sa.Select[tuple[object]]] = (
+    sa.select(sa.distinct(role_permissions_table.c.permission_code))
+    .select_from(
+        _USER_ROLE_CODES_JOIN.join(
+            role_permissions_table,
+            role_permissions_table.c.role_id == roles_table.c.id,
+        )
+    )
+    .where(user_roles_table.c.user_id == sa.bindparam("user_id"))
+)
 
 
 def q_get_user_role_codes(
@@ -30,20 +128,25 @@ def q_get_user_role_codes(
 ) -> Callable[[SessionProtocol], Awaitable[list[UserRoleCodeRecord]]]:
     async def _q(session: SessionProtocol) -> list[UserRoleCodeRecord]:
         async_session = require_async_session(session)
-        join_stmt = user_roles_table.join(
-            roles_table, user_roles_table.c.role_id == roles_table.c.id
+        res = await async_session.execute(
+            _USER_ROLE_CODES, {"user_id": user_id}
         )
-        stmt = (
-            sa.select(
-                user_roles_table.c.user_id.label("user_id"),
-                roles_table.c.code.label("role"),
-            )
-            .select_from(join_stmt)
-            .where(user_roles_table.c.user_id == user_id)
+        return convert_rows(res.all(), UserRoleCodeRecord)
+
+    return _q
+
+
+def q_get_role_codes_by_user_ids(
+    user_ids: Sequence[UUID],
+) -> Callable[[SessionProtocol], Awaitable[list[UserRoleCodeRecord]]]:
+    async def _q(session: SessionProtocol) -> list[UserRoleCodeRecord]:
+        async_session = require_async_session(session)
+        if not user_ids:
+            return []
+        res = await async_session.execute(
+            _ROLE_CODES_BY_USER_IDS, {"user_ids": list(user_ids)}
         )
-        res = await async_session.execute(stmt)
-        rows: Sequence[RowMapping] = res.mappings().all()
-        return [convert_record(dict(row), UserRoleCodeRecord) for row in rows]
+        return convert_rows(res.all(), UserRoleCodeRecord)
 
     return _q
 
@@ -55,11 +158,9 @@ def q_get_role_ids_by_codes(
         async_session = require_async_session(session)
         if not codes:
             return []
-        code_values = list(codes)
-        stmt = sa.select(roles_table.c.code, roles_table.c.id).where(
-            roles_table.c.code.in_(code_values)
+        res = await async_session.execute(
+            _ROLE_IDS_BY_CODES, {"codes": list(codes)}
         )
-        res = await async_session.execute(stmt)
         out: list[tuple[RoleCode, UUID]] = []
         for role_code, role_id in res.all():
             out.append((str(role_code), value_to_uuid(role_id)))
@@ -73,51 +174,61 @@ def q_replace_user_roles(
 ) -> Callable[[SessionProtocol], Awaitable[None]]:
     async def _q(session: SessionProtocol) -> None:
         async_session = require_async_session(session)
-        await async_session.execute(
-            sa.delete(user_roles_table).where(
-                user_roles_table.c.user_id == user_id
-            )
-        )
+        await async_session.execute(_USER_ROLES_DELETE, {"user_id": user_id})
         if role_ids:
             payload = [
                 {"user_id": user_id, "role_id": rid} for rid in role_ids
             ]
-            await async_session.execute(sa.insert(user_roles_table), payload)
+            await async_session.execute(_USER_ROLES_INSERT, payload)
 
     return _q
 
 
 def q_list_user_ids_by_role_id(
     role_id: UUID,
+    *,
+    after: UUID | None = None,
+    limit: int | None = None,
 ) -> Callable[[SessionProtocol], Awaitable[list[UUID]]]:
     async def _q(session: SessionProtocol) -> list[UUID]:
         async_session = require_async_session(session)
-        stmt = sa.select(user_roles_table.c.user_id).where(
-            user_roles_table.c.role_id == role_id
-        )
-        res = await async_session.execute(stmt)
+        # The nil UUID sorts first, so a missing cursor starts at the top.
+        params: dict[str, object] = {
+            "role_id": role_id,
+            "after": _NIL_UUID if after is None else after,
+        }
+        stmt = _USER_IDS_BY_ROLE_ID
+        if limit is not None:
+            stmt = _USER_IDS_BY_ROLE_ID_PAGE
+            params["limit"] = limit
+        res = await async_session.execute(stmt, params)
         return [value_to_uuid(row[0]) for row in res.all()]
 
     return _q
 
 
+def q_list_role_permissions() -> Callable[
+    [SessionProtocol], Awaitable[list[RolePermissionsRecord]]
+]:
+    async def _q(session: SessionProtocol) -> list[RolePermissionsRecord]:
+        async_session = require_async_session(session)
+        res = await async_session.execute(_ROLE_PERMISSIONS)
+        return convert_rows(
+            ((role, codes or []) for role, codes in res.all()),
+            RolePermissionsRecord,
+        )
+
+    return _q
+
+
 def q_get_user_permission_codes(
     user_id: UUID,
 ) -> Callable[[SessionProtocol], Awaitable[list[str]]]:
     async def _q(session: SessionProtocol) -> list[str]:
         async_session = require_async_session(session)
-        join_stmt = user_roles_table.join(
-            roles_table, user_roles_table.c.role_id == roles_table.c.id
-        ).join(
-            role_permissions_table,
-            role_permissions_table.c.role_id == roles_table.c.id,
-        )
-        stmt = (
-            sa.select(sa.distinct(role_permissions_table.c.permission_code))
-            .select_from(join_stmt)
-            .where(user_roles_table.c.user_id == user_id)
+        res = await async_session.execute(
+            _USER_PERMISSION_CODES, {"user_id": user_id}
         )
-        res = await async_session.execute(stmt)
         return [str(row[0]) for row in res.all() if isinstance(row[0], str)]
 
     return _q
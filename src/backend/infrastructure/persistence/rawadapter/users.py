@@ -1,77 +1,393 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import Final
 
 import sqlalchemy as sa
-from sqlalchemy import RowMapping
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert
 from uuid_utils.compat import UUID
 
 from backend.application.common.interfaces.ports.persistence.manager import (
     SessionProtocol,
 )
-from backend.infrastructure.persistence.records import UserRowRecord
+from backend.infrastructure.persistence.records import (
+    UserAccessRecord,
+    UserRowRecord,
+    UserSummaryRecord,
+    UserWithRolesRecord,
+)
+from backend.infrastructure.persistence.sqlalchemy.raw_driver import (
+    DriverConnection,
+    DriverQuery,
+    driver_sql,
+)
 from backend.infrastructure.persistence.sqlalchemy.session_db import (
     require_async_session,
 )
+from backend.infrastructure.persistence.sqlalchemy.tables.role import (
+    roles_table,
+)
+from backend.infrastructure.persistence.sqlalchemy.tables.role_permission import (
+    role_permissions_table,
+    user_roles_table,
+)
 from backend.infrastructure.persistence.sqlalchemy.tables.users import (
     users_table,
 )
-from backend.infrastructure.tools.msgspec_convert import convert_record
+from backend.infrastructure.tools.msgspec_convert import (
+    convert_row,
+    convert_rows,
+)
+
+# Statements are built once at import: each execution then skips
+# construction and reuses the memoized cache key, so the engine's compiled
+# cache hit is cheap and the SQL text (hence asyncpg's prepared statement)
+# stays stable.
+_USER_ROW_COLUMNS: tuple[sa.Label[object], ...] = (
+    users_table.c.id.label("id"),
+    users_table.c.email.label("email"),
+    users_table.c.login.label("login"),
+    users_table.c.username.label("username"),
+    users_table.c.password_hash.label("password_hash"),
+    users_table.c.is_active.label("is_active"),
+)
+
+_USER_ROW_BY_ID: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(*_USER_ROW_COLUMNS)
+    .select_from(users_table)
+    .where(users_table.c.id == sa.bindparam("user_id"))
+)
+
+_USER_ROW_BY_EMAIL: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(*_USER_ROW_COLUMNS)
+    .select_from(users_table)
+    .where(users_table.c.email == sa.bindparam("email"))
+)
+
+# One array parameter (`= ANY($1)`) keeps a single cached plan regardless
+# of how many ids are passed, unlike an expanded IN.
+_USER_ROWS_BY_IDS: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(*_USER_ROW_COLUMNS)
+    .select_from(users_table)
+    .where(
+        users_table.c.id
+        == sa.any_(
+            sa.bindparam("user_ids", type_=ARRAY(users_table.c.id.type))
+        )
+    )
+)
+
+_USER_ROWS_BY_ROLE_ID: Final[sa.Select[tuple[object, ...]]] = (
+    sa.select(*_USER_ROW_COLUMNS)
+    .select_from(
+        user_roles_table.join(
+            users_table, users_table.c.id == user_roles_table.c.user_id
+        )
+    )
+    .where(user_roles_table.c.role_id == sa.bindparam("role_id"))
+    .order_by(user_roles_table.c.user_id)
+)
+
+
+def _user_with_roles_stmt(
+    where: sa.ColumnElement[bool],
+) -> sa.Select[tuple[object, ...]]:
+    role_code = roles_table.c.code
+    join_stmt = users_table.outerjoin(
+        user_roles_table,
+        user_roles_table.c.user_id == users_table.c.id,
+    ).outerjoin(roles_table, roles_table.c.id == user_roles_table.c.role_id)
+    return (
+        sa.select(
+            *_USER_ROW_COLUMNS,
+            sa.func.array_agg(role_code)
+            .filter(role_code.is_not(None))
+            .label("roles"),
+        )
+        .select_from(join_stmt)
+        .where(where)
+        .group_by(users_table.c.id)
+    )
+
+
+_USER_WITH_ROLES_BY_ID: Final[sa.Select[tuple[object, ...]]] = (
+    _user_with_roles_stmt(users_table.c.id == sa.bindparam("user_id"))
+)
+
+_USER_WITH_ROLES_BY_EMAIL: Final[sa.Select[tuple[object, ...]]] = (
+    _user_with_roles_stmt(users_table.c.email == sa.bindparam("email"))
+)
+
+
+def _user_access_stmt() -> sa.Select[tuple[object, ...]]:
+    role_code = roles_table.c.code
+    permission_code = role_permissions_table.c.permission_code
+    join_stmt = (
+        users_table.outerjoin(
+            user_roles_table,
+            user_roles_table.c.user_id == users_table.c.id,
+        )
+        .outerjoin(roles_table, roles_table.c.id == user_roles_table.c.role_id)
+        .outerjoin(
+            role_permissions_table,
+            role_permissions_table.c.role_id == roles_table.c.id,
+        )
+    )
+    return (
+        sa.select(
+            *_USER_ROW_COLUMNS,
+            sa.func.array_agg(sa.distinct(role_code))
+            .filter(role_code.is_not(None))
+            .label("roles"),
+            sa.func.array_agg(sa.distinct(permission_code))
+            .filter(permission_code.is_not(None))
+            .label("permission_codes"),
+        )
+        .select_from(join_stmt)
+        .where(users_table.c.id == sa.bindparam("user_id"))
+        .group_by(users_table.c.id)
+    )
+
+
+_USER_ACCESS_BY_ID: Final[sa.Select[tuple[object, ...]]] = _user_access_stmt()
+
+# The same statements as asyncpg SQL for the raw-driver path; identical
+# text, so both paths share the connection's prepared statements.
+_USER_ROW_BY_ID_SQL: Final[str] = driver_sql(
+    _USER_ROW_BY_ID, "user_id", record_type=UserRowRecord
+)
+_USER_ROW_BY_EMAIL_SQL: Final[str] = driver_sql(
+    _USER_ROW_BY_EMAIL, "email", record_type=UserRowRecord
+)
+
+
+def _user_upsert_stmt() -> ReturningInsert[tuple[object, ...]]:
+    stmt = pg_insert(users_table).values(
+        {
+            column: sa.bindparam(column.name)
+            for column in (
+                users_table.c.id,
+                users_table.c.email,
+                users_table.c.login,
+                users_table.c.username,
+                users_table.c.password_hash,
+                users_table.c.is_active,
+            )
+        }
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[users_table.c.id],
+        set_={
+            column.name: stmt.excluded[column.name] for column in users_table.c
+        },
+    ).returning(*_USER_ROW_COLUMNS)
+
+
+_USER_UPSERT: Final[ReturningInsert[tuple[object, ...]]] = _user_upsert_stmt()
+
+_USER_DELETE: Final[ReturningDelete[tuple[object]]] = (
+    sa.delete(users_table)
+    .where(users_table.c.id == sa.bindparam("user_id"))
+    .returning(users_table.c.id)
+)
 
 
 def q_get_user_row_by_id(
     user_id: UUID,
-) -> Callable[[SessionProtocol], Awaitable[UserRowRecord | None]]:
+) -> DriverQuery[UserRowRecord | None]:
     async def _q(session: SessionProtocol) -> UserRowRecord | None:
         async_session = require_async_session(session)
-        stmt = (
-            sa.select(
-                users_table.c.id.label("id"),
-                users_table.c.email.label("email"),
-                users_table.c.login.label("login"),
-                users_table.c.username.label("username"),
-                users_table.c.password_hash.label("password_hash"),
-                users_table.c.is_active.label("is_active"),
+        res = await async_session.execute(
+            _USER_ROW_BY_ID, {"user_id": user_id}
+        )
+        row = res.first()
+        if row is None:
+            return None
+        return convert_row(row, UserRowRecord)
+
+    async def _fetch(conn: DriverConnection) -> UserRowRecord | None:
+        row = await conn.fetchrow(_USER_ROW_BY_ID_SQL, user_id)
+        # Columns come back already typed, in field order.
+        return None if row is None else UserRowRecord(*row)
+
+    return DriverQuery(_q, _fetch)
+
+
+def q_get_user_rows_by_ids(
+    user_ids: Sequence[UUID],
+) -> Callable[[SessionProtocol], Awaitable[list[UserRowRecord]]]:
+    async def _q(session: SessionProtocol) -> list[UserRowRecord]:
+        async_session = require_async_session(session)
+        if not user_ids:
+            return []
+        res = await async_session.execute(
+            _USER_ROWS_BY_IDS, {"user_ids": list(user_ids)}
+        )
+        return convert_rows(res.all(), UserRowRecord)
+
+    return _q
+
+
+def q_stream_user_rows_by_role_id(
+    role_id: UUID,
+    *,
+    chunk_size: int,
+) -> Callable[
+    [SessionProtocol], Awaitable[AsyncIterator[list[UserRowRecord]]]
+]:
+    async def _q(
+        session: SessionProtocol,
+    ) -> AsyncIterator[list[UserRowRecord]]:
+        async_session = require_async_session(session)
+        # Server-side cursor: only one chunk of rows is held at a time.
+        res = await async_session.stream(
+            _USER_ROWS_BY_ROLE_ID,
+            {"role_id": role_id},
+            execution_options={"yield_per": chunk_size},
+        )
+
+        async def _chunks() -> AsyncIterator[list[UserRowRecord]]:
+            try:
+                async for part in res.partitions():
+                    yield convert_rows(part, UserRowRecord)
+            finally:
+                await res.close()
+
+        return _chunks()
+
+    return _q
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    # Smallest string above every string starting with ``prefix`` in
+    # code point order, which is what the "C" collation compares by.
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def q_list_user_summaries(
+    *,
+    limit: int,
+    after_id: UUID | None = None,
+    after_email: str | None = None,
+    is_active: bool | None = None,
+    role: str | None = None,
+    email_prefix: str | None = None,
+) -> Callable[[SessionProtocol], Awaitable[list[UserSummaryRecord]]]:
+    async def _q(session: SessionProtocol) -> list[UserSummaryRecord]:
+        async_session = require_async_session(session)
+        # Keyset pages: by id through the primary key, or by email through
+        # ix_users_email_c when a prefix narrows the range. Plain range
+        # predicates keep the index usable in generic prepared plans,
+        # where LIKE with a bound pattern would not be.
+        email_key = users_table.c.email.collate("C")
+        from_stmt: sa.FromClause = users_table
+        stmt = sa.select(
+            users_table.c.id.label("id"),
+            users_table.c.email.label("email"),
+            users_table.c.login.label("login"),
+            users_table.c.username.label("username"),
+        )
+        if role is not None:
+            role_id = (
+                sa.select(roles_table.c.id)
+                .where(roles_table.c.code == role)
+                .scalar_subquery()
+            )
+            from_stmt = users_table.join(
+                user_roles_table,
+                user_roles_table.c.user_id == users_table.c.id,
             )
-            .select_from(users_table)
-            .where(users_table.c.id == user_id)
+            stmt = stmt.where(user_roles_table.c.role_id == role_id)
+        if is_active is not None:
+            stmt = stmt.where(users_table.c.is_active == is_active)
+        if email_prefix:
+            stmt = stmt.where(
+                email_key >= email_prefix,
+                email_key < _prefix_upper_bound(email_prefix),
+            )
+            if after_email is not None:
+                stmt = stmt.where(email_key > after_email)
+            stmt = stmt.order_by(email_key)
+        else:
+            if after_id is not None:
+                stmt = stmt.where(users_table.c.id > after_id)
+            stmt = stmt.order_by(users_table.c.id)
+        res = await async_session.execute(
+            stmt.select_from(from_stmt).limit(limit)
         )
-        res = await async_session.execute(stmt)
-        row: RowMapping | None = res.mappings().first()
+        return convert_rows(res.all(), UserSummaryRecord)
+
+    return _q
+
+
+def q_get_user_with_roles(
+    stmt: sa.Select[tuple[object, ...]],
+    params: dict[str, object],
+) -> Callable[[SessionProtocol], Awaitable[UserWithRolesRecord | None]]:
+    async def _q(session: SessionProtocol) -> UserWithRolesRecord | None:
+        async_session = require_async_session(session)
+        res = await async_session.execute(stmt, params)
+        row = res.first()
         if row is None:
             return None
-        return convert_record(dict(row), UserRowRecord)
+        *user, roles = row
+        return convert_row((*user, roles or []), UserWithRolesRecord)
 
     return _q
 
 
-def q_get_user_row_by_email(
+def q_get_user_with_roles_by_id(
+    user_id: UUID,
+) -> Callable[[SessionProtocol], Awaitable[UserWithRolesRecord | None]]:
+    return q_get_user_with_roles(_USER_WITH_ROLES_BY_ID, {"user_id": user_id})
+
+
+def q_get_user_with_roles_by_email(
     email: str,
-) -> Callable[[SessionProtocol], Awaitable[UserRowRecord | None]]:
-    async def _q(session: SessionProtocol) -> UserRowRecord | None:
+) -> Callable[[SessionProtocol], Awaitable[UserWithRolesRecord | None]]:
+    return q_get_user_with_roles(_USER_WITH_ROLES_BY_EMAIL, {"email": email})
+
+
+def q_get_user_access_by_id(
+    user_id: UUID,
+) -> Callable[[SessionProtocol], Awaitable[UserAccessRecord | None]]:
+    async def _q(session: SessionProtocol) -> UserAccessRecord | None:
         async_session = require_async_session(session)
-        stmt = (
-            sa.select(
-                users_table.c.id.label("id"),
-                users_table.c.email.label("email"),
-                users_table.c.login.label("login"),
-                users_table.c.username.label("username"),
-                users_table.c.password_hash.label("password_hash"),
-                users_table.c.is_active.label("is_active"),
-            )
-            .select_from(users_table)
-            .where(users_table.c.email == email)
+        res = await async_session.execute(
+            _USER_ACCESS_BY_ID, {"user_id": user_id}
         )
-        res = await async_session.execute(stmt)
-        row: RowMapping | None = res.mappings().first()
+        row = res.first()
         if row is None:
             return None
-        return convert_record(dict(row), UserRowRecord)
+        # FILTER yields NULL rather than an empty array when nothing matched.
+        *user, roles, permission_codes = row
+        return convert_row(
+            (*user, roles or [], permission_codes or []), UserAccessRecord
+        )
 
     return _q
 
 
+def q_get_user_row_by_email(
+    email: str,
+) -> DriverQuery[UserRowRecord | None]:
+    async def _q(session: SessionProtocol) -> UserRowRecord | None:
+        async_session = require_async_session(session)
+        res = await async_session.execute(_USER_ROW_BY_EMAIL, {"email": email})
+        row = res.first()
+        if row is None:
+            return None
+        return convert_row(row, UserRowRecord)
+
+    async def _fetch(conn: DriverConnection) -> UserRowRecord | None:
+        row = await conn.fetchrow(_USER_ROW_BY_EMAIL_SQL, email)
+        return None if row is None else UserRowRecord(*row)
+
+    return DriverQuery(_q, _fetch)
+
+
 def q_upsert_user_row(
     row: UserRowRecord,
 ) -> Callable[[SessionProtocol], Awaitable[UserRowRecord]]:
@@ -85,27 +401,11 @@ def q_upsert_user_row(
             "password_hash": row.password_hash,
             "is_active": row.is_active,
         }
-        stmt = (
-            pg_insert(users_table)
-            .values(**values)
-            .on_conflict_do_update(
-                index_elements=[users_table.c.id],
-                set_=values,
-            )
-            .returning(
-                users_table.c.id.label("id"),
-                users_table.c.email.label("email"),
-                users_table.c.login.label("login"),
-                users_table.c.username.label("username"),
-                users_table.c.password_hash.label("password_hash"),
-                users_table.c.is_active.label("is_active"),
-            )
-        )
-        res = await async_session.execute(stmt)
-        row_mapping: RowMapping | None = res.mappings().first()
-        if row_mapping is None:
+        res = await async_session.execute(_USER_UPSERT, values)
+        returned = res.first()
+        if returned is None:
             raise RuntimeError("Failed to upsert user row")
-        return convert_record(dict(row_mapping), UserRowRecord)
+        return convert_row(returned, UserRowRecord)
 
     return _q
 
@@ -115,12 +415,7 @@ def q_delete_user(
 ) -> Callable[[SessionProtocol], Awaitable[bool]]:
     async def _q(session: SessionProtocol) -> bool:
         async_session = require_async_session(session)
-        stmt = (
-            sa.delete(users_table)
-            .where(users_table.c.id == user_id)
-            .returning(users_table.c.id)
-        )
-        res = await async_session.execute(stmt)
+        res = await async_session.execute(_USER_DELETE, {"user_id": user_id})
         deleted = res.scalar_one_or_none()
         return deleted is not None
 
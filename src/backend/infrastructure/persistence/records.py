@@ -3,16 +3,52 @@ from __future__ import annotations
 import msgspec
 from uuid_utils.compat import UUID
 
+# Records are array_like and decoded positionally from row tuples (see
+# convert_rows): field order must match the column order of the SELECT.
 
-class UserRowRecord(msgspec.Struct, frozen=True):
+
+class UserRowRecord(msgspec.Struct, frozen=True, array_like=True):
+    id: UUID
+    email: str
+    login: str
+    username: str
+    password_hash: str
+    is_active: bool
+
+
+class UserSummaryRecord(msgspec.Struct, frozen=True, array_like=True):
+    id: UUID
+    email: str
+    login: str
+    username: str
+
+
+class UserWithRolesRecord(msgspec.Struct, frozen=True, array_like=True):
     id: UUID
     email: str
     login: str
     username: str
     password_hash: str
     is_active: bool
+    roles: list[str]
 
 
-class UserRoleCodeRecord(msgspec.Struct, frozen=True):
+class UserAccessRecord(msgspec.Struct, frozen=True, array_like=True):
+    id: UUID
+    email: str
+    login: str
+    username: str
+    password_hash: str
+    is_active: bool
+    roles: list[str]
+    permission_codes: list[str]
+
+
+class UserRoleCodeRecord(msgspec.Struct, frozen=True, array_like=True):
     user_id: UUID
     role: str
+
+
+class RolePermissionsRecord(msgspec.Struct, frozen=True, array_like=True):
+    role: str
+    permission_codes: list[str]
@@ -1,3 +1,10 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("session_db", "tables", "types")
+__all__: tuple[str, ...] = (
+    "pool",
+    "raw_driver",
+    "replica",
+    "session_db",
+    "tables",
+    "types",
+)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+
+@dataclass(slots=True)
+class PoolMetrics:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_total_s: float = 0.0
+    wait_max_s: float = 0.0
+
+    def observe(self: PoolMetrics, wait_s: float) -> None:
+        self.checkouts += 1
+        self.wait_total_s += wait_s
+        self.wait_max_s = max(self.wait_max_s, wait_s)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    utilization: float
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    _metrics: PoolMetrics | None = None
+
+    @property
+    def metrics(self: InstrumentedAsyncQueuePool) -> PoolMetrics:
+        if self._metrics is None:
+            self._metrics = PoolMetrics()
+        return self._metrics
+
+    def connect(self: InstrumentedAsyncQueuePool) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.observe(time.perf_counter() - started)
+        return conn
+
+    def recreate(
+        self: InstrumentedAsyncQueuePool,
+    ) -> InstrumentedAsyncQueuePool:
+        pool = super().recreate()
+        if not isinstance(pool, InstrumentedAsyncQueuePool):
+            raise TypeError("Pool recreate returned an unexpected type")
+        # Keep counters across engine.dispose().
+        pool._metrics = self.metrics
+        return pool
+
+
+def pool_stats(engine: AsyncEngine, *, max_overflow: int) -> PoolStats:
+    """Snapshot ``engine``'s pool; ``max_overflow`` is the configured one.
+
+    QueuePool does not expose its overflow limit, so the caller passes
+    the value the engine was created with.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        raise TypeError(f"Unsupported pool type: {type(pool).__name__}")
+    size = pool.size()
+    max_overflow = max(max_overflow, 0)
+    checked_out = pool.checkedout()
+    capacity = size + max_overflow
+    metrics = (
+        pool.metrics
+        if isinstance(pool, InstrumentedAsyncQueuePool)
+        else PoolMetrics()
+    )
+    wait_avg_s = (
+        metrics.wait_total_s / metrics.checkouts if metrics.checkouts else 0.0
+    )
+    return PoolStats(
+        size=size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        checked_in=pool.checkedin(),
+        overflow=pool.overflow(),
+        utilization=checked_out / capacity if capacity else 0.0,
+        checkouts=metrics.checkouts,
+        timeouts=metrics.timeouts,
+        wait_avg_ms=wait_avg_s * 1000,
+        wait_max_ms=metrics.wait_max_s * 1000,
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import Final, Protocol
+
+import msgspec
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql.asyncpg import (
+    AsyncAdapt_asyncpg_connection,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import DBAPIError, IntegrityError, InterfaceError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.common.interfaces.ports.persistence.manager import (
+    Query,
+    SessionProtocol,
+)
+
+_SQLSTATE_INTEGRITY_CLASS: Final[str] = "23"
+_SQLSTATE_CONNECTION_CLASS: Final[str] = "08"
+_SQLSTATE_SHUTDOWN: Final[frozenset[str]] = frozenset(
+    {"57P01", "57P02", "57P03"}
+)
+_DIALECT: Final[Dialect] = sa.make_url("postgresql+asyncpg://").get_dialect()()
+
+
+class DriverRow(Protocol):
+    def __iter__(self: DriverRow) -> Iterator[object]: ...
+
+    def __getitem__(self: DriverRow, index: int) -> object: ...
+
+
+class DriverConnection(Protocol):
+    """The part of ``asyncpg.Connection`` the fast path relies on."""
+
+    async def fetchrow(
+        self: DriverConnection, query: str, *args: object
+    ) -> DriverRow | None: ...
+
+    async def fetch(
+        self: DriverConnection, query: str, *args: object
+    ) -> list[DriverRow]: ...
+
+
+type DriverFetch[T] = Callable[[DriverConnection], Awaitable[T]]
+
+
+@dataclass(frozen=True, slots=True)
+class DriverQuery[T]:
+    """A ``Query[T]`` that can also run straight on the asyncpg connection.
+
+    Calling it runs ``fallback`` through the session, so any manager can
+    send it; ``TransactionManagerImpl`` with ``raw_driver`` enabled runs
+    ``fetch`` instead and skips SQLAlchemy's result processing.
+    """
+
+    fallback: Query[T]
+    fetch: DriverFetch[T]
+
+    def __call__(
+        self: DriverQuery[T], session: SessionProtocol
+    ) -> Awaitable[T]:
+        return self.fallback(session)
+
+
+def driver_sql(
+    stmt: sa.Select[tuple[object, ...]],
+    *params: str,
+    record_type: type[msgspec.Struct],
+) -> str:
+    """Compile ``stmt`` to asyncpg SQL for rows built positionally.
+
+    Fails at import rather than mis-decoding if the bind order or the
+    selected columns drift from ``params`` and ``record_type``.
+    """
+    compiled = stmt.compile(dialect=_DIALECT)
+    if tuple(compiled.positiontup or ()) != params:
+        raise ValueError(
+            f"Expected parameters {params}, got {compiled.positiontup}"
+        )
+    columns = tuple(column.key for column in stmt.selected_columns)
+    if columns != record_type.__struct_fields__:
+        raise ValueError(
+            f"Columns {columns} do not match {record_type.__name__} fields"
+        )
+    return str(compiled)
+
+
+async def run_on_driver[T](session: AsyncSession, query: DriverQuery[T]) -> T:
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    adapted = raw.dbapi_connection
+    if not isinstance(adapted, AsyncAdapt_asyncpg_connection):
+        return await query.fallback(session)
+    # SQLAlchemy has no public hook for the adapter's statement lock or its
+    # lazy BEGIN. sqlalchemy is pinned to 2.0.x and test_raw_driver fails
+    # if either goes away.
+    failure: Exception
+    async with adapted._execute_mutex:
+        try:
+            if not adapted._started:
+                await adapted._start_transaction()
+            return await query.fetch(adapted.driver_connection)
+        except Exception as exc:
+            failure = exc
+    error = _as_dbapi_error(failure)
+    if error.connection_invalidated:
+        # The engine never saw this failure, so it cannot notice a dead
+        # connection on its own; keep it from going back to the pool.
+        await connection.invalidate(failure)
+    raise error from failure
+
+
+def _as_dbapi_error(exc: Exception) -> DBAPIError:
+    # Wrap errors the way the engine would so storage_result maps them
+    # as usual. Client-side errors carry no SQLSTATE and may have broken
+    # the connection mid-protocol.
+    sqlstate = getattr(exc, "sqlstate", None)
+    if not isinstance(sqlstate, str):
+        return InterfaceError(None, None, exc, connection_invalidated=True)
+    if sqlstate.startswith(_SQLSTATE_INTEGRITY_CLASS):
+        return IntegrityError(None, None, exc)
+    return DBAPIError(
+        None,
+        None,
+        exc,
+        connection_invalidated=(
+            sqlstate.startswith(_SQLSTATE_CONNECTION_CLASS)
+            or sqlstate in _SQLSTATE_SHUTDOWN
+        ),
+    )
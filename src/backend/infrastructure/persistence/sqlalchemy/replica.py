@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.ports.cache import StrCache
+from backend.application.handlers.base import HandlerMode
+
+READ_STICKY_PREFIX: Final[str] = "db:sticky"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def read_sticky_key(user_id: UUID) -> str:
+    return f"{READ_STICKY_PREFIX}:{user_id}"
+
+
+@dataclass(slots=True)
+class ReplicaRouter:
+    """Routes read-mode work to a replica, with read-your-writes pinning.
+
+    After a client writes, its reads stay on the primary for
+    ``sticky_s`` seconds so replication lag never hides its own change.
+    """
+
+    primary: async_sessionmaker[AsyncSession]
+    replica: async_sessionmaker[AsyncSession] | None
+    sticky: StrCache
+    sticky_s: int
+
+    @property
+    def enabled(self: ReplicaRouter) -> bool:
+        return self.replica is not None
+
+    async def mark_write(self: ReplicaRouter, user_id: UUID | None) -> None:
+        if not self.enabled or user_id is None or self.sticky_s <= 0:
+            return
+        try:
+            await self.sticky.set(
+                read_sticky_key(user_id), "1", ttl_s=self.sticky_s
+            )
+        except Exception:
+            _LOGGER.warning("Failed to pin reads to primary", exc_info=True)
+
+    async def is_pinned(self: ReplicaRouter, user_id: UUID) -> bool:
+        if not self.enabled or self.sticky_s <= 0:
+            return False
+        try:
+            pinned = await self.sticky.get(read_sticky_key(user_id))
+        except Exception:
+            # Freshness cannot be proven; the primary is always correct.
+            return True
+        return pinned is not None
+
+    async def session_factory_for(
+        self: ReplicaRouter, mode: HandlerMode, user_id: UUID | None
+    ) -> async_sessionmaker[AsyncSession]:
+        if mode == "write" or self.replica is None:
+            return self.primary
+        if user_id is None or not await self.is_pinned(user_id):
+            return self.replica
+        return self.primary
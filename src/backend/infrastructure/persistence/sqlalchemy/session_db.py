@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,19 +16,69 @@ from sqlalchemy.ext.asyncio import (
 from backend.application.common.interfaces.ports.persistence.manager import (
     SessionProtocol,
 )
+from backend.infrastructure.persistence.sqlalchemy.pool import (
+    InstrumentedAsyncQueuePool,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class EnginePoolConfig:
+    size: int = 10
+    max_overflow: int = 10
+    timeout_s: float = 30.0
+    recycle_s: int = 1800
+    pre_ping: bool = False
+    # asyncpg-only: per-connection LRU of prepared statements, 0 disables
+    # (needed behind PgBouncer in transaction mode).
+    statement_cache_size: int = 100
 
 
 def create_engine(
     url: str,
     *,
     echo: bool = False,
+    pool: EnginePoolConfig | None = None,
 ) -> AsyncEngine:
+    cfg = pool or EnginePoolConfig()
+    connect_args: dict[str, object] = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = (
+            cfg.statement_cache_size
+        )
     return create_async_engine(
         url,
         echo=echo,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=cfg.size,
+        max_overflow=cfg.max_overflow,
+        pool_timeout=cfg.timeout_s,
+        pool_recycle=cfg.recycle_s,
+        pool_pre_ping=cfg.pre_ping,
+        connect_args=connect_args,
     )
 
 
+async def prewarm_engine(engine: AsyncEngine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections; returns how many."""
+    opened = 0
+    try:
+        async with AsyncExitStack() as stack:
+            # Hold each one so the pool has to open a fresh connection.
+            for _ in range(connections):
+                await stack.enter_async_context(engine.connect())
+                opened += 1
+    except Exception:
+        _LOGGER.warning(
+            "Connection pool prewarm stopped after %d of %d connections",
+            opened,
+            connections,
+            exc_info=True,
+        )
+    return opened
+
+
 def create_session_factory(
     engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
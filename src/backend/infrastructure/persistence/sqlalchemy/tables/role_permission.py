@@ -77,6 +77,7 @@ Index(
     user_roles_table.c.user_id,
 )
 Index(
-    "ix_user_roles_role_id",
+    "ix_user_roles_role_id_user_id",
     user_roles_table.c.role_id,
+    user_roles_table.c.user_id,
 )
@@ -4,6 +4,7 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Index,
     String,
     Table,
     UniqueConstraint,
@@ -94,6 +95,16 @@ users_table: Table = Table(
     UniqueConstraint(user_username_column),
 )
 
+Index(
+    "ix_users_is_active_id",
+    users_table.c.is_active,
+    users_table.c.id,
+)
+Index(
+    "ix_users_email_c",
+    users_table.c.email.collate("C"),
+)
+
 mapper_registry.map_imperatively(
     User,
     users_table,
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+import secrets
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Final
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from backend.application.common.interfaces.ports.rate_limit import (
+    RateLimit,
+    RateLimiter,
+)
+
+# KEYS: one sorted set per limit, scored by attempt time in ms.
+# ARGV: now_ms, member, then (limit, window_ms) for each key.
+# All windows are checked before any is written, so a rejected attempt
+# never consumes budget and the check-and-record is atomic.
+SLIDING_WINDOW_LUA: Final[str] = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+local retry_ms = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[1 + i * 2])
+    local window = tonumber(ARGV[2 + i * 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local wait = tonumber(oldest[2]) + window - now
+        if wait > retry_ms then
+            retry_ms = wait
+        end
+    end
+end
+if retry_ms > 0 then
+    return retry_ms
+end
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[2 + i * 2])
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, window)
+end
+return 0
+"""
+
+
+@dataclass(slots=True)
+class RedisSlidingWindowLimiter(RateLimiter):
+    client: Redis
+    clock: Callable[[], float] = time.time
+    _script: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self: RedisSlidingWindowLimiter) -> None:
+        self._script = self.client.register_script(SLIDING_WINDOW_LUA)
+
+    async def hit(
+        self: RedisSlidingWindowLimiter, limits: Sequence[RateLimit]
+    ) -> int | None:
+        active = [limit for limit in limits if limit.limit > 0]
+        if not active:
+            return None
+        now_ms = int(self.clock() * 1000)
+        args: list[int | str] = [now_ms, f"{now_ms}:{secrets.token_hex(6)}"]
+        for limit in active:
+            args.extend((limit.limit, limit.window_s * 1000))
+        retry_ms = int(
+            await self._script(keys=[limit.key for limit in active], args=args)
+        )
+        if retry_ms <= 0:
+            return None
+        return max(1, math.ceil(retry_ms / 1000))
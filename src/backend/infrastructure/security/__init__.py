@@ -1,3 +1,9 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("auth",)
+__all__: tuple[str, ...] = (
+    "argon2_calibration",
+    "auth",
+    "hashing_pool",
+    "password_hasher",
+    "password_rehash",
+)
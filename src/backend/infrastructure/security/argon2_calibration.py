@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable, Sequence
+from typing import Final
+
+from argon2 import Type
+from argon2.low_level import hash_secret_raw
+
+from backend.infrastructure.security.password_hasher import (
+    ARGON2_MEMORY_COST_KIB,
+    ARGON2_PARALLELISM,
+    Argon2Params,
+)
+
+type Argon2Measure = Callable[[Argon2Params], float]
+
+# OWASP floor for argon2id with a single pass.
+ARGON2_MIN_MEMORY_COST_KIB: Final[int] = 19456
+ARGON2_MAX_TIME_COST: Final[int] = 10
+
+_PROBE_SECRET: Final[bytes] = b"argon2-calibration-probe"
+_PROBE_SALT: Final[bytes] = os.urandom(16)
+
+
+def measure_argon2(params: Argon2Params, *, samples: int = 3) -> float:
+    timings: list[float] = []
+    for _ in range(max(1, samples)):
+        started = time.perf_counter()
+        hash_secret_raw(
+            _PROBE_SECRET,
+            _PROBE_SALT,
+            time_cost=params.time_cost,
+            memory_cost=params.memory_cost_kib,
+            parallelism=params.parallelism,
+            hash_len=params.hash_len,
+            type=Type.ID,
+        )
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def calibrate_argon2(
+    *,
+    target_ms: int,
+    max_memory_kib: int = ARGON2_MEMORY_COST_KIB,
+    parallelism: int = ARGON2_PARALLELISM,
+    min_memory_kib: int = ARGON2_MIN_MEMORY_COST_KIB,
+    max_time_cost: int = ARGON2_MAX_TIME_COST,
+    measure: Argon2Measure | None = None,
+) -> Argon2Params:
+    """Pick the strongest params whose single hash fits ``target_ms``.
+
+    ``max_memory_kib`` is the budget for one concurrent hash: memory is
+    preferred over passes and only shrunk (down to ``min_memory_kib``)
+    when even a single pass is over target.
+    """
+    if target_ms <= 0:
+        raise ValueError("Calibration target must be positive")
+    if parallelism <= 0 or max_time_cost <= 0:
+        raise ValueError("Argon2 parallelism and time cost must be positive")
+    run = measure or measure_argon2
+    target_s = target_ms / 1000
+    floor_kib = min(max(min_memory_kib, 8 * parallelism), max_memory_kib)
+
+    memory_kib = max_memory_kib
+    params = Argon2Params(
+        time_cost=1, memory_cost_kib=memory_kib, parallelism=parallelism
+    )
+    elapsed = run(params)
+    while elapsed > target_s and memory_kib > floor_kib:
+        # Scale toward the target with some headroom, in whole MiB.
+        scaled = int(memory_kib * target_s / elapsed * 0.9) // 1024 * 1024
+        memory_kib = max(floor_kib, min(scaled, memory_kib - 1024))
+        params = Argon2Params(
+            time_cost=1, memory_cost_kib=memory_kib, parallelism=parallelism
+        )
+        elapsed = run(params)
+
+    # Passes scale roughly linearly; estimate, then back off if over.
+    time_cost = min(max_time_cost, max(1, int(target_s / elapsed)))
+    while time_cost > 1:
+        candidate = Argon2Params(
+            time_cost=time_cost,
+            memory_cost_kib=memory_kib,
+            parallelism=parallelism,
+        )
+        if run(candidate) <= target_s:
+            return candidate
+        time_cost -= 1
+    return params
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark this host and print Argon2 settings."
+    )
+    parser.add_argument("--target-ms", type=int, default=50)
+    parser.add_argument(
+        "--max-memory-kib", type=int, default=ARGON2_MEMORY_COST_KIB
+    )
+    parser.add_argument("--parallelism", type=int, default=ARGON2_PARALLELISM)
+    args = parser.parse_args(argv)
+
+    params = calibrate_argon2(
+        target_ms=args.target_ms,
+        max_memory_kib=args.max_memory_kib,
+        parallelism=args.parallelism,
+    )
+    elapsed_ms = measure_argon2(params) * 1000
+    sys.stdout.write(
+        f"# measured {elapsed_ms:.1f} ms (target {args.target_ms} ms)\n"
+        f"ARGON2_TIME_COST={params.time_cost}\n"
+        f"ARGON2_MEMORY_COST_KIB={params.memory_cost_kib}\n"
+        f"ARGON2_PARALLELISM={params.parallelism}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,4 +5,7 @@ __all__: tuple[str, ...] = (
     "cache_codec",
     "jwt",
     "refresh_store",
+    "role_permissions",
+    "user_cache",
+    "user_resolver",
 )
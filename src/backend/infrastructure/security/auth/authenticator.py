@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 
 from uuid_utils.compat import UUID
 
+from backend.application.common.exceptions.storage import (
+    NotFoundStorageError,
+    StorageError,
+)
 from backend.application.common.interfaces.auth.ports import (
     Authenticator,
     derive_auth_flags,
@@ -20,25 +26,48 @@ from backend.application.common.interfaces.ports.persistence.rbac_adapter import
 from backend.application.common.interfaces.ports.persistence.users_adapter import (
     UsersAdapter,
 )
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
+from backend.domain.core.entities.user import User
+from backend.domain.core.types.rbac import PermissionCode
 
 
 @dataclass(slots=True)
 class AuthenticatorImpl(Authenticator):
     users: UsersAdapter
     rbac: RbacAdapter
+    role_permissions: RolePermissionIndex | None = None
+
+    async def _load(
+        self: AuthenticatorImpl, user_id: UUID
+    ) -> tuple[User, frozenset[PermissionCode]] | None:
+        index = self.role_permissions
+        if index is not None and index.loaded:
+            result = await self.users.get_by_id(user_id)
+            if result.is_err():
+                _raise_unless_missing(result.unwrap_err())
+                return None
+            user = result.unwrap()
+            resolved = index.resolve(user.roles)
+            if resolved is not None:
+                return user, resolved
+        # Index not loaded yet, or it predates one of the user's roles.
+        access_result = await self.users.get_with_permissions(user_id)
+        if access_result.is_err():
+            _raise_unless_missing(access_result.unwrap_err())
+            return None
+        user, permissions = access_result.unwrap()
+        return user, frozenset(permissions)
 
     async def authenticate(
         self: AuthenticatorImpl, user_id: UUID
     ) -> AuthUser | None:
-        result = await self.users.get_by_id(user_id)
-        if result.is_err():
-            return None
-        user = result.unwrap()
-        permissions_result = await self.rbac.get_user_permission_codes(user_id)
-        if permissions_result.is_err():
+        loaded = await self._load(user_id)
+        if loaded is None:
             return None
+        user, permission_codes = loaded
         role_codes = frozenset(user.roles)
-        permission_codes = frozenset(permissions_result.unwrap())
         is_admin, is_superuser = derive_auth_flags(role_codes)
         return AuthUser(
             id=user.id,
@@ -53,9 +82,61 @@ class AuthenticatorImpl(Authenticator):
     async def get_permission_for(
         self: AuthenticatorImpl, user_id: UUID, spec: PermissionSpec
     ) -> Permission:
-        auth_user = await self.authenticate(user_id)
-        if auth_user is None or not auth_user.is_active:
-            return Permission(allowed=False)
+        return _permission_for(await self.authenticate(user_id), spec)
+
+
+@dataclass(slots=True)
+class ReplicaFirstAuthenticator(Authenticator):
+    """Loads from a replica; a miss is re-checked on the primary.
+
+    Users pinned to the primary (recent writes, role changes) skip the
+    replica, which may still serve their pre-change roles.
+    """
+
+    replica: Authenticator
+    primary: Callable[[], AbstractAsyncContextManager[Authenticator]]
+    on_lag: Callable[[UUID], Awaitable[None]]
+    pinned: Callable[[UUID], Awaitable[bool]]
+
+    async def authenticate(
+        self: ReplicaFirstAuthenticator, user_id: UUID
+    ) -> AuthUser | None:
+        if await self.pinned(user_id):
+            async with self.primary() as primary:
+                return await primary.authenticate(user_id)
+        try:
+            auth_user = await self.replica.authenticate(user_id)
+        except StorageError:
+            async with self.primary() as primary:
+                return await primary.authenticate(user_id)
+        if auth_user is not None:
+            return auth_user
+        # Typically a user created moments ago that has not replicated yet.
+        async with self.primary() as primary:
+            auth_user = await primary.authenticate(user_id)
+        if auth_user is not None:
+            await self.on_lag(user_id)
+        return auth_user
+
+    async def get_permission_for(
+        self: ReplicaFirstAuthenticator, user_id: UUID, spec: PermissionSpec
+    ) -> Permission:
+        return _permission_for(await self.authenticate(user_id), spec)
+
+
+def _raise_unless_missing(error: StorageError) -> None:
+    # Only a real miss means "no such user"; a failed read must not look
+    # like one, or callers would evict and reject users the database
+    # simply could not serve right now.
+    if not isinstance(error, NotFoundStorageError):
+        raise error
+
+
+def _permission_for(
+    auth_user: AuthUser | None, spec: PermissionSpec
+) -> Permission:
+    if auth_user is None or not auth_user.is_active:
+        return Permission(allowed=False)
 
-        allowed = has_permission(auth_user.permission_codes, spec.code)
-        return Permission(allowed=allowed)
+    allowed = has_permission(auth_user.permission_mask, spec.code)
+    return Permission(allowed=allowed)
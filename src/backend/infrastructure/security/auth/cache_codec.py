@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TypeGuard
+from typing import Final, TypeGuard
 
 import msgspec
 from uuid_utils.compat import UUID
@@ -9,28 +9,84 @@ from uuid_utils.compat import UUID
 from backend.application.common.interfaces.auth.ports import (
     derive_auth_flags,
 )
-from backend.application.common.interfaces.auth.types import AuthUser
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.domain.core.constants.permission_codes import (
+    mask_to_permissions,
+)
 from backend.domain.core.types.rbac import PermissionCode, RoleCode
 
+_SCHEMA_V1: Final[bytes] = b"\x01"
+
+
+class _CachedUserV1(msgspec.Struct, array_like=True, frozen=True):
+    id: UUID
+    role_codes: list[RoleCode]
+    permission_mask: int
+    is_active: bool
+    email: str | None
+    refresh_at: float
+    load_s: float
+
+
+_ENCODER: Final[msgspec.msgpack.Encoder] = msgspec.msgpack.Encoder(
+    uuid_format="bytes"
+)
+_DECODER_V1: Final[msgspec.msgpack.Decoder[_CachedUserV1]] = (
+    msgspec.msgpack.Decoder(_CachedUserV1)
+)
+
+
+def encode_cached_user(entry: CachedAuthUser) -> bytes:
+    user = entry.user
+    payload = _CachedUserV1(
+        id=user.id,
+        role_codes=list(user.role_codes),
+        permission_mask=user.permission_mask,
+        is_active=user.is_active,
+        email=user.email,
+        refresh_at=entry.refresh_at,
+        load_s=entry.load_s,
+    )
+    return _SCHEMA_V1 + _ENCODER.encode(payload)
 
-def encode_cached_user(user: AuthUser) -> str:
-    payload: dict[str, object] = {
-        "id": str(user.id),
-        "role_codes": list(user.role_codes),
-        "permission_codes": [
-            permission.value for permission in user.permission_codes
-        ],
-        "is_active": user.is_active,
-        "is_superuser": user.is_superuser,
-        "is_admin": user.is_admin,
-        "email": user.email,
-    }
-    return msgspec.json.encode(payload).decode("utf-8")
 
+def decode_cached_user(raw: bytes) -> CachedAuthUser | None:
+    if raw[:1] == _SCHEMA_V1:
+        return _decode_v1(memoryview(raw)[1:])
+    # Entries written before the binary format are JSON objects.
+    if raw[:1] == b"{":
+        return _decode_legacy_json(raw)
+    return None
 
-def decode_cached_user(raw: str) -> AuthUser | None:
+
+def _decode_v1(payload: memoryview) -> CachedAuthUser | None:
+    try:
+        data = _DECODER_V1.decode(payload)
+        permission_codes = mask_to_permissions(data.permission_mask)
+    except (msgspec.DecodeError, ValueError):
+        return None
+    role_codes = frozenset(data.role_codes)
+    is_admin, is_superuser = derive_auth_flags(role_codes)
+    user = AuthUser(
+        id=data.id,
+        role_codes=role_codes,
+        permission_codes=permission_codes,
+        is_active=data.is_active,
+        is_superuser=is_superuser,
+        is_admin=is_admin,
+        email=data.email,
+    )
+    return CachedAuthUser(
+        user=user, refresh_at=data.refresh_at, load_s=data.load_s
+    )
+
+
+def _decode_legacy_json(raw: bytes) -> CachedAuthUser | None:
     try:
-        raw_data = msgspec.json.decode(raw.encode("utf-8"))
+        raw_data = msgspec.json.decode(raw)
     except msgspec.DecodeError:
         return None
     data = _to_str_key_dict(raw_data)
@@ -40,14 +96,15 @@ def decode_cached_user(raw: str) -> AuthUser | None:
     roles = data.get("role_codes")
     is_active = data.get("is_active")
     email = data.get("email")
-    permissions = data.get("permission_codes")
     if (
         not isinstance(user_id, str)
         or not _is_object_list(roles)
-        or not _is_object_list(permissions)
         or not isinstance(is_active, bool)
     ):
         return None
+    permission_set = _decode_permissions(data)
+    if permission_set is None:
+        return None
     try:
         uid = UUID(user_id)
     except ValueError:
@@ -58,22 +115,50 @@ def decode_cached_user(raw: str) -> AuthUser | None:
         if role is None:
             return None
         role_set.add(role)
-    permission_set: set[PermissionCode] = set()
-    for raw_permission in permissions:
-        permission = _safe_permission(raw_permission)
-        if permission is None:
-            return None
-        permission_set.add(permission)
     is_admin, is_superuser = derive_auth_flags(frozenset(role_set))
-    return AuthUser(
+    user = AuthUser(
         id=uid,
         role_codes=frozenset(role_set),
-        permission_codes=frozenset(permission_set),
+        permission_codes=permission_set,
         is_active=is_active,
         is_superuser=is_superuser,
         is_admin=is_admin,
         email=email if isinstance(email, str) else None,
     )
+    # Entries written before soft expiry existed are treated as stale.
+    return CachedAuthUser(
+        user=user,
+        refresh_at=_safe_seconds(data.get("refresh_at")),
+        load_s=_safe_seconds(data.get("load_s")),
+    )
+
+
+def _decode_permissions(
+    data: Mapping[str, object],
+) -> frozenset[PermissionCode] | None:
+    mask = data.get("permission_mask")
+    if isinstance(mask, int) and not isinstance(mask, bool):
+        try:
+            return mask_to_permissions(mask)
+        except ValueError:
+            return None
+    # Entries written before the mask encoding carry a list of codes.
+    permissions = data.get("permission_codes")
+    if not _is_object_list(permissions):
+        return None
+    permission_set: set[PermissionCode] = set()
+    for raw_permission in permissions:
+        permission = _safe_permission(raw_permission)
+        if permission is None:
+            return None
+        permission_set.add(permission)
+    return frozenset(permission_set)
+
+
+def _safe_seconds(raw: object) -> float:
+    if isinstance(raw, bool) or not isinstance(raw, (int, float)):
+        return 0.0
+    return float(raw)
 
 
 def _safe_role(raw: object) -> RoleCode | None:
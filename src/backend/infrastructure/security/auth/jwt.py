@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import math
+import time
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -7,8 +10,8 @@ from typing import Final
 from uuid import uuid4
 
 from jwt import PyJWTError
-from jwt import decode as _jwt_decode_impl
-from jwt import encode as _jwt_encode_impl
+from jwt import decode as jwt_decode
+from jwt import encode as jwt_encode
 from uuid_utils.compat import UUID
 
 from backend.application.common.exceptions.application import (
@@ -20,75 +23,25 @@ from backend.application.common.interfaces.auth.ports import (
     JwtVerifier,
 )
 from backend.application.handlers.result import Result, ResultImpl
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
 
 _REQUIRED_CLAIMS: Final[list[str]] = ["exp", "iat", "sub", "iss", "aud"]
 
+type AccessTokenCache = LocalTTLCache[bytes, tuple[UUID, int]]
 
-def _jwt_encode_raw(
-    payload: Mapping[str, object], key: str, *, algorithm: str
-) -> str:
-    payload_dict: dict[str, object] = dict(payload)
-    return _jwt_encode_impl(payload_dict, key, algorithm=algorithm)
-
-
-def _jwt_decode_raw(
-    token: str,
-    key: str,
-    *,
-    algorithms: list[str],
-    audience: str,
-    issuer: str,
-    options: dict[str, object],
-) -> Mapping[str, object]:
-    raw = _jwt_decode_impl(
-        token,
-        key,
-        algorithms=algorithms,
-        audience=audience,
-        issuer=issuer,
-        options=options,
-    )
-    if not isinstance(raw, Mapping):
-        raise TypeError("Invalid token payload")
-    out: dict[str, object] = {}
-    for key_item, value in raw.items():
-        out[str(key_item)] = value
-    return out
-
-
-def _jwt_encode(
-    payload: Mapping[str, object], key: str, *, algorithm: str
-) -> str:
-    return _jwt_encode_raw(payload, key, algorithm=algorithm)
-
-
-def _jwt_decode(
-    token: str,
-    key: str,
-    *,
-    algorithms: list[str],
-    audience: str,
-    issuer: str,
-    options: dict[str, object],
-) -> dict[str, object]:
-    data = _jwt_decode_raw(
-        token,
-        key,
-        algorithms=algorithms,
-        audience=audience,
-        issuer=issuer,
-        options=options,
-    )
-    out: dict[str, object] = {}
-    for key_item, value in data.items():
-        out[str(key_item)] = value
-    return out
-
-
-def _access_error(message: str) -> Result[UUID, AppError]:
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _access_error(message: str) -> Result[tuple[UUID, int], AppError]:
     return ResultImpl.err_app(UnauthenticatedError(message))
 
 
+def _access_subject(claims: tuple[UUID, int]) -> UUID:
+    return claims[0]
+
+
 def _refresh_error(message: str) -> Result[tuple[UUID, str, str], AppError]:
     return ResultImpl.err_app(UnauthenticatedError(message))
 
@@ -112,10 +65,21 @@ class JwtConfig:
 @dataclass(frozen=True, slots=True)
 class JwtImpl(JwtIssuer, JwtVerifier):
     cfg: JwtConfig
+    access_cache: AccessTokenCache | None = None
 
     def _now(self: JwtImpl) -> datetime:
         return datetime.now(tz=UTC)
 
+    def _decode(self: JwtImpl, token: str) -> Mapping[str, object]:
+        return jwt_decode(
+            token,
+            self.cfg.secret,
+            algorithms=[self.cfg.alg],
+            audience=self.cfg.audience,
+            issuer=self.cfg.issuer,
+            options={"require": _REQUIRED_CLAIMS},
+        )
+
     def issue_access(self: JwtImpl, *, user_id: UUID) -> str:
         now = self._now()
         payload = {
@@ -127,7 +91,7 @@ class JwtImpl(JwtIssuer, JwtVerifier):
             "iat": int(now.timestamp()),
             "exp": int((now + self.cfg.access_ttl).timestamp()),
         }
-        return _jwt_encode(payload, self.cfg.secret, algorithm=self.cfg.alg)
+        return jwt_encode(payload, self.cfg.secret, algorithm=self.cfg.alg)
 
     def issue_refresh(
         self: JwtImpl, *, user_id: UUID, fingerprint: str
@@ -144,19 +108,30 @@ class JwtImpl(JwtIssuer, JwtVerifier):
             "iat": int(now.timestamp()),
             "exp": int((now + self.cfg.refresh_ttl).timestamp()),
         }
-        token = _jwt_encode(payload, self.cfg.secret, algorithm=self.cfg.alg)
+        token = jwt_encode(payload, self.cfg.secret, algorithm=self.cfg.alg)
         return token, jti
 
     def verify_access(self: JwtImpl, token: str) -> Result[UUID, AppError]:
+        cache = self.access_cache
+        if cache is None:
+            return self._verify_access(token).map(_access_subject)
+        digest = _token_digest(token)
+        now = time.time()
+        cached = cache.get(digest)
+        if cached is not None and cached[1] > now:
+            return ResultImpl.ok(cached[0], AppError)
+        result = self._verify_access(token)
+        if result.is_ok():
+            user_id, exp = result.unwrap()
+            # Only verified tokens are cached, and never past their own exp.
+            cache.set(digest, (user_id, exp), ttl_s=exp - now)
+        return result.map(_access_subject)
+
+    def _verify_access(
+        self: JwtImpl, token: str
+    ) -> Result[tuple[UUID, int], AppError]:
         try:
-            data = _jwt_decode(
-                token,
-                self.cfg.secret,
-                algorithms=[self.cfg.alg],
-                audience=self.cfg.audience,
-                issuer=self.cfg.issuer,
-                options={"require": _REQUIRED_CLAIMS},
-            )
+            data = self._decode(token)
         except PyJWTError:
             return _access_error("Invalid access token")
 
@@ -164,10 +139,18 @@ class JwtImpl(JwtIssuer, JwtVerifier):
             return _access_error("Invalid access token")
         sub = data.get("sub")
         jti = data.get("jti")
-        if not isinstance(sub, str) or not isinstance(jti, str) or not jti:
+        exp = data.get("exp")
+        if (
+            not isinstance(sub, str)
+            or not isinstance(jti, str)
+            or not jti
+            or not isinstance(exp, int | float)
+        ):
             return _access_error("Invalid access token")
         try:
-            return ResultImpl.ok(UUID(sub), AppError)
+            # RFC 7519 allows a fractional exp; flooring keeps the cache
+            # entry from outliving the token.
+            return ResultImpl.ok((UUID(sub), math.floor(exp)), AppError)
         except ValueError:
             return _access_error("Invalid access token")
 
@@ -175,14 +158,7 @@ class JwtImpl(JwtIssuer, JwtVerifier):
         self: JwtImpl, token: str
     ) -> Result[tuple[UUID, str, str], AppError]:
         try:
-            data = _jwt_decode(
-                token,
-                self.cfg.secret,
-                algorithms=[self.cfg.alg],
-                audience=self.cfg.audience,
-                issuer=self.cfg.issuer,
-                options={"require": _REQUIRED_CLAIMS},
-            )
+            data = self._decode(token)
         except PyJWTError:
             return _refresh_error("Invalid refresh token")
 
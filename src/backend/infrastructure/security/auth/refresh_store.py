@@ -1,16 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Final
 
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 from uuid_utils.compat import UUID
 
-from backend.application.common.interfaces.auth.ports import RefreshStore
+from backend.application.common.interfaces.auth.ports import (
+    RefreshStore,
+    RefreshSwapOutcome,
+)
 from backend.application.common.interfaces.ports.cache import StrCache
 from backend.application.common.tools.refresh_tokens import refresh_key
 
+# KEYS[1]: refresh key. ARGV: expected jti ('' = unconditional), new jti,
+# ttl seconds. Returns 0 = swapped, 1 = missing, 2 = replay (deleted).
+REFRESH_CAS_LUA: Final[str] = """
+local expected = ARGV[1]
+if expected ~= '' then
+    local current = redis.call('GET', KEYS[1])
+    if not current then
+        return 1
+    end
+    if current ~= expected then
+        redis.call('DEL', KEYS[1])
+        return 2
+    end
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 0
+"""
+
+_CAS_OUTCOMES: Final[dict[int, RefreshSwapOutcome]] = {
+    0: "ok",
+    1: "missing",
+    2: "replay",
+}
+
 
 @dataclass(slots=True)
-class RefreshStoreImpl(RefreshStore):
+class RefreshStoreImpl:
     cache: StrCache
 
     async def get(
@@ -36,3 +66,27 @@ class RefreshStoreImpl(RefreshStore):
         self: RefreshStoreImpl, *, user_id: UUID, fingerprint: str
     ) -> None:
         await self.cache.delete(refresh_key(user_id, fingerprint))
+
+
+@dataclass(slots=True)
+class RedisRefreshStore(RefreshStoreImpl, RefreshStore):
+    client: Redis
+    _cas: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self: RedisRefreshStore) -> None:
+        self._cas = self.client.register_script(REFRESH_CAS_LUA)
+
+    async def compare_and_swap(
+        self: RedisRefreshStore,
+        *,
+        user_id: UUID,
+        fingerprint: str,
+        expected: str,
+        value: str,
+        ttl_s: int,
+    ) -> RefreshSwapOutcome:
+        code = await self._cas(
+            keys=[refresh_key(user_id, fingerprint)],
+            args=[expected, value, ttl_s],
+        )
+        return _CAS_OUTCOMES[int(code)]
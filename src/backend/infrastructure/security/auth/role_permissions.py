@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
+from backend.infrastructure.persistence.manager import TransactionManagerImpl
+from backend.infrastructure.persistence.persistence_gateway import (
+    PersistenceGatewayImpl,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Publish anything here after changing roles or role_permissions outside
+# the app (migrations, seeds, SQL) so every worker picks it up.
+ROLE_PERMISSIONS_RELOAD_CHANNEL: Final[str] = "auth:role-permissions:reload"
+
+
+@dataclass(slots=True)
+class RolePermissionIndexLoader:
+    index: RolePermissionIndex
+    session_factory: async_sessionmaker[AsyncSession]
+
+    async def reload(self: RolePermissionIndexLoader) -> bool:
+        try:
+            async with self.session_factory() as session:
+                gateway = PersistenceGatewayImpl(
+                    TransactionManagerImpl(session)
+                )
+                result = await gateway.rbac.list_role_permissions()
+        except Exception:
+            _LOGGER.exception(
+                "Role permission index reload failed; keeping version %d",
+                self.index.version,
+            )
+            return False
+        if result.is_err():
+            _LOGGER.warning(
+                "Role permission index reload failed; keeping version %d",
+                self.index.version,
+            )
+            return False
+        self.index.replace(result.unwrap())
+        return True
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.interfaces.ports.cache import (
+    AuthUserCache,
+    BytesCache,
+)
+from backend.application.common.tools.auth_cache import auth_user_key
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.security.auth.cache_codec import (
+    decode_cached_user,
+    encode_cached_user,
+)
+
+
+@dataclass(slots=True)
+class TieredAuthUserCache(AuthUserCache):
+    local: LocalTTLCache[UUID, CachedAuthUser]
+    remote: BytesCache
+    ttl_s: int
+    stale_ttl_s: int = 0
+    clock: Callable[[], float] = field(default=time.time)
+
+    async def get(
+        self: TieredAuthUserCache, user_id: UUID, *, shared_only: bool = False
+    ) -> CachedAuthUser | None:
+        if not shared_only:
+            entry = self.local.get(user_id)
+            if entry is not None:
+                return entry
+        raw = await self.remote.get(auth_user_key(user_id))
+        if raw is None:
+            return None
+        entry = decode_cached_user(raw)
+        if entry is None:
+            return None
+        self.local.set(user_id, entry, weight=len(raw))
+        return entry
+
+    async def set(
+        self: TieredAuthUserCache, user: AuthUser, *, load_s: float = 0.0
+    ) -> None:
+        entry = CachedAuthUser(
+            user=user, refresh_at=self.clock() + self.ttl_s, load_s=load_s
+        )
+        raw = encode_cached_user(entry)
+        self.local.set(user.id, entry, weight=len(raw))
+        await self.remote.set(
+            auth_user_key(user.id),
+            raw,
+            ttl_s=self.ttl_s + self.stale_ttl_s,
+        )
+
+    async def invalidate(self: TieredAuthUserCache, user_id: UUID) -> None:
+        self.local.delete(user_id)
+        await self.remote.delete(auth_user_key(user_id))
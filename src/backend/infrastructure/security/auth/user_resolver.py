@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.auth.ports import Authenticator
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.interfaces.ports.cache import AuthUserCache
+from backend.application.common.tools.auth_cache import AuthCacheInvalidator
+from backend.infrastructure.tools.single_flight import SingleFlight
+
+type AuthenticatorFactory = Callable[
+    [], AbstractAsyncContextManager[Authenticator]
+]
+
+
+@dataclass(slots=True)
+class AuthUserResolver:
+    """Cache-aside lookup serving stale entries while refreshing early."""
+
+    cache: AuthUserCache
+    loads: SingleFlight[UUID, AuthUser | None]
+    authenticators: AuthenticatorFactory
+    invalidator: AuthCacheInvalidator
+    beta: float = 1.0
+    clock: Callable[[], float] = field(default=time.time)
+    rng: random.Random = field(default_factory=random.Random)
+    _refreshes: set[asyncio.Task[None]] = field(default_factory=set)
+
+    async def resolve(
+        self: AuthUserResolver, user_id: UUID
+    ) -> AuthUser | None:
+        entry = await self.cache.get(user_id)
+        if entry is None:
+            return await self.loads.run(user_id, lambda: self._fetch(user_id))
+        if self._should_refresh(entry):
+            self._schedule_refresh(user_id, entry.refresh_at)
+        return entry.user
+
+    async def aclose(self: AuthUserResolver) -> None:
+        for task in self._refreshes:
+            task.cancel()
+        await asyncio.gather(*self._refreshes, return_exceptions=True)
+
+    def _should_refresh(self: AuthUserResolver, entry: CachedAuthUser) -> bool:
+        now = self.clock()
+        if now >= entry.refresh_at:
+            return True
+        if entry.load_s <= 0 or self.beta <= 0:
+            return False
+        # XFetch: recompute early with a probability rising towards expiry.
+        gap = -entry.load_s * self.beta * math.log(1.0 - self.rng.random())
+        return now + gap >= entry.refresh_at
+
+    def _schedule_refresh(
+        self: AuthUserResolver, user_id: UUID, seen_refresh_at: float
+    ) -> None:
+        if self.loads.is_running(user_id):
+            return
+        task = asyncio.create_task(
+            self._refresh(user_id, seen_refresh_at),
+            name=f"auth-user-refresh:{user_id}",
+        )
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    async def _refresh(
+        self: AuthUserResolver, user_id: UUID, seen_refresh_at: float
+    ) -> None:
+        try:
+            await self.loads.run(
+                user_id, lambda: self._revalidate(user_id, seen_refresh_at)
+            )
+        except Exception:
+            return
+
+    async def _revalidate(
+        self: AuthUserResolver, user_id: UUID, seen_refresh_at: float
+    ) -> AuthUser | None:
+        # Another worker may already have refreshed the shared tier.
+        shared = await self.cache.get(user_id, shared_only=True)
+        if shared is not None and shared.refresh_at > seen_refresh_at:
+            return shared.user
+        auth_user = await self._fetch(user_id)
+        if auth_user is None or not auth_user.is_active:
+            # Through the bus too, so no worker keeps serving a local copy.
+            await self.invalidator.invalidate_user(user_id)
+        return auth_user
+
+    async def _fetch(self: AuthUserResolver, user_id: UUID) -> AuthUser | None:
+        started = time.perf_counter()
+        async with self.authenticators() as authenticator:
+            auth_user = await authenticator.authenticate(user_id)
+        load_s = time.perf_counter() - started
+        if auth_user is not None and auth_user.is_active:
+            await self.cache.set(auth_user, load_s=load_s)
+        return auth_user
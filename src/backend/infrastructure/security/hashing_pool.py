@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Literal
+
+from backend.application.common.exceptions.auth import (
+    PasswordHashingBusyError,
+)
+
+type HashingExecutorKind = Literal["thread", "process"]
+
+
+class HashingPool:
+    """Dedicated executor for password hashing with bounded admission."""
+
+    __slots__: tuple[str, ...] = (
+        "_admitted",
+        "_executor",
+        "_max_admitted",
+        "_slots",
+        "rejected",
+        "retry_after_s",
+    )
+
+    def __init__(
+        self: HashingPool,
+        executor: Executor,
+        *,
+        max_concurrency: int,
+        max_queue: int,
+        retry_after_s: int = 1,
+    ) -> None:
+        if max_concurrency <= 0 or max_queue < 0:
+            raise ValueError("Hashing pool limits must be positive")
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._max_admitted = max_concurrency + max_queue
+        self._admitted = 0
+        self.rejected = 0
+        self.retry_after_s = retry_after_s
+
+    @classmethod
+    def create(
+        cls: type[HashingPool],
+        kind: HashingExecutorKind,
+        *,
+        workers: int,
+        max_queue: int,
+        retry_after_s: int = 1,
+    ) -> HashingPool:
+        executor: Executor
+        if kind == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password-hash"
+            )
+        return cls(
+            executor,
+            max_concurrency=workers,
+            max_queue=max_queue,
+            retry_after_s=retry_after_s,
+        )
+
+    @property
+    def admitted(self: HashingPool) -> int:
+        return self._admitted
+
+    async def run[*Ts, T](
+        self: HashingPool, func: Callable[[*Ts], T], *args: *Ts
+    ) -> T:
+        if self._admitted >= self._max_admitted:
+            self.rejected += 1
+            raise PasswordHashingBusyError(retry_after_s=self.retry_after_s)
+        self._admitted += 1
+        try:
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor, partial(func, *args)
+                )
+        finally:
+            self._admitted -= 1
+
+    def shutdown(self: HashingPool) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
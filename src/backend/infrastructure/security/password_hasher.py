@@ -2,19 +2,26 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Final
 
-from argon2 import PasswordHasher, Type
+from argon2 import (
+    PasswordHasher,
+    Type,
+    extract_parameters,
+)
 from argon2.exceptions import (
     HashingError,
     InvalidHashError,
     VerifyMismatchError,
 )
+from argon2.low_level import ARGON2_VERSION
 
 from backend.domain.core.policies.identity import (
     MAX_PASSWORD_LENGTH,
     normalize_password,
 )
+from backend.infrastructure.security.hashing_pool import HashingPool
 
 ARGON2_TIME_COST: Final[int] = 3
 ARGON2_MEMORY_COST_KIB: Final[int] = 65536
@@ -23,17 +30,46 @@ ARGON2_HASH_LEN: Final[int] = 32
 ARGON2_SALT_LEN: Final[int] = 16
 
 
-class Argon2PasswordHasher:
-    def __init__(self: Argon2PasswordHasher) -> None:
-        self._hasher = PasswordHasher(
-            time_cost=ARGON2_TIME_COST,
-            memory_cost=ARGON2_MEMORY_COST_KIB,
-            parallelism=ARGON2_PARALLELISM,
-            hash_len=ARGON2_HASH_LEN,
-            salt_len=ARGON2_SALT_LEN,
+@dataclass(frozen=True, slots=True)
+class Argon2Params:
+    time_cost: int = ARGON2_TIME_COST
+    memory_cost_kib: int = ARGON2_MEMORY_COST_KIB
+    parallelism: int = ARGON2_PARALLELISM
+    hash_len: int = ARGON2_HASH_LEN
+    salt_len: int = ARGON2_SALT_LEN
+
+    @property
+    def work(self: Argon2Params) -> int:
+        return self.time_cost * self.memory_cost_kib
+
+    def build_hasher(self: Argon2Params) -> PasswordHasher:
+        return PasswordHasher(
+            time_cost=self.time_cost,
+            memory_cost=self.memory_cost_kib,
+            parallelism=self.parallelism,
+            hash_len=self.hash_len,
+            salt_len=self.salt_len,
             type=Type.ID,
         )
 
+
+DEFAULT_ARGON2_PARAMS: Final[Argon2Params] = Argon2Params()
+
+
+class Argon2PasswordHasher:
+    def __init__(
+        self: Argon2PasswordHasher,
+        pool: HashingPool | None = None,
+        params: Argon2Params = DEFAULT_ARGON2_PARAMS,
+    ) -> None:
+        self._pool = pool
+        self._params = params
+        self._hasher = params.build_hasher()
+
+    @property
+    def params(self: Argon2PasswordHasher) -> Argon2Params:
+        return self._params
+
     def _normalize(self: Argon2PasswordHasher, raw_password: str) -> str:
         return normalize_password(raw_password)
 
@@ -47,7 +83,7 @@ class Argon2PasswordHasher:
                 f"Password too long (max {MAX_PASSWORD_LENGTH} characters)"
             )
         try:
-            return await _run_sync1(self._hasher.hash, normalized)
+            return await self._run(self._hasher.hash, normalized)
         except HashingError as e:
             raise RuntimeError(f"Password hashing failed: {e}") from e
 
@@ -58,7 +94,7 @@ class Argon2PasswordHasher:
         if self._too_long(normalized):
             return False
         try:
-            return await _run_sync2(
+            return await self._run(
                 self._hasher.verify, hashed_password, normalized
             )
         except VerifyMismatchError:
@@ -69,24 +105,25 @@ class Argon2PasswordHasher:
     async def needs_rehash(
         self: Argon2PasswordHasher, hashed_password: str
     ) -> bool:
-        def _compute() -> bool:
-            try:
-                return bool(self._hasher.check_needs_rehash(hashed_password))
-            except InvalidHashError:
-                return True
-
-        return await _run_sync0(_compute)
-
-
-async def _run_sync0[T](func: Callable[[], T]) -> T:
-    return await asyncio.to_thread(func)
-
-
-async def _run_sync1[A, T](func: Callable[[A], T], arg: A) -> T:
-    return await asyncio.to_thread(func, arg)
-
-
-async def _run_sync2[A, B, T](
-    func: Callable[[A, B], T], arg1: A, arg2: B
-) -> T:
-    return await asyncio.to_thread(func, arg1, arg2)
+        # Only parses the encoded parameters; cheaper inline than a hop.
+        try:
+            current = extract_parameters(hashed_password)
+        except InvalidHashError:
+            return True
+        if (
+            current.type is not Type.ID
+            or current.version != ARGON2_VERSION
+            or current.hash_len < self._params.hash_len
+        ):
+            return True
+        # Calibrated hosts trade memory for passes differently; only
+        # upgrade strictly cheaper hashes so a mixed fleet does not keep
+        # rewriting the same user back and forth.
+        return current.time_cost * current.memory_cost < self._params.work
+
+    async def _run[*Ts, T](
+        self: Argon2PasswordHasher, func: Callable[[*Ts], T], *args: *Ts
+    ) -> T:
+        if self._pool is None:
+            return await asyncio.to_thread(func, *args)
+        return await self._pool.run(func, *args)
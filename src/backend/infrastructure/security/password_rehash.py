@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.auth import (
+    PasswordHashingBusyError,
+)
+from backend.application.common.interfaces.auth.ports import (
+    PasswordRehashScheduler,
+)
+from backend.domain.core.services.users import apply_user_patch
+from backend.domain.ports.security.password_hasher import PasswordHasherPort
+from backend.infrastructure.persistence.manager import TransactionManagerImpl
+from backend.infrastructure.persistence.persistence_gateway import (
+    PersistenceGatewayImpl,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BackgroundPasswordRehasher(PasswordRehashScheduler):
+    """Upgrades outdated password hashes off the login request path."""
+
+    hasher: PasswordHasherPort
+    session_factory: async_sessionmaker[AsyncSession]
+    max_pending: int = 64
+    _pending: dict[UUID, asyncio.Task[None]] = field(default_factory=dict)
+
+    def schedule(
+        self: BackgroundPasswordRehasher,
+        *,
+        user_id: UUID,
+        raw_password: str,
+        current_hash: str,
+    ) -> None:
+        # Dropped jobs are retried naturally on the user's next login.
+        if user_id in self._pending or len(self._pending) >= self.max_pending:
+            return
+        task = asyncio.create_task(
+            self._rehash(user_id, raw_password, current_hash),
+            name=f"password-rehash:{user_id}",
+        )
+        self._pending[user_id] = task
+        task.add_done_callback(lambda _: self._pending.pop(user_id, None))
+
+    async def drain(self: BackgroundPasswordRehasher) -> None:
+        await asyncio.gather(*self._pending.values(), return_exceptions=True)
+
+    async def aclose(self: BackgroundPasswordRehasher) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        await self.drain()
+
+    async def _rehash(
+        self: BackgroundPasswordRehasher,
+        user_id: UUID,
+        raw_password: str,
+        current_hash: str,
+    ) -> None:
+        try:
+            new_hash = await self.hasher.hash(raw_password)
+            async with self.session_factory() as session:
+                manager = TransactionManagerImpl(session)
+                users = PersistenceGatewayImpl(manager).users
+                async with manager.transaction():
+                    user = (
+                        await users.get_by_id(user_id, include_roles=False)
+                    ).unwrap()
+                    # The password changed since login verified it.
+                    if user.password != current_hash:
+                        return
+                    apply_user_patch(user, password_hash=new_hash)
+                    (await users.save(user, include_roles=False)).unwrap()
+        except PasswordHashingBusyError:
+            return
+        except Exception:
+            _LOGGER.exception("Password rehash failed for user %s", user_id)
@@ -3,5 +3,6 @@ from __future__ import annotations
 __all__: tuple[str, ...] = (
     "msgspec_codec",
     "msgspec_convert",
+    "single_flight",
     "storage_result",
 )
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import inspect
 import uuid
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from types import GenericAlias
 from typing import Final, Literal, Protocol, runtime_checkable
 
 import msgspec
@@ -94,15 +95,32 @@ def _row_dec_hook(tp: type[object], obj: object) -> object:
     return decoded
 
 
-def convert_record[T](row: Mapping[str, object], record_type: type[T]) -> T:
+# Records are ``array_like`` and decoded from row tuples: no per-row
+# dict, no field-name lookups, and driver-typed values (UUID, bool, str)
+# are taken as is; ``_row_dec_hook`` only sees values that need coercing.
+def convert_row[T](row: Iterable[object], record_type: type[T]) -> T:
     return msgspec.convert(
-        dict(row),
+        tuple(row),
         record_type,
         strict=True,
         dec_hook=_row_dec_hook,
     )
 
 
+def convert_rows[T](
+    rows: Iterable[Iterable[object]], record_type: type[T]
+) -> list[T]:
+    # One convert call for the whole batch; per-row calls cost more in
+    # argument handling than in decoding.
+    records: list[T] = msgspec.convert(
+        [tuple(row) for row in rows],
+        GenericAlias(list, (record_type,)),
+        strict=True,
+        dec_hook=_row_dec_hook,
+    )
+    return records
+
+
 class ClosableProxy:
     __slots__: tuple[str, ...] = ("_close_fn", "_target")
 
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+def _consume_exception[T](future: asyncio.Future[T]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent loads of the same key into one in-flight call."""
+
+    __slots__: tuple[str, ...] = ("_inflight", "coalesced")
+
+    def __init__(self: SingleFlight[K, V]) -> None:
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+        self.coalesced = 0
+
+    def __len__(self: SingleFlight[K, V]) -> int:
+        return len(self._inflight)
+
+    def is_running(self: SingleFlight[K, V], key: K) -> bool:
+        return key in self._inflight
+
+    async def run(
+        self: SingleFlight[K, V],
+        key: K,
+        load: Callable[[], Awaitable[V]],
+    ) -> V:
+        while (pending := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leader was cancelled, not us: retry the load.
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        self._inflight[key] = future
+        try:
+            value = await load()
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(value)
+        return value
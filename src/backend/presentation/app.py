@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 
+from dishka import Provider
 from dishka.integrations.fastapi import DishkaRoute
 from environs import Env
 from fastapi import FastAPI
@@ -25,7 +26,7 @@ _PUBLIC_META_FIELDS_BY_CODE: dict[str, tuple[str, ...]] = {
 }
 
 
-def create_app() -> FastAPI:
+def create_app(*overrides: Provider) -> FastAPI:
     register_domain_converters()
     env = Env()
     if os.environ.get("APP_ENV", "").lower() not in {"prod", "production"}:
@@ -38,7 +39,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if docs_enabled else None,
         openapi_url="/openapi.json" if docs_enabled else None,
     )
-    setup_di(app, settings)
+    setup_di(app, settings, *overrides)
     app.router.route_class = DishkaRoute
     app.add_exception_handler(AppError, _app_error_handler)
     app.include_router(api_router)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import Self
 from urllib.parse import urlparse
@@ -12,32 +15,109 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from uuid_utils.compat import UUID
 
 from backend.application.common.interfaces.auth.ports import (
+    Authenticator,
     JwtIssuer,
     JwtVerifier,
+    PasswordRehashScheduler,
     RefreshStore,
 )
-from backend.application.common.interfaces.ports.cache import StrCache
-from backend.application.common.tools.auth_cache import AuthCacheInvalidator
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.interfaces.ports.cache import (
+    AuthCacheInvalidationBus,
+    AuthUserCache,
+    BytesCache,
+    StrCache,
+)
+from backend.application.common.interfaces.ports.rate_limit import (
+    RateLimiter,
+)
+from backend.application.common.tools.auth_cache import (
+    AUTH_USER_INVALIDATION_CHANNEL,
+    AuthCacheInvalidator,
+)
+from backend.application.common.tools.auth_throttle import (
+    AuthThrottle,
+    AuthThrottlePolicy,
+)
 from backend.application.common.tools.refresh_tokens import (
     RefreshTokenService,
 )
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
 from backend.domain.core.types.rbac import RoleCode
 from backend.domain.ports.security.password_hasher import PasswordHasherPort
-from backend.infrastructure.lock.redis_lock import RedisSharedLock
-from backend.infrastructure.persistence.cache.redis import RedisCache
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.persistence.cache.redis import (
+    RedisBytesCache,
+    RedisCache,
+)
+from backend.infrastructure.persistence.cache.redis_pubsub import (
+    RedisInvalidationBus,
+    RedisReloadSignal,
+)
+from backend.infrastructure.persistence.manager import TransactionManagerImpl
+from backend.infrastructure.persistence.persistence_gateway import (
+    PersistenceGatewayImpl,
+)
+from backend.infrastructure.persistence.sqlalchemy.replica import (
+    ReplicaRouter,
+)
 from backend.infrastructure.persistence.sqlalchemy.session_db import (
+    EnginePoolConfig,
     create_engine,
     create_session_factory,
+    prewarm_engine,
+)
+from backend.infrastructure.rate_limit.redis_sliding_window import (
+    RedisSlidingWindowLimiter,
+)
+from backend.infrastructure.security.argon2_calibration import (
+    calibrate_argon2,
 )
-from backend.infrastructure.security.auth.jwt import JwtConfig, JwtImpl
-from backend.infrastructure.security.auth.refresh_store import RefreshStoreImpl
+from backend.infrastructure.security.auth.authenticator import (
+    AuthenticatorImpl,
+    ReplicaFirstAuthenticator,
+)
+from backend.infrastructure.security.auth.jwt import (
+    AccessTokenCache,
+    JwtConfig,
+    JwtImpl,
+)
+from backend.infrastructure.security.auth.refresh_store import (
+    RedisRefreshStore,
+)
+from backend.infrastructure.security.auth.role_permissions import (
+    ROLE_PERMISSIONS_RELOAD_CHANNEL,
+    RolePermissionIndexLoader,
+)
+from backend.infrastructure.security.auth.user_cache import (
+    TieredAuthUserCache,
+)
+from backend.infrastructure.security.auth.user_resolver import (
+    AuthenticatorFactory,
+    AuthUserResolver,
+)
+from backend.infrastructure.security.hashing_pool import HashingPool
 from backend.infrastructure.security.password_hasher import (
+    Argon2Params,
     Argon2PasswordHasher,
 )
+from backend.infrastructure.security.password_rehash import (
+    BackgroundPasswordRehasher,
+)
+from backend.infrastructure.tools.single_flight import SingleFlight
+from backend.presentation.http.api.client_ip import TrustedProxies
 from backend.presentation.settings import Settings
 
+_LOGGER = logging.getLogger(__name__)
+
 
 def _build_redis_client(redis_url: str | None) -> Redis:
     if redis_url is None:
@@ -70,6 +150,17 @@ class AppProvider(Provider):
         super().__init__()
         self._settings = settings
 
+    def _pool_config(self: Self) -> EnginePoolConfig:
+        settings = self._settings
+        return EnginePoolConfig(
+            size=settings.db_pool_size,
+            max_overflow=settings.db_pool_max_overflow,
+            timeout_s=settings.db_pool_timeout_s,
+            recycle_s=settings.db_pool_recycle_s,
+            pre_ping=settings.db_pool_pre_ping,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
+
     @provide(scope=Scope.APP)
     def settings(self: Self) -> Settings:
         return self._settings
@@ -79,8 +170,14 @@ class AppProvider(Provider):
         return self._settings.default_registration_role_code
 
     @provide(scope=Scope.APP)
-    def engine(self: Self) -> AsyncEngine:
-        return create_engine(self._settings.database_url)
+    async def engine(self: Self) -> AsyncIterator[AsyncEngine]:
+        engine = create_engine(
+            self._settings.database_url, pool=self._pool_config()
+        )
+        try:
+            yield engine
+        finally:
+            await engine.dispose()
 
     @provide(scope=Scope.APP)
     def session_factory(
@@ -88,6 +185,36 @@ class AppProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return create_session_factory(engine)
 
+    @provide(scope=Scope.APP)
+    async def replica_router(
+        self: Self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: StrCache,
+    ) -> AsyncIterator[ReplicaRouter]:
+        settings = self._settings
+        read_url = settings.database_read_url
+        replica_engine = (
+            create_engine(read_url, pool=self._pool_config())
+            if read_url is not None
+            else None
+        )
+        if replica_engine is not None and settings.db_pool_prewarm:
+            await prewarm_engine(replica_engine, settings.db_pool_size)
+        try:
+            yield ReplicaRouter(
+                primary=session_factory,
+                replica=(
+                    create_session_factory(replica_engine)
+                    if replica_engine is not None
+                    else None
+                ),
+                sticky=cache,
+                sticky_s=settings.db_read_sticky_s,
+            )
+        finally:
+            if replica_engine is not None:
+                await replica_engine.dispose()
+
     @provide(scope=Scope.APP)
     async def redis_client(self: Self) -> AsyncIterator[Redis]:
         client = _build_redis_client(self._settings.redis_url)
@@ -101,26 +228,214 @@ class AppProvider(Provider):
         return RedisCache(client)
 
     @provide(scope=Scope.APP)
-    def shared_lock(self: Self, client: Redis) -> RedisSharedLock:
-        return RedisSharedLock(client=client)
+    def bytes_cache(self: Self, client: Redis) -> BytesCache:
+        return RedisBytesCache(client)
 
     @provide(scope=Scope.APP)
-    def refresh_store(self: Self, cache: StrCache) -> RefreshStore:
-        return RefreshStoreImpl(cache=cache)
+    def local_auth_user_cache(
+        self: Self,
+    ) -> LocalTTLCache[UUID, CachedAuthUser]:
+        return LocalTTLCache(
+            max_entries=self._settings.auth_cache_local_max_entries,
+            max_weight=self._settings.auth_cache_local_max_bytes,
+            ttl_s=self._settings.auth_cache_local_ttl_s,
+        )
 
     @provide(scope=Scope.APP)
-    def refresh_tokens(
+    def auth_user_cache(
+        self: Self,
+        local: LocalTTLCache[UUID, CachedAuthUser],
+        remote: BytesCache,
+    ) -> AuthUserCache:
+        return TieredAuthUserCache(
+            local=local,
+            remote=remote,
+            ttl_s=self._settings.auth_cache_ttl_s,
+            stale_ttl_s=self._settings.auth_cache_stale_s,
+        )
+
+    @provide(scope=Scope.APP)
+    def auth_user_loads(self: Self) -> SingleFlight[UUID, AuthUser | None]:
+        return SingleFlight()
+
+    @provide(scope=Scope.APP)
+    def role_permission_index(self: Self) -> RolePermissionIndex:
+        return RolePermissionIndex()
+
+    @provide(scope=Scope.APP)
+    def role_permission_loader(
+        self: Self,
+        index: RolePermissionIndex,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> RolePermissionIndexLoader:
+        return RolePermissionIndexLoader(
+            index=index, session_factory=session_factory
+        )
+
+    @provide(scope=Scope.APP)
+    def role_permission_reload_signal(
+        self: Self, client: Redis
+    ) -> RedisReloadSignal:
+        return RedisReloadSignal(
+            client=client, channel=ROLE_PERMISSIONS_RELOAD_CHANNEL
+        )
+
+    @provide(scope=Scope.APP)
+    def authenticators(
+        self: Self,
+        router: ReplicaRouter,
+        role_permissions: RolePermissionIndex,
+    ) -> AuthenticatorFactory:
+        def _bind(
+            factory: async_sessionmaker[AsyncSession],
+        ) -> AuthenticatorFactory:
+            @asynccontextmanager
+            async def _open() -> AsyncIterator[Authenticator]:
+                async with factory() as session:
+                    gateway = PersistenceGatewayImpl(
+                        TransactionManagerImpl(session)
+                    )
+                    yield AuthenticatorImpl(
+                        users=gateway.users,
+                        rbac=gateway.rbac,
+                        role_permissions=role_permissions,
+                    )
+
+            return _open
+
+        primary = _bind(router.primary)
+        if router.replica is None:
+            return primary
+        replica = _bind(router.replica)
+
+        @asynccontextmanager
+        async def _open_replica_first() -> AsyncIterator[Authenticator]:
+            async with replica() as authenticator:
+                yield ReplicaFirstAuthenticator(
+                    replica=authenticator,
+                    primary=primary,
+                    on_lag=router.mark_write,
+                    pinned=router.is_pinned,
+                )
+
+        return _open_replica_first
+
+    @provide(scope=Scope.APP)
+    async def auth_user_resolver(
         self: Self,
-        store: RefreshStore,
-        lock: RedisSharedLock,
-        cfg: JwtConfig,
+        cache: AuthUserCache,
+        loads: SingleFlight[UUID, AuthUser | None],
+        authenticators: AuthenticatorFactory,
+        invalidator: AuthCacheInvalidator,
+    ) -> AsyncIterator[AuthUserResolver]:
+        resolver = AuthUserResolver(
+            cache=cache,
+            loads=loads,
+            authenticators=authenticators,
+            invalidator=invalidator,
+            beta=self._settings.auth_cache_xfetch_beta,
+        )
+        try:
+            yield resolver
+        finally:
+            await resolver.aclose()
+
+    @provide(scope=Scope.APP)
+    def invalidation_bus(self: Self, client: Redis) -> RedisInvalidationBus:
+        return RedisInvalidationBus(
+            client=client, channel=AUTH_USER_INVALIDATION_CHANNEL
+        )
+
+    @provide(scope=Scope.APP)
+    def auth_cache_invalidation_bus(
+        self: Self, bus: RedisInvalidationBus
+    ) -> AuthCacheInvalidationBus:
+        return bus
+
+    @provide(scope=Scope.APP)
+    def rate_limiter(self: Self, client: Redis) -> RateLimiter:
+        return RedisSlidingWindowLimiter(client=client)
+
+    @provide(scope=Scope.APP)
+    def trusted_proxies(self: Self) -> TrustedProxies:
+        return TrustedProxies(networks=self._settings.trusted_proxies)
+
+    @provide(scope=Scope.APP)
+    def auth_throttle(self: Self, limiter: RateLimiter) -> AuthThrottle:
+        settings = self._settings
+        return AuthThrottle(
+            limiter=limiter,
+            policy=AuthThrottlePolicy(
+                window_s=settings.auth_rate_limit_window_s,
+                per_ip=settings.auth_rate_limit_per_ip,
+                per_email=settings.auth_rate_limit_per_email,
+                per_fingerprint=settings.auth_rate_limit_per_fingerprint,
+            ),
+        )
+
+    @provide(scope=Scope.APP)
+    def refresh_store(
+        self: Self, cache: StrCache, client: Redis
+    ) -> RefreshStore:
+        return RedisRefreshStore(cache=cache, client=client)
+
+    @provide(scope=Scope.APP)
+    def refresh_tokens(
+        self: Self, store: RefreshStore, cfg: JwtConfig
     ) -> RefreshTokenService:
         ttl_s = int(cfg.refresh_ttl.total_seconds())
-        return RefreshTokenService(store=store, lock=lock, ttl_s=ttl_s)
+        return RefreshTokenService(store=store, ttl_s=ttl_s)
 
     @provide(scope=Scope.APP)
-    def password_hasher(self: Self) -> PasswordHasherPort:
-        return Argon2PasswordHasher()
+    def hashing_pool(self: Self) -> Iterator[HashingPool]:
+        pool = HashingPool.create(
+            self._settings.password_hash_executor,
+            workers=self._settings.password_hash_workers,
+            max_queue=self._settings.password_hash_max_queue,
+            retry_after_s=self._settings.password_hash_retry_after_s,
+        )
+        try:
+            yield pool
+        finally:
+            pool.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def argon2_params(self: Self) -> Argon2Params:
+        settings = self._settings
+        if settings.argon2_calibrate_target_ms <= 0:
+            return Argon2Params(
+                time_cost=settings.argon2_time_cost,
+                memory_cost_kib=settings.argon2_memory_cost_kib,
+                parallelism=settings.argon2_parallelism,
+            )
+        params = await asyncio.to_thread(
+            calibrate_argon2,
+            target_ms=settings.argon2_calibrate_target_ms,
+            max_memory_kib=settings.argon2_memory_cost_kib,
+            parallelism=settings.argon2_parallelism,
+        )
+        _LOGGER.info("Calibrated Argon2 parameters: %s", params)
+        return params
+
+    @provide(scope=Scope.APP)
+    def password_hasher(
+        self: Self, pool: HashingPool, params: Argon2Params
+    ) -> PasswordHasherPort:
+        return Argon2PasswordHasher(pool, params)
+
+    @provide(scope=Scope.APP)
+    async def password_rehasher(
+        self: Self,
+        hasher: PasswordHasherPort,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterator[PasswordRehashScheduler]:
+        rehasher = BackgroundPasswordRehasher(
+            hasher=hasher, session_factory=session_factory
+        )
+        try:
+            yield rehasher
+        finally:
+            await rehasher.aclose()
 
     @provide(scope=Scope.APP)
     def jwt_config(self: Self) -> JwtConfig:
@@ -135,7 +450,15 @@ class AppProvider(Provider):
 
     @provide(scope=Scope.APP)
     def jwt_impl(self: Self, cfg: JwtConfig) -> JwtImpl:
-        return JwtImpl(cfg)
+        max_entries = self._settings.jwt_verify_cache_max_entries
+        access_cache: AccessTokenCache | None = None
+        if max_entries > 0:
+            access_cache = LocalTTLCache(
+                max_entries=max_entries,
+                max_weight=max_entries,
+                ttl_s=cfg.access_ttl.total_seconds(),
+            )
+        return JwtImpl(cfg, access_cache=access_cache)
 
     @provide(scope=Scope.APP)
     def jwt_verifier(self: Self, impl: JwtImpl) -> JwtVerifier:
@@ -147,6 +470,11 @@ class AppProvider(Provider):
 
     @provide(scope=Scope.APP)
     def auth_cache_invalidator(
-        self: Self, cache: StrCache
+        self: Self,
+        cache: AuthUserCache,
+        bus: AuthCacheInvalidationBus,
+        router: ReplicaRouter,
     ) -> AuthCacheInvalidator:
-        return AuthCacheInvalidator(cache=cache)
+        return AuthCacheInvalidator(
+            cache=cache, bus=bus, pin_primary=router.mark_write
+        )
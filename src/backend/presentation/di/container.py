@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Protocol
 
-from dishka import AsyncContainer, make_async_container
+from dishka import AsyncContainer, Provider, make_async_container
 from dishka.integrations.fastapi import FastapiProvider, setup_dishka
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+from uuid_utils.compat import UUID
 
+from backend.application.common.interfaces.auth.types import CachedAuthUser
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.persistence.cache.redis_pubsub import (
+    RedisInvalidationBus,
+    RedisReloadSignal,
+)
+from backend.infrastructure.persistence.sqlalchemy.replica import (
+    ReplicaRouter,
+)
+from backend.infrastructure.persistence.sqlalchemy.session_db import (
+    prewarm_engine,
+)
+from backend.infrastructure.security.auth.role_permissions import (
+    RolePermissionIndexLoader,
+)
+from backend.infrastructure.security.password_hasher import Argon2Params
 from backend.presentation.di.app_provider import AppProvider
 from backend.presentation.di.request_provider import RequestProvider
 from backend.presentation.settings import Settings
@@ -20,22 +39,65 @@ class _EventRegistrar(Protocol):
     ) -> None: ...
 
 
-def build_container(settings: Settings) -> AsyncContainer:
+def build_container(
+    settings: Settings, *overrides: Provider
+) -> AsyncContainer:
+    # Later providers win, so overrides replace matching dependencies.
     return make_async_container(
-        AppProvider(settings), RequestProvider(), FastapiProvider()
+        AppProvider(settings), RequestProvider(), FastapiProvider(), *overrides
     )
 
 
-def setup_di(app: FastAPI, settings: Settings) -> None:
-    container = build_container(settings)
+def setup_di(app: FastAPI, settings: Settings, *overrides: Provider) -> None:
+    container = build_container(settings, *overrides)
     setup_dishka(container, app)
+    background: set[asyncio.Task[None]] = set()
+
+    async def _start_background() -> None:
+        if settings.db_pool_prewarm:
+            engine = await container.get(AsyncEngine)
+            await prewarm_engine(engine, settings.db_pool_size)
+            # Building the router prewarms the replica engine, if any.
+            await container.get(ReplicaRouter)
+        # Calibrate now rather than inside the first login or register.
+        await container.get(Argon2Params)
+        # A failed load is logged and leaves the index empty; auth then
+        # falls back to per-user permission queries until the next reload.
+        loader = await container.get(RolePermissionIndexLoader)
+        await loader.reload()
+        signal = await container.get(RedisReloadSignal)
+        background.add(
+            asyncio.create_task(
+                signal.listen(on_reload=loader.reload),
+                name="role-permission-reload",
+            )
+        )
+        bus = await container.get(RedisInvalidationBus)
+        local = await container.get(LocalTTLCache[UUID, CachedAuthUser])
+        background.add(
+            asyncio.create_task(
+                bus.listen(on_invalidate=local.delete, on_reset=local.clear),
+                name="auth-cache-invalidation",
+            )
+        )
 
     async def _close_container() -> None:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
         await container.close()
 
+    _register_startup(app, _start_background)
     _register_shutdown(app, _close_container)
 
 
+def _register_startup(
+    registrar: _EventRegistrar,
+    func: Callable[[], Awaitable[None] | None],
+) -> None:
+    registrar.add_event_handler("startup", func)
+
+
 def _register_shutdown(
     registrar: _EventRegistrar,
     func: Callable[[], Awaitable[None] | None],
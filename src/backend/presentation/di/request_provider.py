@@ -1,24 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from typing import Self
+from dataclasses import dataclass
+from typing import Final, Self
 
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.requests import Request
 from uuid_utils.compat import UUID
 
 from backend.application.common.exceptions.application import (
     UnauthenticatedError,
 )
-from backend.application.common.interfaces.auth.ports import (
-    Authenticator,
-    JwtVerifier,
-)
+from backend.application.common.interfaces.auth.ports import JwtVerifier
 from backend.application.common.interfaces.auth.types import AuthUser
-from backend.application.common.interfaces.ports.cache import StrCache
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
+    ReadPersistenceGateway,
 )
 from backend.application.common.interfaces.ports.persistence.manager import (
     TransactionManager,
@@ -27,16 +24,30 @@ from backend.application.common.tools.permission_guard import PermissionGuard
 from backend.infrastructure.persistence.manager import TransactionManagerImpl
 from backend.infrastructure.persistence.persistence_gateway import (
     PersistenceGatewayImpl,
+    ReadPersistenceGatewayImpl,
+)
+from backend.infrastructure.persistence.sqlalchemy.replica import (
+    ReplicaRouter,
 )
-from backend.infrastructure.security.auth.authenticator import (
-    AuthenticatorImpl,
+from backend.infrastructure.security.auth.user_resolver import (
+    AuthUserResolver,
 )
-from backend.infrastructure.security.auth.cache_codec import (
-    decode_cached_user,
-    encode_cached_user,
+from backend.presentation.http.api.client_ip import (
+    ClientAddress,
+    TrustedProxies,
 )
+from backend.presentation.settings import Settings
+
+_SAFE_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
 
-_AUTH_USER_CACHE_TTL_S: int = 300
+
+def _bearer_subject(request: Request, verifier: JwtVerifier) -> UUID | None:
+    try:
+        token = _extract_bearer_token(request)
+    except UnauthenticatedError:
+        return None
+    result = verifier.verify_access(token)
+    return result.unwrap() if result.is_ok() else None
 
 
 def _extract_bearer_token(request: Request) -> str:
@@ -52,32 +63,41 @@ def _extract_bearer_token(request: Request) -> str:
     return token
 
 
-def _user_cache_key(user_id: UUID) -> str:
-    return f"auth:user:{user_id}"
+@dataclass(slots=True)
+class AuthSubject:
+    """The user ``current_user`` authenticated in this request, if any."""
 
-
-def _decode_cached_user(raw: str) -> AuthUser | None:
-    return decode_cached_user(raw)
-
-
-def _encode_cached_user(user: AuthUser) -> str:
-    return encode_cached_user(user)
+    user_id: UUID | None = None
 
 
 class RequestProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    async def session(
-        self: Self,
-        session_factory: async_sessionmaker[AsyncSession],
-    ) -> AsyncIterator[AsyncSession]:
-        async with session_factory() as session:
-            yield session
+    def auth_subject(self: Self) -> AuthSubject:
+        return AuthSubject()
 
     @provide(scope=Scope.REQUEST)
-    def transaction_manager(
-        self: Self, session: AsyncSession
-    ) -> TransactionManager:
-        return TransactionManagerImpl(session)
+    async def transaction_manager(
+        self: Self,
+        request: Request,
+        router: ReplicaRouter,
+        subject: AuthSubject,
+        settings: Settings,
+    ) -> AsyncIterator[TransactionManager]:
+        async def _pin_reads_to_primary() -> None:
+            await router.mark_write(subject.user_id)
+
+        # Pin only once a write has committed; safe methods are left out
+        # so read-only transactions never take reads off the replica.
+        pin = router.enabled and request.method not in _SAFE_METHODS
+        manager = TransactionManagerImpl.lazy(
+            router.primary,
+            raw_driver=settings.db_raw_driver,
+            on_commit=_pin_reads_to_primary if pin else None,
+        )
+        try:
+            yield manager
+        finally:
+            await manager.aclose()
 
     @provide(scope=Scope.REQUEST)
     def persistence_gateway(
@@ -86,10 +106,30 @@ class RequestProvider(Provider):
         return PersistenceGatewayImpl(manager)
 
     @provide(scope=Scope.REQUEST)
-    def authenticator(
-        self: Self, gateway: PersistenceGateway
-    ) -> Authenticator:
-        return AuthenticatorImpl(users=gateway.users, rbac=gateway.rbac)
+    async def read_gateway(
+        self: Self,
+        request: Request,
+        router: ReplicaRouter,
+        jwt_verifier: JwtVerifier,
+        settings: Settings,
+    ) -> AsyncIterator[ReadPersistenceGateway]:
+        user_id = (
+            _bearer_subject(request, jwt_verifier) if router.enabled else None
+        )
+        factory = await router.session_factory_for("read", user_id)
+        manager = TransactionManagerImpl.lazy(
+            factory, raw_driver=settings.db_raw_driver
+        )
+        try:
+            yield ReadPersistenceGatewayImpl(manager)
+        finally:
+            await manager.aclose()
+
+    @provide(scope=Scope.REQUEST)
+    def client_address(
+        self: Self, request: Request, proxies: TrustedProxies
+    ) -> ClientAddress:
+        return ClientAddress(ip=proxies.client_ip(request))
 
     @provide(scope=Scope.REQUEST)
     def permission_guard(self: Self) -> PermissionGuard:
@@ -100,27 +140,15 @@ class RequestProvider(Provider):
         self: Self,
         request: Request,
         jwt_verifier: JwtVerifier,
-        authenticator: Authenticator,
-        cache: StrCache,
+        resolver: AuthUserResolver,
+        subject: AuthSubject,
     ) -> AuthUser:
         token = _extract_bearer_token(request)
         user_id = jwt_verifier.verify_access(token).unwrap_or_raise(
             UnauthenticatedError("Invalid access token")
         )
-        cache_key = _user_cache_key(user_id)
-        cached = await cache.get(cache_key)
-        if cached is not None:
-            cached_user = _decode_cached_user(cached)
-            if cached_user is not None:
-                if not cached_user.is_active:
-                    raise UnauthenticatedError("Authentication required")
-                return cached_user
-        auth_user = await authenticator.authenticate(user_id)
+        auth_user = await resolver.resolve(user_id)
         if auth_user is None or not auth_user.is_active:
             raise UnauthenticatedError("Authentication required")
-        await cache.set(
-            cache_key,
-            _encode_cached_user(auth_user),
-            ttl_s=_AUTH_USER_CACHE_TTL_S,
-        )
+        subject.user_id = auth_user.id
         return auth_user
@@ -8,8 +8,8 @@ from backend.presentation.di.require_auth import require_auth
 
 def assert_closed_by_default(app: FastAPI) -> None:
     missing: list[str] = []
-    public_prefixes = ("/auth", "/system")
-    excluded_paths = {"/docs", "/redoc", "/openapi.json"}
+    public_prefixes = ("/auth",)
+    excluded_paths = {"/docs", "/redoc", "/openapi.json", "/system"}
 
     for route in app.routes:
         if not isinstance(route, APIRoute):
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+)
+from typing import Final
+
+from starlette.requests import Request
+
+type ProxyNetwork = IPv4Network | IPv6Network
+
+_FORWARDED_FOR: Final[str] = "X-Forwarded-For"
+_REAL_IP: Final[str] = "X-Real-IP"
+
+
+@dataclass(frozen=True, slots=True)
+class ClientAddress:
+    """The caller's IP for this request, as ``TrustedProxies`` sees it."""
+
+    ip: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class TrustedProxies:
+    """Reads the client address from headers set by trusted proxies.
+
+    Headers are only believed when the peer itself is trusted, and
+    ``X-Forwarded-For`` is walked right to left past trusted hops, so a
+    client cannot pick its address by prepending entries.
+    """
+
+    networks: tuple[ProxyNetwork, ...] = ()
+
+    def client_ip(self: TrustedProxies, request: Request) -> str | None:
+        peer = request.client.host if request.client is not None else None
+        if peer is None or not self._trusted(_parse(peer)):
+            return peer
+        forwarded = request.headers.get(_FORWARDED_FOR)
+        if forwarded:
+            for hop in reversed(forwarded.split(",")):
+                address = _parse(hop.strip())
+                if address is None:
+                    return peer
+                if not self._trusted(address):
+                    return str(address)
+            return peer
+        real_ip = _parse((request.headers.get(_REAL_IP) or "").strip())
+        return str(real_ip) if real_ip is not None else peer
+
+    def _trusted(
+        self: TrustedProxies, address: IPv4Address | IPv6Address | None
+    ) -> bool:
+        if address is None:
+            return False
+        return any(address in network for network in self.networks)
+
+
+def _parse(host: str) -> IPv4Address | IPv6Address | None:
+    try:
+        return ip_address(host)
+    except ValueError:
+        return None
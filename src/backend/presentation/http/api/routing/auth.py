@@ -6,11 +6,13 @@ from fastapi import APIRouter
 from backend.application.common.interfaces.auth.ports import (
     JwtIssuer,
     JwtVerifier,
+    PasswordRehashScheduler,
 )
 from backend.application.common.interfaces.auth.types import AuthUser
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
 )
+from backend.application.common.tools.auth_throttle import AuthThrottle
 from backend.application.common.tools.refresh_tokens import (
     RefreshTokenService,
 )
@@ -32,6 +34,10 @@ from backend.application.handlers.commands.auth.register import (
 )
 from backend.domain.core.types.rbac import RoleCode
 from backend.domain.ports.security.password_hasher import PasswordHasherPort
+from backend.infrastructure.persistence.sqlalchemy.replica import (
+    ReplicaRouter,
+)
+from backend.presentation.http.api.client_ip import ClientAddress
 from backend.presentation.http.api.schemas.auth import (
     LoginRequest,
     LogoutRequest,
@@ -47,12 +53,22 @@ router: APIRouter = APIRouter(route_class=DishkaRoute)
 @router.post("/auth/register", response_model=TokenPairResponse)
 async def register_user(
     payload: RegisterRequest,
+    *,
+    throttle: FromDishka[AuthThrottle],
+    client: FromDishka[ClientAddress],
     gateway: FromDishka[PersistenceGateway],
     password_hasher: FromDishka[PasswordHasherPort],
     default_registration_role: FromDishka[RoleCode],
     jwt_issuer: FromDishka[JwtIssuer],
     refresh_tokens: FromDishka[RefreshTokenService],
+    replica_router: FromDishka[ReplicaRouter],
 ) -> TokenPairResponse:
+    await throttle.check(
+        "register",
+        client_ip=client.ip,
+        email=payload.email,
+        fingerprint=payload.fingerprint,
+    )
     handler = RegisterUserHandler(
         gateway=gateway,
         password_hasher=password_hasher,
@@ -69,6 +85,9 @@ async def register_user(
     )
     result = await handler(cmd)
     dto = result.unwrap()
+    # No AuthSubject exists yet, so the commit hook could not pin anyone;
+    # the client's next read must still see the row it just created.
+    await replica_router.mark_write(dto.user_id)
 
     return TokenPairResponse.from_dto(dto)
 
@@ -76,16 +95,26 @@ async def register_user(
 @router.post("/auth/login", response_model=TokenPairResponse)
 async def login_user(
     payload: LoginRequest,
+    throttle: FromDishka[AuthThrottle],
+    client: FromDishka[ClientAddress],
     gateway: FromDishka[PersistenceGateway],
     password_hasher: FromDishka[PasswordHasherPort],
     jwt_issuer: FromDishka[JwtIssuer],
     refresh_tokens: FromDishka[RefreshTokenService],
+    password_rehash: FromDishka[PasswordRehashScheduler],
 ) -> TokenPairResponse:
+    await throttle.check(
+        "login",
+        client_ip=client.ip,
+        email=payload.email,
+        fingerprint=payload.fingerprint,
+    )
     handler = LoginUserHandler(
         gateway=gateway,
         password_hasher=password_hasher,
         jwt_issuer=jwt_issuer,
         refresh_tokens=refresh_tokens,
+        password_rehash=password_rehash,
     )
     cmd = LoginUserCommand(
         email=payload.email,
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from typing import Final
+
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from uuid_utils.compat import UUID
 
+from backend.application.common.dtos.users import UserResponseDTO
 from backend.application.common.interfaces.auth.types import AuthUser
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
+    ReadPersistenceGateway,
 )
 from backend.application.common.tools.auth_cache import AuthCacheInvalidator
 from backend.application.common.tools.permission_guard import PermissionGuard
@@ -22,21 +28,50 @@ from backend.application.handlers.queries.rbac.get_user_roles import (
     GetUserRolesHandler,
     GetUserRolesQuery,
 )
+from backend.application.handlers.queries.rbac.get_users_by_role import (
+    GetUsersByRoleHandler,
+    GetUsersByRoleQuery,
+)
+from backend.application.handlers.queries.rbac.stream_users_by_role import (
+    StreamUsersByRoleHandler,
+    StreamUsersByRoleQuery,
+)
 from backend.domain.core.types.rbac import PermissionCode
 from backend.presentation.http.api.routing._helpers import run_best_effort
+from backend.presentation.http.api.schemas.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    PageCursor,
+    PageLimit,
+)
 from backend.presentation.http.api.schemas.rbac import (
     RoleChangeRequest,
     UserRolesResponse,
+    UsersByRoleResponse,
 )
 from backend.presentation.http.api.schemas.rbac_fields import RoleCodePath
+from backend.presentation.http.api.schemas.users import UserResponse
+
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+STREAM_CHUNK_SIZE: Final[int] = 500
 
 router: APIRouter = APIRouter(route_class=DishkaRoute)
 
 
+async def _ndjson_lines(
+    chunks: AsyncIterator[list[UserResponseDTO]],
+) -> AsyncIterator[str]:
+    # One body message per fetched chunk rather than per row.
+    async for users in chunks:
+        yield "".join(
+            UserResponse.from_dto(user).model_dump_json() + "\n"
+            for user in users
+        )
+
+
 @router.get("/rbac/users/{user_id}/roles", response_model=UserRolesResponse)
 async def get_user_roles(
     user_id: UUID,
-    gateway: FromDishka[PersistenceGateway],
+    gateway: FromDishka[ReadPersistenceGateway],
     current_user: FromDishka[AuthUser],
     permission_guard: FromDishka[PermissionGuard],
 ) -> UserRolesResponse:
@@ -50,6 +85,55 @@ async def get_user_roles(
     return UserRolesResponse.from_dto(dto)
 
 
+@router.get(
+    "/rbac/roles/{role_code}/users", response_model=UsersByRoleResponse
+)
+async def get_users_by_role(
+    role_code: RoleCodePath,
+    gateway: FromDishka[ReadPersistenceGateway],
+    current_user: FromDishka[AuthUser],
+    permission_guard: FromDishka[PermissionGuard],
+    limit: PageLimit = DEFAULT_PAGE_LIMIT,
+    cursor: PageCursor = None,
+) -> UsersByRoleResponse:
+    await permission_guard.require(
+        current_user, PermissionCode.RBAC_READ_ROLES
+    )
+    handler = GetUsersByRoleHandler(gateway=gateway)
+    result = await handler(
+        GetUsersByRoleQuery(role=role_code, limit=limit, after=cursor)
+    )
+    dto = result.unwrap()
+
+    return UsersByRoleResponse.from_page(dto)
+
+
+@router.get(
+    "/rbac/roles/{role_code}/users/stream",
+    response_class=StreamingResponse,
+    response_model=None,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def stream_users_by_role(
+    role_code: RoleCodePath,
+    gateway: FromDishka[ReadPersistenceGateway],
+    current_user: FromDishka[AuthUser],
+    permission_guard: FromDishka[PermissionGuard],
+) -> StreamingResponse:
+    await permission_guard.require(
+        current_user, PermissionCode.RBAC_READ_ROLES
+    )
+    handler = StreamUsersByRoleHandler(gateway=gateway)
+    result = await handler(
+        StreamUsersByRoleQuery(role=role_code, chunk_size=STREAM_CHUNK_SIZE)
+    )
+    dto = result.unwrap()
+
+    return StreamingResponse(
+        _ndjson_lines(dto.chunks), media_type=NDJSON_MEDIA_TYPE
+    )
+
+
 @router.post("/rbac/users/{user_id}/roles", response_model=UserRolesResponse)
 async def assign_role_to_user(
     user_id: UUID,
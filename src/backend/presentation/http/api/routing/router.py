@@ -6,6 +6,9 @@ from fastapi import APIRouter, Depends
 from backend.presentation.di.require_auth import require_auth
 from backend.presentation.http.api.routing.auth import router as auth_router
 from backend.presentation.http.api.routing.rbac import router as rbac_router
+from backend.presentation.http.api.routing.system import (
+    admin_router as system_admin_router,
+)
 from backend.presentation.http.api.routing.system import (
     router as system_router,
 )
@@ -17,6 +20,7 @@ protected_router: APIRouter = APIRouter(
 )
 protected_router.include_router(users_router)
 protected_router.include_router(rbac_router)
+protected_router.include_router(system_admin_router)
 
 api_router: APIRouter = APIRouter(route_class=DishkaRoute)
 api_router.include_router(auth_router)
@@ -1,13 +1,67 @@
 from __future__ import annotations
 
-from dishka.integrations.fastapi import DishkaRoute
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter
+from sqlalchemy.ext.asyncio import AsyncEngine
+from uuid_utils.compat import UUID
 
-from backend.presentation.http.api.schemas.system import SystemStatusResponse
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.tools.permission_guard import PermissionGuard
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.persistence.sqlalchemy.pool import pool_stats
+from backend.infrastructure.security.auth.jwt import JwtImpl
+from backend.presentation.http.api.schemas.system import (
+    CacheStatsResponse,
+    DbPoolStatsResponse,
+    LocalCacheStatsResponse,
+    SystemStatusResponse,
+)
+from backend.presentation.settings import Settings
 
 router: APIRouter = APIRouter(route_class=DishkaRoute)
+# Mounted under require_auth; everything here also needs system:read.
+admin_router: APIRouter = APIRouter(route_class=DishkaRoute)
 
 
 @router.get("/system", response_model=SystemStatusResponse)
 async def system_status() -> SystemStatusResponse:
     return SystemStatusResponse(status="ok")
+
+
+@admin_router.get("/system/db-pool", response_model=DbPoolStatsResponse)
+async def db_pool_stats(
+    engine: FromDishka[AsyncEngine],
+    settings: FromDishka[Settings],
+    current_user: FromDishka[AuthUser],
+    permission_guard: FromDishka[PermissionGuard],
+) -> DbPoolStatsResponse:
+    await permission_guard.require(current_user, PermissionCode.SYSTEM_READ)
+    stats = pool_stats(engine, max_overflow=settings.db_pool_max_overflow)
+    return DbPoolStatsResponse.model_validate(stats, from_attributes=True)
+
+
+@admin_router.get("/system/caches", response_model=CacheStatsResponse)
+async def cache_stats(
+    jwt: FromDishka[JwtImpl],
+    auth_users: FromDishka[LocalTTLCache[UUID, CachedAuthUser]],
+    current_user: FromDishka[AuthUser],
+    permission_guard: FromDishka[PermissionGuard],
+) -> CacheStatsResponse:
+    await permission_guard.require(current_user, PermissionCode.SYSTEM_READ)
+    verify_cache = jwt.access_cache
+    return CacheStatsResponse(
+        jwt_verify=(
+            LocalCacheStatsResponse.model_validate(
+                verify_cache.snapshot(), from_attributes=True
+            )
+            if verify_cache is not None
+            else None
+        ),
+        auth_user_local=LocalCacheStatsResponse.model_validate(
+            auth_users.snapshot(), from_attributes=True
+        ),
+    )
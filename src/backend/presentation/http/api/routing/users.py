@@ -7,6 +7,7 @@ from uuid_utils.compat import UUID
 from backend.application.common.interfaces.auth.types import AuthUser
 from backend.application.common.interfaces.ports.persistence.gateway import (
     PersistenceGateway,
+    ReadPersistenceGateway,
 )
 from backend.application.common.tools.auth_cache import AuthCacheInvalidator
 from backend.application.common.tools.permission_guard import PermissionGuard
@@ -26,13 +27,25 @@ from backend.application.handlers.queries.users.get_user import (
     GetUserHandler,
     GetUserQuery,
 )
+from backend.application.handlers.queries.users.list_users import (
+    ListUsersHandler,
+    ListUsersQuery,
+)
 from backend.domain.core.types.rbac import PermissionCode, RoleCode
 from backend.domain.ports.security.password_hasher import PasswordHasherPort
 from backend.presentation.http.api.routing._helpers import run_best_effort
 from backend.presentation.http.api.schemas.auth import SuccessResponse
+from backend.presentation.http.api.schemas.fields import EmailPrefixQuery
+from backend.presentation.http.api.schemas.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    PageLimit,
+    UserPageCursor,
+)
+from backend.presentation.http.api.schemas.rbac_fields import RoleCodeQuery
 from backend.presentation.http.api.schemas.users import (
     UserCreateRequest,
     UserResponse,
+    UsersPageResponse,
     UserUpdateRequest,
 )
 
@@ -66,9 +79,35 @@ async def create_user(
     return UserResponse.from_dto(dto)
 
 
+@router.get("/users", response_model=UsersPageResponse)
+async def list_users(
+    gateway: FromDishka[ReadPersistenceGateway],
+    current_user: FromDishka[AuthUser],
+    permission_guard: FromDishka[PermissionGuard],
+    limit: PageLimit = DEFAULT_PAGE_LIMIT,
+    cursor: UserPageCursor = None,
+    is_active: bool | None = None,
+    role: RoleCodeQuery = None,
+    email_prefix: EmailPrefixQuery = None,
+) -> UsersPageResponse:
+    await permission_guard.require(current_user, PermissionCode.USERS_READ)
+    handler = ListUsersHandler(gateway=gateway)
+    query = ListUsersQuery(
+        limit=limit,
+        after=cursor,
+        is_active=is_active,
+        role=role,
+        email_prefix=email_prefix,
+    )
+    result = await handler(query)
+    dto = result.unwrap()
+
+    return UsersPageResponse.from_page(dto)
+
+
 @router.get("/users/me", response_model=UserResponse)
 async def get_me(
-    gateway: FromDishka[PersistenceGateway],
+    gateway: FromDishka[ReadPersistenceGateway],
     current_user: FromDishka[AuthUser],
 ) -> UserResponse:
     handler = GetUserHandler(gateway=gateway)
@@ -1,3 +1,10 @@
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("auth", "base", "rbac", "system", "users")
+__all__: tuple[str, ...] = (
+    "auth",
+    "base",
+    "pagination",
+    "rbac",
+    "system",
+    "users",
+)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Final
 
+from fastapi import Query
 from pydantic import AfterValidator, StringConstraints
 
 from backend.domain.core.policies.identity import (
@@ -75,3 +76,15 @@ type FingerprintStr = Annotated[
     ),
     AfterValidator(validate_fingerprint),
 ]
+
+# Stored emails are ASCII (ck_users_email_format), so is any useful prefix.
+EMAIL_PREFIX_PATTERN: Final[str] = r"^[A-Za-z0-9._%+@-]+$"
+
+type EmailPrefixQuery = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=MAX_EMAIL_LENGTH,
+        pattern=EMAIL_PREFIX_PATTERN,
+    ),
+]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import base64
+from typing import Annotated, Final
+
+from fastapi import Query
+from pydantic import BeforeValidator
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserPageKey,
+)
+
+DEFAULT_PAGE_LIMIT: Final[int] = 50
+MAX_PAGE_LIMIT: Final[int] = 200
+
+_UUID_BYTES: Final[int] = 16
+
+_CURSOR_DESCRIPTION: Final[str] = (
+    "Opaque cursor from the previous page's next_cursor"
+)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def encode_cursor(after: UUID) -> str:
+    return _b64encode(after.bytes)
+
+
+def decode_cursor(value: object) -> object:
+    if not isinstance(value, str):
+        return value
+    try:
+        return UUID(bytes=_b64decode(value))
+    except ValueError as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def encode_user_cursor(after: UserPageKey) -> str:
+    return _b64encode(after.id.bytes + after.email.encode())
+
+
+def decode_user_cursor(value: object) -> object:
+    if not isinstance(value, str):
+        return value
+    try:
+        raw = _b64decode(value)
+        if len(raw) <= _UUID_BYTES:
+            raise ValueError("Cursor is too short")
+        return UserPageKey(
+            id=UUID(bytes=raw[:_UUID_BYTES]), email=raw[_UUID_BYTES:].decode()
+        )
+    except ValueError as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+type PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_LIMIT)]
+type PageCursor = Annotated[
+    UUID | None,
+    BeforeValidator(decode_cursor),
+    Query(description=_CURSOR_DESCRIPTION),
+]
+type UserPageCursor = Annotated[
+    UserPageKey | None,
+    BeforeValidator(decode_user_cursor),
+    Query(description=_CURSOR_DESCRIPTION),
+]
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from uuid_utils.compat import UUID
 
+from backend.application.common.dtos.rbac import UsersByRoleResponseDTO
 from backend.presentation.http.api.schemas.base import BaseSchema
+from backend.presentation.http.api.schemas.pagination import encode_cursor
 from backend.presentation.http.api.schemas.rbac_fields import RoleCodeStr
+from backend.presentation.http.api.schemas.users import UserResponse
 
 
 class UserRolesResponse(BaseSchema):
@@ -14,3 +17,23 @@ class UserRolesResponse(BaseSchema):
 
 class RoleChangeRequest(BaseSchema):
     role_code: RoleCodeStr
+
+
+class UsersByRoleResponse(BaseSchema):
+    role: str
+    users: list[UserResponse]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_page(
+        cls: type[UsersByRoleResponse], dto: UsersByRoleResponseDTO
+    ) -> UsersByRoleResponse:
+        return cls(
+            role=dto.role,
+            users=[UserResponse.from_dto(user) for user in dto.users],
+            next_cursor=(
+                None
+                if dto.next_after is None
+                else encode_cursor(dto.next_after)
+            ),
+        )
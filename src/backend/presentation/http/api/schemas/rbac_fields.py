@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Path
+from fastapi import Path, Query
 from pydantic import AfterValidator, StringConstraints
 
 from backend.domain.core.policies.rbac import (
@@ -30,3 +30,11 @@ type RoleCodePath = Annotated[
         pattern=ROLE_CODE_PATTERN,
     ),
 ]
+type RoleCodeQuery = Annotated[
+    str | None,
+    Query(
+        min_length=MIN_ROLE_CODE_LENGTH,
+        max_length=MAX_ROLE_CODE_LENGTH,
+        pattern=ROLE_CODE_PATTERN,
+    ),
+]
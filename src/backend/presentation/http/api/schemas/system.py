@@ -5,3 +5,31 @@ from backend.presentation.http.api.schemas.base import BaseSchema
 
 class SystemStatusResponse(BaseSchema):
     status: str
+
+
+class DbPoolStatsResponse(BaseSchema):
+    size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    utilization: float
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class LocalCacheStatsResponse(BaseSchema):
+    entries: int
+    weight: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_rate: float
+
+
+class CacheStatsResponse(BaseSchema):
+    jwt_verify: LocalCacheStatsResponse | None
+    auth_user_local: LocalCacheStatsResponse
@@ -5,6 +5,7 @@ from typing import Self
 from pydantic import model_validator
 from uuid_utils.compat import UUID
 
+from backend.application.common.dtos.users import UsersPageDTO
 from backend.presentation.http.api.schemas.base import BaseSchema
 from backend.presentation.http.api.schemas.fields import (
     EmailStr,
@@ -12,6 +13,9 @@ from backend.presentation.http.api.schemas.fields import (
     RawPasswordStr,
     UsernameStr,
 )
+from backend.presentation.http.api.schemas.pagination import (
+    encode_user_cursor,
+)
 
 
 class UserCreateRequest(BaseSchema):
@@ -28,6 +32,24 @@ class UserResponse(BaseSchema):
     username: str
 
 
+class UsersPageResponse(BaseSchema):
+    users: list[UserResponse]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_page(
+        cls: type[UsersPageResponse], dto: UsersPageDTO
+    ) -> UsersPageResponse:
+        return cls(
+            users=[UserResponse.from_dto(user) for user in dto.users],
+            next_cursor=(
+                None
+                if dto.next_after is None
+                else encode_user_cursor(dto.next_after)
+            ),
+        )
+
+
 class UserUpdateRequest(BaseSchema):
     email: EmailStr | None = None
     raw_password: RawPasswordStr | None = None
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from typing import Literal
 
 from environs import Env
 
+from backend.infrastructure.security.password_hasher import (
+    ARGON2_MEMORY_COST_KIB,
+    ARGON2_PARALLELISM,
+    ARGON2_TIME_COST,
+)
+
 
 def _require_str(env: Env, name: str) -> str:
     value = env.str(name)
@@ -19,10 +28,42 @@ def _require_int(env: Env, name: str) -> int:
     return value
 
 
+def _trusted_proxies(env: Env) -> tuple[IPv4Network | IPv6Network, ...]:
+    networks: list[IPv4Network | IPv6Network] = []
+    raw_value: str = env.str("TRUSTED_PROXIES", default="") or ""
+    for raw in filter(None, (item.strip() for item in raw_value.split(","))):
+        try:
+            networks.append(ip_network(raw, strict=False))
+        except ValueError as exc:
+            raise RuntimeError(
+                f"Invalid TRUSTED_PROXIES entry: {raw}"
+            ) from exc
+    return tuple(networks)
+
+
+def _password_hash_executor(env: Env) -> Literal["thread", "process"]:
+    value = env.str("PASSWORD_HASH_EXECUTOR", default="thread") or "thread"
+    if value == "thread":
+        return "thread"
+    if value == "process":
+        return "process"
+    raise RuntimeError(f"Unsupported PASSWORD_HASH_EXECUTOR: {value}")
+
+
 @dataclass(frozen=True, slots=True)
 class Settings:
     app_env: str
     database_url: str
+    database_read_url: str | None
+    db_read_sticky_s: int
+    db_pool_size: int
+    db_pool_max_overflow: int
+    db_pool_timeout_s: float
+    db_pool_recycle_s: int
+    db_pool_pre_ping: bool
+    db_pool_prewarm: bool
+    db_statement_cache_size: int
+    db_raw_driver: bool
     redis_url: str | None
     default_registration_role_code: str
 
@@ -32,6 +73,30 @@ class Settings:
     jwt_secret: str
     jwt_access_ttl_s: int
     jwt_refresh_ttl_s: int
+    jwt_verify_cache_max_entries: int
+
+    password_hash_executor: Literal["thread", "process"]
+    password_hash_workers: int
+    password_hash_max_queue: int
+    password_hash_retry_after_s: int
+
+    argon2_time_cost: int
+    argon2_memory_cost_kib: int
+    argon2_parallelism: int
+    argon2_calibrate_target_ms: int
+
+    auth_rate_limit_window_s: int
+    auth_rate_limit_per_ip: int
+    auth_rate_limit_per_email: int
+    auth_rate_limit_per_fingerprint: int
+    trusted_proxies: tuple[IPv4Network | IPv6Network, ...]
+
+    auth_cache_ttl_s: int
+    auth_cache_stale_s: int
+    auth_cache_xfetch_beta: float
+    auth_cache_local_ttl_s: int
+    auth_cache_local_max_entries: int
+    auth_cache_local_max_bytes: int
 
     @staticmethod
     def from_env(env: Env) -> Settings:
@@ -44,6 +109,20 @@ class Settings:
         return Settings(
             app_env=app_env,
             database_url=_require_str(env, "DATABASE_URL"),
+            database_read_url=env.str("DATABASE_READ_URL", default="") or None,
+            db_read_sticky_s=env.int("DB_READ_STICKY_S", default=5),
+            db_pool_size=env.int("DB_POOL_SIZE", default=10),
+            db_pool_max_overflow=env.int("DB_POOL_MAX_OVERFLOW", default=10),
+            db_pool_timeout_s=env.float("DB_POOL_TIMEOUT_S", default=30.0),
+            db_pool_recycle_s=env.int("DB_POOL_RECYCLE_S", default=1800),
+            # Off: a ping costs a round trip per checkout, and
+            # DB_POOL_RECYCLE_S already retires idle-killed connections.
+            db_pool_pre_ping=env.bool("DB_POOL_PRE_PING", default=False),
+            db_pool_prewarm=env.bool("DB_POOL_PREWARM", default=True),
+            db_statement_cache_size=env.int(
+                "DB_STATEMENT_CACHE_SIZE", default=100
+            ),
+            db_raw_driver=env.bool("DB_RAW_DRIVER", default=False),
             redis_url=redis_url,
             default_registration_role_code=default_registration_role_code,
             jwt_issuer=_require_str(env, "JWT_ISSUER"),
@@ -52,6 +131,58 @@ class Settings:
             jwt_secret=_require_str(env, "JWT_SECRET"),
             jwt_access_ttl_s=_require_int(env, "JWT_ACCESS_TTL_S"),
             jwt_refresh_ttl_s=_require_int(env, "JWT_REFRESH_TTL_S"),
+            jwt_verify_cache_max_entries=env.int(
+                "JWT_VERIFY_CACHE_MAX_ENTRIES", default=50_000
+            ),
+            password_hash_executor=_password_hash_executor(env),
+            password_hash_workers=env.int(
+                "PASSWORD_HASH_WORKERS", default=min(4, os.cpu_count() or 1)
+            ),
+            password_hash_max_queue=env.int(
+                "PASSWORD_HASH_MAX_QUEUE", default=32
+            ),
+            password_hash_retry_after_s=env.int(
+                "PASSWORD_HASH_RETRY_AFTER_S", default=1
+            ),
+            argon2_time_cost=env.int(
+                "ARGON2_TIME_COST", default=ARGON2_TIME_COST
+            ),
+            argon2_memory_cost_kib=env.int(
+                "ARGON2_MEMORY_COST_KIB", default=ARGON2_MEMORY_COST_KIB
+            ),
+            argon2_parallelism=env.int(
+                "ARGON2_PARALLELISM", default=ARGON2_PARALLELISM
+            ),
+            argon2_calibrate_target_ms=env.int(
+                "ARGON2_CALIBRATE_TARGET_MS", default=0
+            ),
+            auth_rate_limit_window_s=env.int(
+                "AUTH_RATE_LIMIT_WINDOW_S", default=60
+            ),
+            auth_rate_limit_per_ip=env.int(
+                "AUTH_RATE_LIMIT_PER_IP", default=30
+            ),
+            auth_rate_limit_per_email=env.int(
+                "AUTH_RATE_LIMIT_PER_EMAIL", default=10
+            ),
+            auth_rate_limit_per_fingerprint=env.int(
+                "AUTH_RATE_LIMIT_PER_FINGERPRINT", default=20
+            ),
+            trusted_proxies=_trusted_proxies(env),
+            auth_cache_ttl_s=env.int("AUTH_CACHE_TTL_S", default=300),
+            auth_cache_stale_s=env.int("AUTH_CACHE_STALE_S", default=60),
+            auth_cache_xfetch_beta=env.float(
+                "AUTH_CACHE_XFETCH_BETA", default=1.0
+            ),
+            auth_cache_local_ttl_s=env.int(
+                "AUTH_CACHE_LOCAL_TTL_S", default=30
+            ),
+            auth_cache_local_max_entries=env.int(
+                "AUTH_CACHE_LOCAL_MAX_ENTRIES", default=10_000
+            ),
+            auth_cache_local_max_bytes=env.int(
+                "AUTH_CACHE_LOCAL_MAX_BYTES", default=16 * 1024 * 1024
+            ),
         )
 
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.infrastructure.security.argon2_calibration import (
+    ARGON2_MIN_MEMORY_COST_KIB,
+    calibrate_argon2,
+)
+from backend.infrastructure.security.password_hasher import (
+    Argon2Params,
+    Argon2PasswordHasher,
+)
+
+
+def _linear_host(kib_passes_per_s: float) -> object:
+    calls: list[Argon2Params] = []
+
+    def measure(params: Argon2Params) -> float:
+        calls.append(params)
+        return params.work / kib_passes_per_s
+
+    measure.calls = calls  # type: ignore[attr-defined]
+    return measure
+
+
+def test_calibration_adds_passes_on_fast_host() -> None:
+    # One pass over 64 MiB takes 10 ms.
+    measure = _linear_host(65536 / 0.010)
+
+    params = calibrate_argon2(
+        target_ms=50,
+        max_memory_kib=65536,
+        parallelism=2,
+        measure=measure,  # type: ignore[arg-type]
+    )
+
+    assert params.memory_cost_kib == 65536
+    assert params.time_cost == 5
+    assert params.parallelism == 2
+
+
+def test_calibration_shrinks_memory_down_to_floor_on_slow_host() -> None:
+    # One pass over 64 MiB takes 200 ms.
+    measure = _linear_host(65536 / 0.200)
+
+    params = calibrate_argon2(
+        target_ms=50,
+        max_memory_kib=65536,
+        parallelism=1,
+        measure=measure,  # type: ignore[arg-type]
+    )
+
+    assert params.memory_cost_kib == ARGON2_MIN_MEMORY_COST_KIB
+    assert params.time_cost == 1
+
+
+def test_calibration_rejects_non_positive_target() -> None:
+    with pytest.raises(ValueError):
+        calibrate_argon2(target_ms=0)
+
+
+def _build_raw_password() -> str:
+    return "".join(("Strong", "Pass", "123", "!"))
+
+
+@pytest.mark.asyncio
+async def test_needs_rehash_only_upgrades_cheaper_hashes() -> None:
+    hasher = Argon2PasswordHasher(
+        params=Argon2Params(time_cost=2, memory_cost_kib=1024, parallelism=1)
+    )
+    raw = _build_raw_password()
+
+    async def hashed_with(time_cost: int, memory_cost_kib: int) -> str:
+        other = Argon2PasswordHasher(
+            params=Argon2Params(
+                time_cost=time_cost,
+                memory_cost_kib=memory_cost_kib,
+                parallelism=1,
+            )
+        )
+        return await other.hash(raw)
+
+    assert await hasher.needs_rehash(await hashed_with(1, 1024))
+    assert not await hasher.needs_rehash(await hashed_with(1, 2048))
+    assert not await hasher.needs_rehash(await hashed_with(4, 512))
+    assert await hasher.needs_rehash("not-a-hash")
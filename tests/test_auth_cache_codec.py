@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import msgspec
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.security.auth.cache_codec import (
+    decode_cached_user,
+    encode_cached_user,
+)
+
+_USER_ID = UUID("44444444-4444-4444-4444-444444444444")
+
+
+def _entry() -> CachedAuthUser:
+    return CachedAuthUser(
+        user=AuthUser(
+            id=_USER_ID,
+            role_codes=frozenset({"admin"}),
+            permission_codes=frozenset(
+                {PermissionCode.USERS_READ, PermissionCode.USERS_DELETE}
+            ),
+            is_active=True,
+            is_admin=True,
+            email="admin@example.com",
+        ),
+        refresh_at=1_700_000_000.5,
+        load_s=0.004,
+    )
+
+
+def test_binary_entry_round_trips() -> None:
+    raw = encode_cached_user(_entry())
+
+    assert raw[:1] == b"\x01"
+    assert decode_cached_user(raw) == _entry()
+
+
+def test_binary_entry_is_smaller_than_legacy_json() -> None:
+    entry = _entry()
+    legacy = msgspec.json.encode(
+        {
+            "id": str(entry.user.id),
+            "role_codes": sorted(entry.user.role_codes),
+            "permission_codes": sorted(
+                code.value for code in entry.user.permission_codes
+            ),
+            "is_active": True,
+            "is_superuser": False,
+            "is_admin": True,
+            "email": entry.user.email,
+            "refresh_at": entry.refresh_at,
+            "load_s": entry.load_s,
+        }
+    )
+
+    assert len(encode_cached_user(entry)) < len(legacy) // 2
+    assert decode_cached_user(legacy) == entry
+
+
+def test_corrupt_or_unknown_versions_are_misses() -> None:
+    raw = encode_cached_user(_entry())
+
+    assert decode_cached_user(raw[:-3]) is None
+    assert decode_cached_user(b"\x02" + raw[1:]) is None
+    assert decode_cached_user(b"") is None
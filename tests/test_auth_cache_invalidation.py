@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+from uuid_utils.compat import UUID
+
+from backend.application.common.tools.auth_cache import AuthCacheInvalidator
+from backend.infrastructure.persistence.cache.redis_pubsub import (
+    RedisInvalidationBus,
+)
+
+_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+class _RecordingCache:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.invalidated: list[UUID] = []
+        self.fail = fail
+
+    async def invalidate(self, user_id: UUID) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.invalidated.append(user_id)
+
+
+class _RecordingBus:
+    def __init__(self) -> None:
+        self.published: list[UUID] = []
+
+    async def publish(self, user_id: UUID) -> None:
+        self.published.append(user_id)
+
+
+class _FakePubSub:
+    def __init__(self, messages: list[dict[str, object]]) -> None:
+        self.messages = messages
+        self.subscribed: list[str] = []
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribed.append(channel)
+
+    async def listen(self) -> AsyncIterator[dict[str, object]]:
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+    async def __aenter__(self) -> _FakePubSub:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self, pubsub: _FakePubSub) -> None:
+        self._pubsub = pubsub
+
+    def pubsub(self, *, ignore_subscribe_messages: bool) -> _FakePubSub:
+        assert ignore_subscribe_messages is True
+        return self._pubsub
+
+
+@pytest.mark.asyncio
+async def test_invalidator_evicts_and_publishes() -> None:
+    cache = _RecordingCache()
+    bus = _RecordingBus()
+
+    await AuthCacheInvalidator(cache=cache, bus=bus).invalidate_user(_USER_ID)
+
+    assert cache.invalidated == [_USER_ID]
+    assert bus.published == [_USER_ID]
+
+
+@pytest.mark.asyncio
+async def test_invalidator_publishes_even_if_cache_delete_fails() -> None:
+    bus = _RecordingBus()
+
+    await AuthCacheInvalidator(
+        cache=_RecordingCache(fail=True), bus=bus
+    ).invalidate_user(_USER_ID)
+
+    assert bus.published == [_USER_ID]
+
+
+@pytest.mark.asyncio
+async def test_listener_evicts_valid_ids_and_resets_on_subscribe() -> None:
+    pubsub = _FakePubSub(
+        [
+            {"type": "message", "data": str(_USER_ID).encode()},
+            {"type": "message", "data": b"not-a-uuid"},
+        ]
+    )
+    bus = RedisInvalidationBus(
+        client=cast(Redis, _FakeRedis(pubsub)), channel="auth:user:invalidate"
+    )
+    evicted: list[UUID] = []
+    resets: list[None] = []
+
+    task = asyncio.create_task(
+        bus.listen(
+            on_invalidate=evicted.append,
+            on_reset=lambda: resets.append(None),
+        )
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert pubsub.subscribed == ["auth:user:invalidate"]
+    assert resets == [None]
+    assert evicted == [_USER_ID]
+    assert pubsub.closed is True
@@ -154,6 +154,7 @@ async def test_register_user_creates_user_and_returns_tokens(
     )
     assert dto.access_token == access_token
     assert dto.refresh_token == refresh_token
+    assert dto.user_id == _USER_ID
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import pytest
+
+from backend.application.common.exceptions.application import (
+    TooManyRequestsError,
+)
+from backend.application.common.interfaces.ports.rate_limit import RateLimit
+from backend.application.common.tools.auth_throttle import (
+    AuthThrottle,
+    AuthThrottlePolicy,
+    rate_limit_key,
+)
+
+
+@dataclass(slots=True)
+class _FakeLimiter:
+    retry_after_s: int | None = None
+    raised: Exception | None = None
+    calls: list[list[RateLimit]] = field(default_factory=list)
+
+    async def hit(
+        self: _FakeLimiter, limits: Sequence[RateLimit]
+    ) -> int | None:
+        self.calls.append(list(limits))
+        if self.raised is not None:
+            raise self.raised
+        return self.retry_after_s
+
+
+def _throttle(limiter: _FakeLimiter) -> AuthThrottle:
+    return AuthThrottle(
+        limiter=limiter,
+        policy=AuthThrottlePolicy(
+            window_s=60, per_ip=30, per_email=5, per_fingerprint=10
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_throttle_checks_all_keys_in_one_call() -> None:
+    limiter = _FakeLimiter()
+
+    await _throttle(limiter).check(
+        "login",
+        client_ip="203.0.113.7",
+        email=" User@Example.com",
+        fingerprint="fp",
+    )
+
+    assert limiter.calls == [
+        [
+            RateLimit(
+                key=rate_limit_key("login", "email", "user@example.com"),
+                limit=5,
+                window_s=60,
+            ),
+            RateLimit(
+                key=rate_limit_key("login", "fp", "fp"), limit=10, window_s=60
+            ),
+            RateLimit(
+                key=rate_limit_key("login", "ip", "203.0.113.7"),
+                limit=30,
+                window_s=60,
+            ),
+        ]
+    ]
+    assert "example" not in limiter.calls[0][0].key
+
+
+@pytest.mark.asyncio
+async def test_throttle_skips_ip_key_without_client_address() -> None:
+    limiter = _FakeLimiter()
+
+    await _throttle(limiter).check(
+        "register", client_ip=None, email="user@example.com", fingerprint="fp"
+    )
+
+    assert [limit.key.split(":")[3] for limit in limiter.calls[0]] == [
+        "email",
+        "fp",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_throttle_rejects_with_retry_after() -> None:
+    limiter = _FakeLimiter(retry_after_s=7)
+
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await _throttle(limiter).check(
+            "login",
+            client_ip="203.0.113.7",
+            email="user@example.com",
+            fingerprint="fp",
+        )
+
+    assert exc_info.value.meta == {"retry_after_s": 7}
+
+
+@pytest.mark.asyncio
+async def test_throttle_fails_open_when_limiter_is_down() -> None:
+    limiter = _FakeLimiter(raised=ConnectionError("redis down"))
+
+    await _throttle(limiter).check(
+        "login",
+        client_ip="203.0.113.7",
+        email="user@example.com",
+        fingerprint="fp",
+    )
+
+    assert len(limiter.calls) == 1
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import msgspec
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.tools.auth_cache import auth_user_key
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.security.auth.user_cache import (
+    TieredAuthUserCache,
+)
+
+_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+class _InMemoryBytesCache:
+    def __init__(self) -> None:
+        self.items: dict[str, bytes] = {}
+        self.gets = 0
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        self.gets += 1
+        return self.items.get(key)
+
+    async def set(
+        self, key: str, value: bytes, *, ttl_s: int | None = None
+    ) -> None:
+        self.items[key] = value
+        self.ttls[key] = ttl_s
+
+    async def delete(self, key: str) -> None:
+        self.items.pop(key, None)
+
+
+def _user() -> AuthUser:
+    return AuthUser(
+        id=_USER_ID,
+        role_codes=frozenset({"admin"}),
+        permission_codes=frozenset({PermissionCode.USERS_READ}),
+        is_active=True,
+        is_admin=True,
+        email="admin@example.com",
+    )
+
+
+def _cache(remote: _InMemoryBytesCache) -> TieredAuthUserCache:
+    local: LocalTTLCache[UUID, CachedAuthUser] = LocalTTLCache(
+        max_entries=10, max_weight=10_000, ttl_s=30
+    )
+    return TieredAuthUserCache(
+        local=local,
+        remote=remote,
+        ttl_s=300,
+        stale_ttl_s=60,
+        clock=lambda: 1_000.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_writes_both_tiers_and_get_skips_remote() -> None:
+    remote = _InMemoryBytesCache()
+    cache = _cache(remote)
+
+    await cache.set(_user(), load_s=0.05)
+    cached = await cache.get(_USER_ID)
+
+    assert cached == CachedAuthUser(
+        user=_user(), refresh_at=1_300.0, load_s=0.05
+    )
+    assert remote.gets == 0
+    assert remote.ttls[auth_user_key(_USER_ID)] == 360
+    assert cache.local.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_remote_hit_populates_local_tier() -> None:
+    remote = _InMemoryBytesCache()
+    await _cache(remote).set(_user())
+    cache = _cache(remote)
+
+    first = await cache.get(_USER_ID)
+    second = await cache.get(_USER_ID)
+
+    assert first is not None
+    assert first.user == _user()
+    assert first.refresh_at == 1_300.0
+    assert second is first
+    assert remote.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_only_bypasses_local_tier() -> None:
+    remote = _InMemoryBytesCache()
+    cache = _cache(remote)
+    await cache.set(_user())
+
+    await cache.get(_USER_ID, shared_only=True)
+
+    assert remote.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_legacy_remote_entry_is_immediately_stale() -> None:
+    remote = _InMemoryBytesCache()
+    remote.items[auth_user_key(_USER_ID)] = msgspec.json.encode(
+        {
+            "id": str(_USER_ID),
+            "role_codes": ["admin"],
+            "permission_codes": ["users:read"],
+            "is_active": True,
+            "email": "admin@example.com",
+        }
+    )
+
+    cached = await _cache(remote).get(_USER_ID)
+
+    assert cached is not None
+    assert cached.user == _user()
+    assert cached.refresh_at == 0.0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_both_tiers() -> None:
+    remote = _InMemoryBytesCache()
+    cache = _cache(remote)
+    await cache.set(_user())
+
+    await cache.invalidate(_USER_ID)
+
+    assert await cache.get(_USER_ID) is None
+    assert auth_user_key(_USER_ID) not in remote.items
+
+
+@pytest.mark.asyncio
+async def test_undecodable_remote_value_is_a_miss() -> None:
+    remote = _InMemoryBytesCache()
+    remote.items[auth_user_key(_USER_ID)] = b"not-a-cache-entry"
+    cache = _cache(remote)
+
+    assert await cache.get(_USER_ID) is None
+    assert len(cache.local) == 0
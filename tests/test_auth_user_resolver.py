@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.common.interfaces.auth.ports import Authenticator
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+    PermissionSpec,
+)
+from backend.application.common.tools.auth_cache import AuthCacheInvalidator
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.security.auth.user_resolver import (
+    AuthUserResolver,
+)
+from backend.infrastructure.tools.single_flight import SingleFlight
+
+_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def _user(*, is_active: bool = True) -> AuthUser:
+    return AuthUser(
+        id=_USER_ID,
+        role_codes=frozenset({"user"}),
+        permission_codes=frozenset({PermissionCode.USERS_READ}),
+        is_active=is_active,
+    )
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeCache:
+    def __init__(self, clock: _Clock, ttl_s: float = 300.0) -> None:
+        self.clock = clock
+        self.ttl_s = ttl_s
+        self.entries: dict[UUID, CachedAuthUser] = {}
+        self.shared_gets = 0
+        self.invalidated: list[UUID] = []
+
+    async def get(
+        self, user_id: UUID, *, shared_only: bool = False
+    ) -> CachedAuthUser | None:
+        if shared_only:
+            self.shared_gets += 1
+        return self.entries.get(user_id)
+
+    async def set(self, user: AuthUser, *, load_s: float = 0.0) -> None:
+        self.entries[user.id] = CachedAuthUser(
+            user=user, refresh_at=self.clock() + self.ttl_s, load_s=load_s
+        )
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self.invalidated.append(user_id)
+        self.entries.pop(user_id, None)
+
+
+class _RecordingBus:
+    def __init__(self) -> None:
+        self.published: list[UUID] = []
+
+    async def publish(self, user_id: UUID) -> None:
+        self.published.append(user_id)
+
+
+class _FakeAuthenticator:
+    def __init__(
+        self, user: AuthUser | None, error: StorageError | None = None
+    ) -> None:
+        self.user = user
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def authenticate(self, user_id: UUID) -> AuthUser | None:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.user
+
+    async def authorize(self, user_id: UUID, spec: PermissionSpec) -> bool:
+        raise NotImplementedError
+
+
+class _FixedRandom(random.Random):
+    def __init__(self, value: float) -> None:
+        super().__init__()
+        self.value = value
+
+    def random(self) -> float:
+        return self.value
+
+
+def _resolver(
+    cache: _FakeCache,
+    authenticator: _FakeAuthenticator,
+    *,
+    rng: random.Random | None = None,
+    bus: _RecordingBus | None = None,
+) -> AuthUserResolver:
+    @asynccontextmanager
+    async def _open() -> AsyncIterator[Authenticator]:
+        yield authenticator
+
+    return AuthUserResolver(
+        cache=cache,
+        loads=SingleFlight(),
+        authenticators=_open,
+        invalidator=AuthCacheInvalidator(
+            cache=cache, bus=bus or _RecordingBus()
+        ),
+        clock=cache.clock,
+        rng=rng or _FixedRandom(0.0),
+    )
+
+
+async def _drain(resolver: AuthUserResolver) -> None:
+    while resolver._refreshes:
+        await asyncio.gather(*resolver._refreshes)
+
+
+@pytest.mark.asyncio
+async def test_miss_loads_and_populates_cache() -> None:
+    cache = _FakeCache(_Clock(1_000.0))
+    authenticator = _FakeAuthenticator(_user())
+    resolver = _resolver(cache, authenticator)
+
+    assert await resolver.resolve(_USER_ID) == _user()
+    assert cache.entries[_USER_ID].refresh_at == 1_300.0
+    assert authenticator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_refresh() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    await cache.set(_user(), load_s=0.01)
+    authenticator = _FakeAuthenticator(_user())
+    resolver = _resolver(cache, authenticator)
+
+    assert await resolver.resolve(_USER_ID) == _user()
+    await _drain(resolver)
+
+    assert authenticator.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_then_refreshed_once() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    await cache.set(_user())
+    clock.now = 1_301.0
+    authenticator = _FakeAuthenticator(_user())
+    authenticator.release.clear()
+    resolver = _resolver(cache, authenticator)
+
+    served = await asyncio.gather(
+        *(resolver.resolve(_USER_ID) for _ in range(5))
+    )
+    await asyncio.sleep(0)
+    authenticator.release.set()
+    await _drain(resolver)
+
+    assert served == [_user()] * 5
+    assert authenticator.calls == 1
+    assert cache.shared_gets == 1
+    assert cache.entries[_USER_ID].refresh_at == 1_601.0
+
+
+@pytest.mark.asyncio
+async def test_xfetch_refreshes_before_soft_expiry() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    await cache.set(_user(), load_s=1.0)
+    clock.now = 1_295.0
+    authenticator = _FakeAuthenticator(_user())
+    # -ln(1 - 0.999) ~= 6.9 seconds of headroom at load_s=1, beta=1.
+    resolver = _resolver(cache, authenticator, rng=_FixedRandom(0.999))
+
+    await resolver.resolve(_USER_ID)
+    await _drain(resolver)
+
+    assert authenticator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_drops_deactivated_user() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    await cache.set(_user())
+    clock.now = 1_400.0
+    authenticator = _FakeAuthenticator(_user(is_active=False))
+    bus = _RecordingBus()
+    resolver = _resolver(cache, authenticator, bus=bus)
+
+    await resolver.resolve(_USER_ID)
+    await _drain(resolver)
+
+    assert cache.invalidated == [_USER_ID]
+    assert bus.published == [_USER_ID]
+    assert _USER_ID not in cache.entries
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_entry_when_load_fails() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    await cache.set(_user())
+    clock.now = 1_400.0
+    authenticator = _FakeAuthenticator(
+        None,
+        error=StorageError(
+            code="db.error", message="Database error", detail="timeout"
+        ),
+    )
+    bus = _RecordingBus()
+    resolver = _resolver(cache, authenticator, bus=bus)
+
+    assert await resolver.resolve(_USER_ID) == _user()
+    await _drain(resolver)
+
+    assert authenticator.calls == 1
+    assert cache.invalidated == []
+    assert bus.published == []
+    assert _USER_ID in cache.entries
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuses_newer_shared_entry() -> None:
+    clock = _Clock(1_000.0)
+    cache = _FakeCache(clock)
+    stale = CachedAuthUser(user=_user(), refresh_at=900.0)
+
+    async def _stale_local(
+        user_id: UUID, *, shared_only: bool = False
+    ) -> CachedAuthUser | None:
+        if shared_only:
+            return CachedAuthUser(user=_user(), refresh_at=1_200.0)
+        return stale
+
+    cache.get = _stale_local  # type: ignore[method-assign]
+    authenticator = _FakeAuthenticator(_user())
+    resolver = _resolver(cache, authenticator)
+
+    await resolver.resolve(_USER_ID)
+    await _drain(resolver)
+
+    assert authenticator.calls == 0
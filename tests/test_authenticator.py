@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import (
+    NotFoundStorageError,
+    StorageError,
+)
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.domain.core.entities.user import User
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.mappers.users import (
+    access_record_to_user,
+)
+from backend.infrastructure.persistence.records import UserAccessRecord
+from backend.infrastructure.security.auth.authenticator import (
+    AuthenticatorImpl,
+)
+
+_USER_ID: UUID = UUID("22222222-2222-2222-2222-222222222222")
+
+
+def _build_password_hash() -> str:
+    return "".join(("$argon2id", "$stub"))
+
+
+def _record(*, roles: list[str], permissions: list[str]) -> UserAccessRecord:
+    return UserAccessRecord(
+        id=_USER_ID,
+        email="admin@example.com",
+        login="admin",
+        username="admin",
+        password_hash=_build_password_hash(),
+        is_active=True,
+        roles=roles,
+        permission_codes=permissions,
+    )
+
+
+@dataclass(slots=True)
+class _FakeUsers:
+    access: UserAccessRecord | None
+    calls: int = 0
+    by_id_calls: int = 0
+    error: StorageError | None = None
+
+    async def get_with_permissions(
+        self: _FakeUsers, user_id: UUID
+    ) -> Result[tuple[User, set[PermissionCode]], StorageError]:
+        self.calls += 1
+        if self.error is not None:
+            return ResultImpl.err(self.error)
+        if self.access is None:
+            return ResultImpl.err(
+                NotFoundStorageError(
+                    code="user.not_found",
+                    message="User not found",
+                    detail="not found",
+                )
+            )
+        return ResultImpl.ok(access_record_to_user(self.access))
+
+    async def get_by_id(
+        self: _FakeUsers, user_id: UUID
+    ) -> Result[User, StorageError]:
+        self.by_id_calls += 1
+        assert self.access is not None
+        user, _permissions = access_record_to_user(self.access)
+        return ResultImpl.ok(user)
+
+
+def test_access_record_maps_roles_and_permissions() -> None:
+    user, permissions = access_record_to_user(
+        _record(roles=["admin"], permissions=["users:read"])
+    )
+
+    assert user.roles == {"admin"}
+    assert permissions == {PermissionCode.USERS_READ}
+
+
+@pytest.mark.asyncio
+async def test_authenticate_uses_single_access_lookup() -> None:
+    users = _FakeUsers(
+        _record(roles=["admin"], permissions=["users:read", "users:create"])
+    )
+    authenticator = AuthenticatorImpl(users=users, rbac=object())  # type: ignore[arg-type]
+
+    auth_user = await authenticator.authenticate(_USER_ID)
+
+    assert users.calls == 1
+    assert auth_user is not None
+    assert auth_user.is_admin
+    assert auth_user.permission_codes == {
+        PermissionCode.USERS_READ,
+        PermissionCode.USERS_CREATE,
+    }
+
+
+@pytest.mark.asyncio
+async def test_authenticate_returns_none_for_missing_user() -> None:
+    authenticator = AuthenticatorImpl(users=_FakeUsers(None), rbac=object())  # type: ignore[arg-type]
+
+    assert await authenticator.authenticate(_USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_authenticate_raises_storage_errors() -> None:
+    error = StorageError(
+        code="db.error", message="Database error", detail="timeout"
+    )
+    users = _FakeUsers(_record(roles=["user"], permissions=[]), error=error)
+    authenticator = AuthenticatorImpl(users=users, rbac=object())  # type: ignore[arg-type]
+
+    with pytest.raises(StorageError) as exc_info:
+        await authenticator.authenticate(_USER_ID)
+
+    assert exc_info.value is error
+
+
+@pytest.mark.asyncio
+async def test_authenticate_resolves_permissions_from_index() -> None:
+    users = _FakeUsers(_record(roles=["reader"], permissions=[]))
+    index = RolePermissionIndex()
+    index.replace({"reader": {PermissionCode.USERS_READ}})
+    authenticator = AuthenticatorImpl(
+        users=users,
+        rbac=object(),  # type: ignore[arg-type]
+        role_permissions=index,
+    )
+
+    auth_user = await authenticator.authenticate(_USER_ID)
+
+    assert (users.by_id_calls, users.calls) == (1, 0)
+    assert auth_user is not None
+    assert auth_user.permission_codes == {PermissionCode.USERS_READ}
+
+
+@pytest.mark.asyncio
+async def test_authenticate_falls_back_for_role_missing_from_index() -> None:
+    users = _FakeUsers(_record(roles=["auditor"], permissions=["users:read"]))
+    index = RolePermissionIndex()
+    index.replace({"reader": set()})
+    authenticator = AuthenticatorImpl(
+        users=users,
+        rbac=object(),  # type: ignore[arg-type]
+        role_permissions=index,
+    )
+
+    auth_user = await authenticator.authenticate(_USER_ID)
+
+    assert (users.by_id_calls, users.calls) == (1, 1)
+    assert auth_user is not None
+    assert auth_user.permission_codes == {PermissionCode.USERS_READ}
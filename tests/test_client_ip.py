@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from ipaddress import ip_network
+
+from starlette.requests import Request
+
+from backend.presentation.http.api.client_ip import TrustedProxies
+
+_PROXIES = TrustedProxies(
+    networks=(ip_network("10.0.0.0/8"), ip_network("fd00::/8"))
+)
+
+
+def _request(peer: str, **headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/auth/login",
+            "client": (peer, 40000),
+            "headers": [
+                (name.replace("_", "-").lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_untrusted_peer_headers_are_ignored() -> None:
+    request = _request("203.0.113.7", x_forwarded_for="198.51.100.1")
+
+    assert _PROXIES.client_ip(request) == "203.0.113.7"
+
+
+def test_trusted_peer_yields_nearest_untrusted_forwarded_hop() -> None:
+    request = _request(
+        "10.0.0.2",
+        x_forwarded_for="1.2.3.4, 198.51.100.1, 10.0.0.9",
+    )
+
+    assert _PROXIES.client_ip(request) == "198.51.100.1"
+
+
+def test_malformed_forwarded_hop_falls_back_to_peer() -> None:
+    request = _request("10.0.0.2", x_forwarded_for="198.51.100.1, junk")
+
+    assert _PROXIES.client_ip(request) == "10.0.0.2"
+
+
+def test_real_ip_is_used_without_forwarded_for() -> None:
+    request = _request("fd00::5", x_real_ip="198.51.100.1")
+
+    assert _PROXIES.client_ip(request) == "198.51.100.1"
+
+
+def test_no_trusted_proxies_means_the_peer_address() -> None:
+    request = _request("10.0.0.2", x_real_ip="198.51.100.1")
+
+    assert TrustedProxies().client_ip(request) == "10.0.0.2"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.application.common.exceptions.application import (
+    TooManyRequestsError,
+)
+from backend.application.common.exceptions.auth import (
+    PasswordHashingBusyError,
+)
+from backend.application.common.exceptions.error_mappers.auth import (
+    map_invalid_credentials,
+)
+from backend.application.common.exceptions.error_mappers.users import (
+    map_user_input_error,
+)
+from backend.infrastructure.security.hashing_pool import HashingPool
+
+
+def _blocking(gate: threading.Event, value: int) -> int:
+    gate.wait(timeout=5)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_beyond_concurrency_plus_queue() -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+    pool = HashingPool(
+        executor, max_concurrency=1, max_queue=1, retry_after_s=3
+    )
+    gate = threading.Event()
+    running = asyncio.create_task(pool.run(_blocking, gate, 1))
+    queued = asyncio.create_task(pool.run(_blocking, gate, 2))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(PasswordHashingBusyError) as exc_info:
+        await pool.run(_blocking, gate, 3)
+
+    gate.set()
+    assert await asyncio.gather(running, queued) == [1, 2]
+    assert exc_info.value.retry_after_s == 3
+    assert pool.rejected == 1
+    assert pool.admitted == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_releases_admission_when_work_fails() -> None:
+    pool = HashingPool.create("thread", workers=1, max_queue=0)
+
+    def _fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await pool.run(_fail)
+
+    assert pool.admitted == 0
+    pool.shutdown()
+
+
+def test_busy_error_maps_to_too_many_requests() -> None:
+    busy = PasswordHashingBusyError(retry_after_s=2)
+
+    for mapper in (map_invalid_credentials(), map_user_input_error()):
+        err = mapper(busy)
+        assert isinstance(err, TooManyRequestsError)
+        assert err.meta == {"retry_after_s": 2}
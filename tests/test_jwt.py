@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 
+import pytest
 from jwt import decode as jwt_decode
 from jwt import encode as jwt_encode
 from uuid_utils.compat import UUID
 
-from backend.infrastructure.security.auth.jwt import JwtConfig, JwtImpl
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+from backend.infrastructure.security.auth.jwt import (
+    AccessTokenCache,
+    JwtConfig,
+    JwtImpl,
+)
 
 _USER_ID = UUID("00000000-0000-0000-0000-000000000001")
 
@@ -128,3 +136,94 @@ def test_verify_access_requires_jti_claim() -> None:
 
     assert err.code == "auth.unauthenticated"
     assert err.message == "Invalid access token"
+
+
+def _cached_jwt(clock: list[float]) -> JwtImpl:
+    cache: AccessTokenCache = LocalTTLCache(
+        max_entries=8, max_weight=8, ttl_s=900, clock=lambda: clock[0]
+    )
+    return JwtImpl(cfg=_config(), access_cache=cache)
+
+
+def test_verify_access_serves_repeat_tokens_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    jwt_impl = _cached_jwt([0.0])
+    token = jwt_impl.issue_access(user_id=_USER_ID)
+    decodes: list[str] = []
+    decode = JwtImpl._decode
+
+    def _counting_decode(self: JwtImpl, raw: str) -> Mapping[str, object]:
+        decodes.append(raw)
+        return decode(self, raw)
+
+    monkeypatch.setattr(JwtImpl, "_decode", _counting_decode)
+
+    first = jwt_impl.verify_access(token).unwrap()
+    second = jwt_impl.verify_access(token).unwrap()
+
+    assert first == second == _USER_ID
+    assert decodes == [token]
+    assert jwt_impl.access_cache is not None
+    assert jwt_impl.access_cache.stats.hits == 1
+
+
+def test_verify_access_cache_entry_expires_with_token() -> None:
+    clock = [0.0]
+    jwt_impl = _cached_jwt(clock)
+    now = datetime.now(tz=UTC)
+    payload = {
+        "iss": jwt_impl.cfg.issuer,
+        "aud": jwt_impl.cfg.audience,
+        "sub": str(_USER_ID),
+        "typ": "access",
+        "jti": "jti-1",
+        "iat": int(now.timestamp()),
+        "exp": int(now.timestamp()) + 2,
+    }
+    token = jwt_encode(
+        payload, jwt_impl.cfg.secret, algorithm=jwt_impl.cfg.alg
+    )
+
+    assert jwt_impl.verify_access(token).unwrap() == _USER_ID
+    clock[0] = 5.0
+
+    assert jwt_impl.access_cache is not None
+    assert len(jwt_impl.access_cache) == 1
+    assert (
+        jwt_impl.access_cache.get(hashlib.sha256(token.encode()).digest())
+        is None
+    )
+
+
+def test_verify_access_accepts_fractional_exp() -> None:
+    clock = [0.0]
+    jwt_impl = _cached_jwt(clock)
+    now = datetime.now(tz=UTC)
+    exp = now.timestamp() + 60.75
+    payload = {
+        "iss": jwt_impl.cfg.issuer,
+        "aud": jwt_impl.cfg.audience,
+        "sub": str(_USER_ID),
+        "typ": "access",
+        "jti": "jti-1",
+        "iat": int(now.timestamp()),
+        "exp": exp,
+    }
+    token = jwt_encode(
+        payload, jwt_impl.cfg.secret, algorithm=jwt_impl.cfg.alg
+    )
+
+    assert jwt_impl.verify_access(token).unwrap() == _USER_ID
+    assert jwt_impl.access_cache is not None
+    cached = jwt_impl.access_cache.get(hashlib.sha256(token.encode()).digest())
+    assert cached == (_USER_ID, int(exp))
+
+
+def test_verify_access_does_not_cache_rejected_tokens() -> None:
+    jwt_impl = _cached_jwt([0.0])
+
+    jwt_impl.verify_access("not-a-jwt")
+
+    assert jwt_impl.access_cache is not None
+    assert len(jwt_impl.access_cache) == 0
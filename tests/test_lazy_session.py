@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import TracebackType
+
+import pytest
+
+from backend.infrastructure.persistence.manager import TransactionManagerImpl
+
+
+@dataclass(slots=True)
+class _FakeBegin:
+    outcomes: list[bool]
+
+    async def __aenter__(self: _FakeBegin) -> _FakeBegin:
+        return self
+
+    async def __aexit__(
+        self: _FakeBegin,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.outcomes.append(exc_type is None)
+
+
+@dataclass(slots=True)
+class _FakeSession:
+    closed: bool = False
+    committed: list[bool] = field(default_factory=list)
+
+    async def close(self: _FakeSession) -> None:
+        self.closed = True
+
+    def in_transaction(self: _FakeSession) -> bool:
+        return False
+
+    def begin(self: _FakeSession) -> _FakeBegin:
+        return _FakeBegin(self.committed)
+
+
+@dataclass(slots=True)
+class _SessionFactory:
+    created: list[_FakeSession]
+
+    def __call__(self: _SessionFactory) -> _FakeSession:
+        session = _FakeSession()
+        self.created.append(session)
+        return session
+
+
+@pytest.mark.asyncio
+async def test_lazy_manager_never_opens_unused_session() -> None:
+    factory = _SessionFactory(created=[])
+    manager = TransactionManagerImpl.lazy(factory)  # type: ignore[arg-type]
+
+    await manager.aclose()
+
+    assert factory.created == []
+    assert manager.opened is False
+
+
+@pytest.mark.asyncio
+async def test_lazy_manager_opens_once_on_first_query_and_closes() -> None:
+    factory = _SessionFactory(created=[])
+    manager = TransactionManagerImpl.lazy(factory)  # type: ignore[arg-type]
+
+    async def query(session: object) -> object:
+        return session
+
+    first = await manager.send(query)
+    second = await manager.send(query)
+    await manager.aclose()
+
+    assert factory.created == [first]
+    assert first is second
+    assert factory.created[0].closed is True
+
+
+@pytest.mark.asyncio
+async def test_borrowed_session_is_left_to_its_owner() -> None:
+    session = _FakeSession()
+    manager = TransactionManagerImpl(session)  # type: ignore[arg-type]
+
+    await manager.aclose()
+
+    assert session.closed is False
+    assert manager.conn is session
+
+
+@pytest.mark.asyncio
+async def test_on_commit_runs_only_after_a_committed_transaction() -> None:
+    session = _FakeSession()
+    commits: list[None] = []
+
+    async def on_commit() -> None:
+        commits.append(None)
+
+    manager = TransactionManagerImpl(session, on_commit=on_commit)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="rolled back"):
+        async with manager.transaction():
+            raise ValueError("rolled back")
+    assert commits == []
+
+    async with manager.transaction():
+        pass
+
+    assert session.committed == [False, True]
+    assert commits == [None]
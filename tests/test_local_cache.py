@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from backend.infrastructure.persistence.cache.local import LocalTTLCache
+
+
+@dataclass(slots=True)
+class _Clock:
+    now: float = 0.0
+
+    def __call__(self: _Clock) -> float:
+        return self.now
+
+
+def _cache(
+    clock: _Clock, *, max_entries: int = 10, max_weight: int = 1000
+) -> LocalTTLCache[str, int]:
+    return LocalTTLCache(
+        max_entries=max_entries,
+        max_weight=max_weight,
+        ttl_s=10.0,
+        clock=clock,
+    )
+
+
+def test_get_counts_hits_and_misses() -> None:
+    cache = _cache(_Clock())
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_snapshot_reports_size_and_counters() -> None:
+    cache = _cache(_Clock(), max_entries=1)
+    cache.set("a", 1, weight=3)
+    cache.set("b", 2, weight=5)
+    cache.get("b")
+    cache.get("a")
+
+    snapshot = cache.snapshot()
+
+    assert (snapshot.entries, snapshot.weight) == (1, 5)
+    assert (snapshot.hits, snapshot.misses) == (1, 1)
+    assert snapshot.evictions == 1
+    assert snapshot.hit_rate == 0.5
+
+
+def test_entry_expires_after_ttl() -> None:
+    clock = _Clock()
+    cache = _cache(clock)
+    cache.set("a", 1)
+
+    clock.now = 10.0
+
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_is_capped_by_cache_ttl() -> None:
+    clock = _Clock()
+    cache = _cache(clock)
+    cache.set("short", 1, ttl_s=2.0)
+    cache.set("long", 2, ttl_s=60.0)
+
+    clock.now = 5.0
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+    clock.now = 10.0
+    assert cache.get("long") is None
+
+
+def test_evicts_least_recently_used_by_count() -> None:
+    cache = _cache(_Clock(), max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_evicts_by_weight_and_rejects_oversized_entries() -> None:
+    cache = _cache(_Clock(), max_weight=100)
+    cache.set("a", 1, weight=60)
+    cache.set("b", 2, weight=60)
+
+    assert cache.get("a") is None
+    assert cache.weight == 60
+
+    cache.set("huge", 3, weight=101)
+    assert cache.get("huge") is None
+    assert cache.get("b") == 2
+
+
+def test_overwrite_and_delete_keep_weight_consistent() -> None:
+    cache = _cache(_Clock())
+    cache.set("a", 1, weight=10)
+    cache.set("a", 2, weight=30)
+    assert cache.weight == 30
+
+    cache.delete("a")
+    assert cache.weight == 0
+    assert cache.get("a") is None
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.handlers.commands.auth.login import (
+    LoginUserCommand,
+    LoginUserHandler,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.domain.core.entities.user import User
+from backend.infrastructure.security.password_rehash import (
+    BackgroundPasswordRehasher,
+)
+
+_USER_ID: UUID = UUID("55555555-5555-5555-5555-555555555555")
+
+
+def _build_raw_password() -> str:
+    return "".join(("Strong", "Pass", "123", "!"))
+
+
+def _build_old_hash() -> str:
+    return "".join(("$argon2id$v=19$m=1024,t=1,p=1", "$c2FsdA$aGFzaA"))
+
+
+@dataclass(slots=True)
+class _FakeUsers:
+    user: User
+
+    async def get_by_email(
+        self: _FakeUsers, email: str, *, include_roles: bool = True
+    ) -> Result[User, StorageError]:
+        return ResultImpl.ok(self.user)
+
+
+@dataclass(slots=True)
+class _FakeGateway:
+    users: _FakeUsers
+
+
+@dataclass(slots=True)
+class _FakeHasher:
+    outdated: bool
+
+    async def verify(
+        self: _FakeHasher, raw_password: str, hashed_password: str
+    ) -> bool:
+        return True
+
+    async def needs_rehash(self: _FakeHasher, hashed_password: str) -> bool:
+        return self.outdated
+
+
+@dataclass(slots=True)
+class _FakeJwtIssuer:
+    def issue_access(self: _FakeJwtIssuer, *, user_id: UUID) -> str:
+        return "access"
+
+    def issue_refresh(
+        self: _FakeJwtIssuer, *, user_id: UUID, fingerprint: str
+    ) -> tuple[str, str]:
+        return "refresh", "jti"
+
+
+@dataclass(slots=True)
+class _FakeRefreshTokens:
+    async def rotate(
+        self: _FakeRefreshTokens,
+        *,
+        user_id: UUID,
+        fingerprint: str,
+        old_jti: str,
+        new_jti: str,
+    ) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class _RecordingRehash:
+    scheduled: list[tuple[UUID, str, str]] = field(default_factory=list)
+
+    def schedule(
+        self: _RecordingRehash,
+        *,
+        user_id: UUID,
+        raw_password: str,
+        current_hash: str,
+    ) -> None:
+        self.scheduled.append((user_id, raw_password, current_hash))
+
+
+def _handler(*, outdated: bool, rehash: _RecordingRehash) -> LoginUserHandler:
+    user = User(
+        id=_USER_ID,
+        email="user@example.com",
+        login="user",
+        username="user",
+        password=_build_old_hash(),
+    )
+    return LoginUserHandler(
+        gateway=_FakeGateway(users=_FakeUsers(user)),  # type: ignore[arg-type]
+        password_hasher=_FakeHasher(outdated=outdated),  # type: ignore[arg-type]
+        jwt_issuer=_FakeJwtIssuer(),
+        refresh_tokens=_FakeRefreshTokens(),  # type: ignore[arg-type]
+        password_rehash=rehash,
+    )
+
+
+def _command() -> LoginUserCommand:
+    return LoginUserCommand(
+        email="user@example.com",
+        raw_password=_build_raw_password(),
+        fingerprint="fp",
+    )
+
+
+@pytest.mark.asyncio
+async def test_login_schedules_rehash_for_outdated_hash() -> None:
+    rehash = _RecordingRehash()
+
+    result = await _handler(outdated=True, rehash=rehash)(_command())
+
+    assert result.is_ok()
+    assert rehash.scheduled == [
+        (_USER_ID, _build_raw_password(), _build_old_hash())
+    ]
+
+
+@pytest.mark.asyncio
+async def test_login_skips_rehash_for_current_hash() -> None:
+    rehash = _RecordingRehash()
+
+    result = await _handler(outdated=False, rehash=rehash)(_command())
+
+    assert result.is_ok()
+    assert rehash.scheduled == []
+
+
+@dataclass(slots=True)
+class _BlockingHasher:
+    release: asyncio.Event
+    calls: int = 0
+
+    async def hash(self: _BlockingHasher, raw_password: str) -> str:
+        self.calls += 1
+        await self.release.wait()
+        raise RuntimeError("stop before touching the database")
+
+
+@pytest.mark.asyncio
+async def test_rehasher_dedupes_and_bounds_pending_jobs() -> None:
+    hasher = _BlockingHasher(release=asyncio.Event())
+    rehasher = BackgroundPasswordRehasher(
+        hasher=hasher,  # type: ignore[arg-type]
+        session_factory=None,  # type: ignore[arg-type]
+        max_pending=2,
+    )
+    other_ids = (
+        UUID("66666666-6666-6666-6666-666666666666"),
+        UUID("77777777-7777-7777-7777-777777777777"),
+    )
+
+    for user_id in (_USER_ID, _USER_ID, *other_ids):
+        rehasher.schedule(
+            user_id=user_id,
+            raw_password=_build_raw_password(),
+            current_hash=_build_old_hash(),
+        )
+    await asyncio.sleep(0)
+    hasher.release.set()
+    await rehasher.drain()
+
+    assert hasher.calls == 2
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import msgspec
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.application import (
+    AuthorizationError,
+)
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    CachedAuthUser,
+)
+from backend.application.common.tools.permission_guard import PermissionGuard
+from backend.domain.core.constants.permission_codes import (
+    ALL_PERMISSION_CODES,
+    PERMISSION_BIT_INDEX,
+    mask_to_permissions,
+    permissions_to_mask,
+)
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.security.auth.cache_codec import (
+    decode_cached_user,
+    encode_cached_user,
+)
+
+_USER_ID = UUID("33333333-3333-3333-3333-333333333333")
+
+
+def _user(*codes: PermissionCode) -> AuthUser:
+    return AuthUser(
+        id=_USER_ID,
+        role_codes=frozenset({"user"}),
+        permission_codes=frozenset(codes),
+        is_active=True,
+    )
+
+
+def test_every_permission_has_a_unique_bit() -> None:
+    assert set(PERMISSION_BIT_INDEX) == ALL_PERMISSION_CODES
+    assert len(set(PERMISSION_BIT_INDEX.values())) == len(ALL_PERMISSION_CODES)
+
+
+def test_mask_round_trips_permission_sets() -> None:
+    codes = frozenset(
+        {PermissionCode.USERS_READ, PermissionCode.RBAC_REVOKE_ROLE}
+    )
+
+    mask = permissions_to_mask(codes)
+
+    assert mask == 0b1000001
+    assert mask_to_permissions(mask) == codes
+
+
+def test_unknown_mask_bits_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown permission bits"):
+        mask_to_permissions(1 << 40)
+
+
+@pytest.mark.asyncio
+async def test_guard_checks_mask_bits() -> None:
+    guard = PermissionGuard()
+    user = _user(PermissionCode.USERS_READ)
+
+    await guard.require(user, PermissionCode.USERS_READ)
+    with pytest.raises(AuthorizationError):
+        await guard.require(user, PermissionCode.USERS_DELETE)
+
+
+def test_cached_payload_round_trips_the_mask() -> None:
+    user = _user(PermissionCode.USERS_READ, PermissionCode.USERS_UPDATE)
+
+    raw = encode_cached_user(CachedAuthUser(user=user, refresh_at=1.0))
+    decoded = decode_cached_user(raw)
+
+    assert decoded is not None
+    assert decoded.user == user
+    assert decoded.user.permission_mask == 0b101
+
+
+def test_legacy_permission_list_payload_still_decodes() -> None:
+    raw = msgspec.json.encode(
+        {
+            "id": str(_USER_ID),
+            "role_codes": ["user"],
+            "permission_codes": ["users:read"],
+            "is_active": True,
+        }
+    )
+
+    decoded = decode_cached_user(raw)
+
+    assert decoded is not None
+    assert decoded.user == _user(PermissionCode.USERS_READ)
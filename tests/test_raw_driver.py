@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import asyncpg
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import (
+    AsyncAdapt_asyncpg_connection,
+    PGDialect_asyncpg,
+)
+from uuid_utils.compat import UUID
+
+from backend.infrastructure.persistence.manager import TransactionManagerImpl
+from backend.infrastructure.persistence.rawadapter.users import (
+    _USER_ROW_BY_ID,
+    q_get_user_row_by_id,
+)
+from backend.infrastructure.persistence.records import (
+    UserRowRecord,
+    UserSummaryRecord,
+)
+from backend.infrastructure.persistence.sqlalchemy.raw_driver import (
+    DriverQuery,
+    driver_sql,
+)
+from backend.infrastructure.tools.storage_result import storage_result
+
+_USER_ID: UUID = UUID("dddddddd-0000-0000-0000-000000000001")
+
+
+def _build_password_hash() -> str:
+    return "".join(("$argon2id", "$stub"))
+
+
+@dataclass(slots=True)
+class _FakeTransaction:
+    started: list[bool]
+
+    async def start(self: _FakeTransaction) -> None:
+        self.started.append(True)
+
+
+@dataclass(slots=True)
+class _FakeAsyncpgConnection:
+    row: tuple[object, ...] | None = None
+    error: Exception | None = None
+    queries: list[tuple[str, tuple[object, ...]]] = field(default_factory=list)
+    started: list[bool] = field(default_factory=list)
+
+    def transaction(self: _FakeAsyncpgConnection, **_: object) -> object:
+        return _FakeTransaction(self.started)
+
+    def is_closed(self: _FakeAsyncpgConnection) -> bool:
+        return False
+
+    async def fetchrow(
+        self: _FakeAsyncpgConnection, query: str, *args: object
+    ) -> tuple[object, ...] | None:
+        self.queries.append((query, args))
+        if self.error is not None:
+            raise self.error
+        return self.row
+
+
+@dataclass(slots=True)
+class _FakeRawConnection:
+    dbapi_connection: object
+
+
+@dataclass(slots=True)
+class _FakeConnection:
+    raw: _FakeRawConnection
+    invalidated: list[BaseException | None] = field(default_factory=list)
+
+    async def get_raw_connection(self: _FakeConnection) -> _FakeRawConnection:
+        return self.raw
+
+    async def invalidate(
+        self: _FakeConnection, exception: BaseException | None = None
+    ) -> None:
+        self.invalidated.append(exception)
+
+
+@dataclass(slots=True)
+class _FakeSession:
+    conn: _FakeConnection
+
+    async def connection(self: _FakeSession) -> _FakeConnection:
+        return self.conn
+
+
+def _session(driver: _FakeAsyncpgConnection) -> _FakeSession:
+    adapted = AsyncAdapt_asyncpg_connection(
+        PGDialect_asyncpg.import_dbapi(), driver
+    )
+    return _FakeSession(_FakeConnection(_FakeRawConnection(adapted)))
+
+
+def _row() -> tuple[object, ...]:
+    return (
+        _USER_ID,
+        "raw@example.com",
+        "raw",
+        "raw",
+        _build_password_hash(),
+        True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_driver_query_runs_through_session_by_default() -> None:
+    async def fallback(session: object) -> str:
+        return "session"
+
+    async def fetch(conn: object) -> str:
+        return "driver"
+
+    manager = TransactionManagerImpl(_session(_FakeAsyncpgConnection()))  # type: ignore[arg-type]
+
+    assert await manager.send(DriverQuery(fallback, fetch)) == "session"
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_decodes_rows_in_one_transaction() -> None:
+    driver = _FakeAsyncpgConnection(row=_row())
+    manager = TransactionManagerImpl(
+        _session(driver),  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    first = await manager.send(q_get_user_row_by_id(_USER_ID))
+    second = await manager.send(q_get_user_row_by_id(_USER_ID))
+
+    assert first == UserRowRecord(*_row())
+    assert first == second
+    assert driver.started == [True]
+    sql, args = driver.queries[0]
+    assert sql == str(_USER_ROW_BY_ID.compile(dialect=PGDialect_asyncpg()))
+    assert args == (_USER_ID,)
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_errors_map_like_engine_errors() -> None:
+    driver = _FakeAsyncpgConnection(
+        error=asyncpg.exceptions.QueryCanceledError("canceled")
+    )
+    manager = TransactionManagerImpl(
+        _session(driver),  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    result = await storage_result(
+        lambda: manager.send(q_get_user_row_by_id(_USER_ID))
+    )
+
+    error = result.unwrap_err()
+    assert error.code == "db.error"
+    assert error.meta == {"sqlstate": "57014"}
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_invalidates_connection_on_client_errors() -> None:
+    lost = asyncpg.exceptions.ConnectionDoesNotExistError("connection lost")
+    driver = _FakeAsyncpgConnection(error=lost)
+    session = _session(driver)
+    manager = TransactionManagerImpl(
+        session,  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    result = await storage_result(
+        lambda: manager.send(q_get_user_row_by_id(_USER_ID))
+    )
+
+    assert result.unwrap_err().code == "db.error"
+    assert session.conn.invalidated == [lost]
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_invalidates_connection_without_sqlstate() -> None:
+    broken = asyncpg.exceptions.InterfaceError("protocol out of sync")
+    driver = _FakeAsyncpgConnection(error=broken)
+    session = _session(driver)
+    manager = TransactionManagerImpl(
+        session,  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    result = await storage_result(
+        lambda: manager.send(q_get_user_row_by_id(_USER_ID))
+    )
+
+    assert result.unwrap_err().code == "db.error"
+    assert session.conn.invalidated == [broken]
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_keeps_connection_on_server_errors() -> None:
+    driver = _FakeAsyncpgConnection(
+        error=asyncpg.exceptions.QueryCanceledError("canceled")
+    )
+    session = _session(driver)
+    manager = TransactionManagerImpl(
+        session,  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    await storage_result(lambda: manager.send(q_get_user_row_by_id(_USER_ID)))
+
+    assert session.conn.invalidated == []
+
+
+@pytest.mark.asyncio
+async def test_raw_driver_maps_unique_violation_like_engine() -> None:
+    driver = _FakeAsyncpgConnection(
+        error=asyncpg.exceptions.UniqueViolationError("duplicate")
+    )
+    manager = TransactionManagerImpl(
+        _session(driver),  # type: ignore[arg-type]
+        raw_driver=True,
+    )
+
+    result = await storage_result(
+        lambda: manager.send(q_get_user_row_by_id(_USER_ID))
+    )
+
+    assert result.unwrap_err().code == "db.unique_violation"
+
+
+def test_asyncpg_adapter_keeps_members_run_on_driver_relies_on() -> None:
+    # run_on_driver reaches into these; an upgrade that renames them must
+    # fail here, not on the first request.
+    adapted = AsyncAdapt_asyncpg_connection(
+        PGDialect_asyncpg.import_dbapi(), _FakeAsyncpgConnection()
+    )
+
+    assert adapted._started is False
+    assert callable(adapted._start_transaction)
+    assert hasattr(adapted._execute_mutex, "__aenter__")
+    assert isinstance(adapted.driver_connection, _FakeAsyncpgConnection)
+
+
+def test_driver_sql_rejects_columns_out_of_record_order() -> None:
+    with pytest.raises(ValueError, match="UserSummaryRecord"):
+        driver_sql(_USER_ROW_BY_ID, "user_id", record_type=UserSummaryRecord)
@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-
 import pytest
 from uuid_utils.compat import UUID
 
-from backend.application.common.exceptions.application import ConflictError
 from backend.application.common.exceptions.auth import (
     InvalidRefreshTokenError,
-    RefreshTokenLockTimeoutError,
     RefreshTokenReplayError,
 )
-from backend.application.common.exceptions.error_mappers.auth import (
-    map_refresh_token_error,
+from backend.application.common.interfaces.auth.ports import (
+    RefreshSwapOutcome,
 )
 from backend.application.common.tools.refresh_tokens import (
     RefreshTokenService,
@@ -24,6 +19,7 @@ from backend.application.common.tools.refresh_tokens import (
 class _InMemoryRefreshStore:
     def __init__(self) -> None:
         self._items: dict[str, str] = {}
+        self.swaps = 0
 
     async def get(self, *, user_id: UUID, fingerprint: str) -> str | None:
         return self._items.get(refresh_key(user_id, fingerprint))
@@ -42,24 +38,33 @@ class _InMemoryRefreshStore:
     async def delete(self, *, user_id: UUID, fingerprint: str) -> None:
         self._items.pop(refresh_key(user_id, fingerprint), None)
 
-
-class _NoopLock:
-    @asynccontextmanager
-    async def __call__(self, _key: str) -> AsyncIterator[None]:
-        yield
-
-
-class _TimeoutLock:
-    @asynccontextmanager
-    async def __call__(self, _key: str) -> AsyncIterator[None]:
-        raise RefreshTokenLockTimeoutError("lock timeout")
-        yield
+    async def compare_and_swap(
+        self,
+        *,
+        user_id: UUID,
+        fingerprint: str,
+        expected: str,
+        value: str,
+        ttl_s: int,
+    ) -> RefreshSwapOutcome:
+        del ttl_s
+        self.swaps += 1
+        key = refresh_key(user_id, fingerprint)
+        current = self._items.get(key)
+        if expected:
+            if current is None:
+                return "missing"
+            if current != expected:
+                del self._items[key]
+                return "replay"
+        self._items[key] = value
+        return "ok"
 
 
 @pytest.mark.asyncio
 async def test_rotate_login_sets_token_when_missing() -> None:
     store = _InMemoryRefreshStore()
-    svc = RefreshTokenService(store=store, lock=_NoopLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
 
     user_id = UUID("00000000-0000-0000-0000-000000000001")
     await svc.rotate(
@@ -80,7 +85,7 @@ async def test_rotate_login_overwrites_existing_token() -> None:
         user_id=user_id, fingerprint="fp", value="existing", ttl_s=None
     )
 
-    svc = RefreshTokenService(store=store, lock=_NoopLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
     await svc.rotate(
         user_id=user_id,
         fingerprint="fp",
@@ -94,7 +99,7 @@ async def test_rotate_login_overwrites_existing_token() -> None:
 @pytest.mark.asyncio
 async def test_rotate_refresh_requires_current_token() -> None:
     store = _InMemoryRefreshStore()
-    svc = RefreshTokenService(store=store, lock=_NoopLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
     user_id = UUID("00000000-0000-0000-0000-000000000001")
 
     with pytest.raises(InvalidRefreshTokenError):
@@ -114,7 +119,7 @@ async def test_rotate_refresh_replay_deletes_token() -> None:
         user_id=user_id, fingerprint="fp", value="current", ttl_s=None
     )
 
-    svc = RefreshTokenService(store=store, lock=_NoopLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
 
     with pytest.raises(RefreshTokenReplayError):
         await svc.rotate(
@@ -138,7 +143,7 @@ async def test_rotate_refresh_success_rotates_token() -> None:
         ttl_s=None,
     )
 
-    svc = RefreshTokenService(store=store, lock=_NoopLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
     await svc.rotate(
         user_id=user_id,
         fingerprint="fp",
@@ -150,22 +155,17 @@ async def test_rotate_refresh_success_rotates_token() -> None:
 
 
 @pytest.mark.asyncio
-async def test_rotate_refresh_lock_timeout_propagates() -> None:
+async def test_rotate_is_one_swap_per_call() -> None:
     store = _InMemoryRefreshStore()
     user_id = UUID("00000000-0000-0000-0000-000000000001")
-    svc = RefreshTokenService(store=store, lock=_TimeoutLock(), ttl_s=123)
+    svc = RefreshTokenService(store=store, ttl_s=123)
 
-    with pytest.raises(RefreshTokenLockTimeoutError):
-        await svc.rotate(
-            user_id=user_id,
-            fingerprint="fp",
-            old_jti="",
-            new_jti="new-jti",
-        )
-
-
-def test_refresh_token_error_mapper_handles_lock_timeout() -> None:
-    mapped = map_refresh_token_error()(RefreshTokenLockTimeoutError("busy"))
+    await svc.rotate(
+        user_id=user_id, fingerprint="fp", old_jti="", new_jti="first"
+    )
+    await svc.rotate(
+        user_id=user_id, fingerprint="fp", old_jti="first", new_jti="second"
+    )
 
-    assert isinstance(mapped, ConflictError)
-    assert mapped.message == "Refresh token operation timeout, retry"
+    assert store.swaps == 2
+    assert await store.get(user_id=user_id, fingerprint="fp") == "second"
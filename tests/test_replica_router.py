@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.common.interfaces.auth.ports import Authenticator
+from backend.application.common.interfaces.auth.types import (
+    AuthUser,
+    PermissionSpec,
+)
+from backend.application.common.tools.auth_cache import AuthCacheInvalidator
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.sqlalchemy.replica import (
+    ReplicaRouter,
+    read_sticky_key,
+)
+from backend.infrastructure.security.auth.authenticator import (
+    ReplicaFirstAuthenticator,
+)
+
+_USER_ID: UUID = UUID("88888888-8888-8888-8888-888888888888")
+
+
+@dataclass(slots=True)
+class _FakeStrCache:
+    items: dict[str, str] = field(default_factory=dict)
+    ttls: dict[str, int | None] = field(default_factory=dict)
+    broken: bool = False
+
+    async def get(self: _FakeStrCache, key: str) -> str | None:
+        if self.broken:
+            raise ConnectionError("redis down")
+        return self.items.get(key)
+
+    async def set(
+        self: _FakeStrCache, key: str, value: str, *, ttl_s: int | None = None
+    ) -> None:
+        self.items[key] = value
+        self.ttls[key] = ttl_s
+
+    async def delete(self: _FakeStrCache, key: str) -> None:
+        self.items.pop(key, None)
+
+    async def increment(
+        self: _FakeStrCache, key: str, *, delta: int = 1
+    ) -> int:
+        raise NotImplementedError
+
+
+def _router(
+    cache: _FakeStrCache, *, with_replica: bool = True
+) -> tuple[ReplicaRouter, object, object]:
+    primary: async_sessionmaker[AsyncSession] = async_sessionmaker()
+    replica: async_sessionmaker[AsyncSession] = async_sessionmaker()
+    router = ReplicaRouter(
+        primary=primary,
+        replica=replica if with_replica else None,
+        sticky=cache,  # type: ignore[arg-type]
+        sticky_s=5,
+    )
+    return router, primary, replica
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_and_writes_to_primary() -> None:
+    router, primary, replica = _router(_FakeStrCache())
+
+    assert await router.session_factory_for("read", _USER_ID) is replica
+    assert await router.session_factory_for("read", None) is replica
+    assert await router.session_factory_for("write", _USER_ID) is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_stick_to_primary_after_a_write() -> None:
+    cache = _FakeStrCache()
+    router, primary, replica = _router(cache)
+
+    await router.mark_write(_USER_ID)
+
+    assert cache.ttls == {read_sticky_key(_USER_ID): 5}
+    assert await router.session_factory_for("read", _USER_ID) is primary
+    other = UUID("99999999-9999-9999-9999-999999999999")
+    assert await router.session_factory_for("read", other) is replica
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_when_pin_state_is_unknown() -> None:
+    router, primary, _ = _router(_FakeStrCache(broken=True))
+
+    assert await router.session_factory_for("read", _USER_ID) is primary
+
+
+@pytest.mark.asyncio
+async def test_without_replica_everything_uses_primary() -> None:
+    cache = _FakeStrCache()
+    router, primary, _ = _router(cache, with_replica=False)
+
+    await router.mark_write(_USER_ID)
+
+    assert cache.items == {}
+    assert await router.session_factory_for("read", _USER_ID) is primary
+
+
+@dataclass(slots=True)
+class _FakeAuthenticator:
+    user: AuthUser | None
+    calls: int = 0
+    error: StorageError | None = None
+
+    async def authenticate(
+        self: _FakeAuthenticator, user_id: UUID
+    ) -> AuthUser | None:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.user
+
+    async def get_permission_for(
+        self: _FakeAuthenticator, user_id: UUID, spec: PermissionSpec
+    ) -> object:
+        raise NotImplementedError
+
+
+def _auth_user(*, admin: bool = False) -> AuthUser:
+    return AuthUser(
+        id=_USER_ID,
+        role_codes=frozenset({"user", "admin"} if admin else {"user"}),
+        permission_codes=frozenset(
+            {PermissionCode.USERS_READ, PermissionCode.RBAC_ASSIGN_ROLE}
+            if admin
+            else {PermissionCode.USERS_READ}
+        ),
+        is_active=True,
+        is_admin=admin,
+        is_superuser=False,
+        email="user@example.com",
+    )
+
+
+def _replica_first(
+    replica: _FakeAuthenticator,
+    primary: _FakeAuthenticator,
+    lagged: list[UUID],
+    router: ReplicaRouter | None = None,
+) -> ReplicaFirstAuthenticator:
+    @asynccontextmanager
+    async def _open_primary() -> AsyncIterator[Authenticator]:
+        yield primary  # type: ignore[misc]
+
+    async def _on_lag(user_id: UUID) -> None:
+        lagged.append(user_id)
+
+    if router is None:
+        router, _, _ = _router(_FakeStrCache())
+    return ReplicaFirstAuthenticator(
+        replica=replica,  # type: ignore[arg-type]
+        primary=_open_primary,
+        on_lag=_on_lag,
+        pinned=router.is_pinned,
+    )
+
+
+@pytest.mark.asyncio
+async def test_replica_hit_skips_primary() -> None:
+    replica = _FakeAuthenticator(user=_auth_user())
+    primary = _FakeAuthenticator(user=_auth_user())
+    lagged: list[UUID] = []
+
+    user = await _replica_first(replica, primary, lagged).authenticate(
+        _USER_ID
+    )
+
+    assert user == _auth_user()
+    assert primary.calls == 0
+    assert lagged == []
+
+
+@pytest.mark.asyncio
+async def test_replica_miss_rechecks_primary_and_pins_reads() -> None:
+    replica = _FakeAuthenticator(user=None)
+    primary = _FakeAuthenticator(user=_auth_user())
+    lagged: list[UUID] = []
+    authenticator = _replica_first(replica, primary, lagged)
+
+    permission = await authenticator.get_permission_for(
+        _USER_ID, PermissionSpec(code=PermissionCode.USERS_READ)
+    )
+
+    assert permission.allowed
+    assert primary.calls == 1
+    assert lagged == [_USER_ID]
+
+
+@pytest.mark.asyncio
+async def test_replica_error_falls_back_to_primary_without_pinning() -> None:
+    replica = _FakeAuthenticator(
+        user=None,
+        error=StorageError(
+            code="db.error", message="Database error", detail="timeout"
+        ),
+    )
+    primary = _FakeAuthenticator(user=_auth_user())
+    lagged: list[UUID] = []
+
+    user = await _replica_first(replica, primary, lagged).authenticate(
+        _USER_ID
+    )
+
+    assert user == _auth_user()
+    assert primary.calls == 1
+    assert lagged == []
+
+
+@dataclass(slots=True)
+class _NullAuthUserCache:
+    evicted: list[UUID] = field(default_factory=list)
+
+    async def invalidate(self: _NullAuthUserCache, user_id: UUID) -> None:
+        self.evicted.append(user_id)
+
+
+@dataclass(slots=True)
+class _NullBus:
+    async def publish(self: _NullBus, user_id: UUID) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_revoke_pins_the_reload_to_primary_past_a_lagging_replica() -> (
+    None
+):
+    router, _, _ = _router(_FakeStrCache())
+    # The replica has not applied the revoke yet; the primary has.
+    replica = _FakeAuthenticator(user=_auth_user(admin=True))
+    primary = _FakeAuthenticator(user=_auth_user())
+    authenticator = _replica_first(replica, primary, [], router)
+    assert (await authenticator.authenticate(_USER_ID)) == _auth_user(
+        admin=True
+    )
+    cache = _NullAuthUserCache()
+    invalidator = AuthCacheInvalidator(
+        cache=cache,  # type: ignore[arg-type]
+        bus=_NullBus(),
+        pin_primary=router.mark_write,
+    )
+
+    await invalidator.invalidate_user(_USER_ID)
+    reloaded = await authenticator.authenticate(_USER_ID)
+
+    assert cache.evicted == [_USER_ID]
+    assert reloaded == _auth_user()
+    assert reloaded is not None
+    assert PermissionCode.RBAC_ASSIGN_ROLE not in reloaded.permission_codes
+    assert (replica.calls, primary.calls) == (1, 1)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.application.common.tools.role_permissions import (
+    RolePermissionIndex,
+)
+from backend.domain.core.types.rbac import PermissionCode
+from backend.infrastructure.persistence.cache.redis_pubsub import (
+    RedisReloadSignal,
+)
+from backend.infrastructure.security.auth.role_permissions import (
+    ROLE_PERMISSIONS_RELOAD_CHANNEL,
+    RolePermissionIndexLoader,
+)
+
+
+def test_index_is_unloaded_until_replaced() -> None:
+    index = RolePermissionIndex()
+
+    assert not index.loaded
+    assert index.resolve(["admin"]) is None
+    assert index.resolve([]) == frozenset()
+
+
+def test_resolve_unions_role_permissions() -> None:
+    index = RolePermissionIndex()
+    index.replace(
+        {
+            "user": set(),
+            "reader": {PermissionCode.USERS_READ},
+            "editor": {PermissionCode.USERS_READ, PermissionCode.USERS_UPDATE},
+        }
+    )
+
+    assert index.version == 1
+    assert index.resolve(["user", "reader"]) == {PermissionCode.USERS_READ}
+    assert index.resolve(["reader", "editor"]) == {
+        PermissionCode.USERS_READ,
+        PermissionCode.USERS_UPDATE,
+    }
+
+
+def test_unknown_role_is_not_resolved() -> None:
+    index = RolePermissionIndex()
+    index.replace({"reader": {PermissionCode.USERS_READ}})
+
+    assert index.resolve(["reader", "auditor"]) is None
+
+
+def test_replace_swaps_map_and_bumps_version() -> None:
+    index = RolePermissionIndex()
+    index.replace({"reader": {PermissionCode.USERS_READ}})
+    index.replace({"reader": set()})
+
+    assert index.version == 2
+    assert index.resolve(["reader"]) == frozenset()
+
+
+class _UnreachableSessions:
+    def __call__(self) -> object:
+        raise ConnectionRefusedError("db down")
+
+
+class _FakePubSub:
+    def __init__(self, messages: int) -> None:
+        self.messages = messages
+        self.subscribed: list[str] = []
+
+    async def subscribe(self, channel: str) -> None:
+        self.subscribed.append(channel)
+
+    async def listen(self) -> AsyncIterator[dict[str, object]]:
+        for _ in range(self.messages):
+            yield {"type": "message", "data": b"1"}
+        await asyncio.Event().wait()
+
+    async def __aenter__(self) -> _FakePubSub:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+
+class _FakeRedis:
+    def __init__(self, pubsub: _FakePubSub) -> None:
+        self._pubsub = pubsub
+
+    def pubsub(self, *, ignore_subscribe_messages: bool) -> _FakePubSub:
+        assert ignore_subscribe_messages is True
+        return self._pubsub
+
+
+@pytest.mark.asyncio
+async def test_loader_keeps_index_when_database_is_unreachable() -> None:
+    index = RolePermissionIndex()
+    index.replace({"reader": {PermissionCode.USERS_READ}})
+    loader = RolePermissionIndexLoader(
+        index=index,
+        session_factory=cast(
+            async_sessionmaker[AsyncSession], _UnreachableSessions()
+        ),
+    )
+
+    assert await loader.reload() is False
+    assert index.version == 1
+
+
+@pytest.mark.asyncio
+async def test_reload_signal_reloads_once_per_message() -> None:
+    pubsub = _FakePubSub(messages=2)
+    signal = RedisReloadSignal(
+        client=cast(Redis, _FakeRedis(pubsub)),
+        channel=ROLE_PERMISSIONS_RELOAD_CHANNEL,
+    )
+    reloads: list[None] = []
+
+    async def _reload() -> None:
+        reloads.append(None)
+
+    task = asyncio.create_task(signal.listen(on_reload=_reload))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert pubsub.subscribed == [ROLE_PERMISSIONS_RELOAD_CHANNEL]
+    assert reloads == [None, None]
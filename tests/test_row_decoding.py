@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_utils.compat import UUID
+
+from backend.infrastructure.persistence.rawadapter.rbac import (
+    q_list_role_permissions,
+)
+from backend.infrastructure.persistence.rawadapter.users import (
+    q_get_user_access_by_id,
+)
+from backend.infrastructure.persistence.records import (
+    RolePermissionsRecord,
+    UserAccessRecord,
+    UserRoleCodeRecord,
+)
+from backend.infrastructure.tools.msgspec_convert import convert_rows
+
+_USER_ID: UUID = UUID("eeeeeeee-0000-0000-0000-000000000001")
+
+
+def _build_password_hash() -> str:
+    return "".join(("$argon2id", "$stub"))
+
+
+class _Rows:
+    def __init__(self: _Rows, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    def all(self: _Rows) -> list[tuple[object, ...]]:
+        return self._rows
+
+    def first(self: _Rows) -> tuple[object, ...] | None:
+        return self._rows[0] if self._rows else None
+
+
+class _RowsSession(AsyncSession):
+    def __init__(self: _RowsSession, rows: list[tuple[object, ...]]) -> None:
+        self._rows = rows
+
+    async def execute(  # type: ignore[override]
+        self: _RowsSession,
+        statement: sa.Executable,
+        params: Mapping[str, object] | None = None,
+    ) -> _Rows:
+        return _Rows(self._rows)
+
+
+def test_convert_rows_takes_sqlalchemy_rows_positionally() -> None:
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.select(
+                sa.literal(str(_USER_ID)).label("user_id"),
+                sa.literal("admin").label("role"),
+            )
+        ).all()
+
+    assert convert_rows(rows, UserRoleCodeRecord) == [
+        UserRoleCodeRecord(user_id=_USER_ID, role="admin")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_null_aggregates_decode_as_empty_lists() -> None:
+    session = _RowsSession(
+        [
+            (
+                _USER_ID,
+                "access@example.com",
+                "access",
+                "access",
+                _build_password_hash(),
+                True,
+                None,
+                None,
+            )
+        ]
+    )
+
+    access = await q_get_user_access_by_id(_USER_ID)(session)
+    permissions = await q_list_role_permissions()(
+        _RowsSession([("admin", ["users:read"]), ("guest", None)])
+    )
+
+    assert isinstance(access, UserAccessRecord)
+    assert (access.roles, access.permission_codes) == ([], [])
+    assert permissions == [
+        RolePermissionsRecord(role="admin", permission_codes=["users:read"]),
+        RolePermissionsRecord(role="guest", permission_codes=[]),
+    ]
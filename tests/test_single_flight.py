@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.infrastructure.tools.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_load() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(flight.run("k", load)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert flight.coalesced == 9
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_distinct_keys_load_independently() -> None:
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def load_a() -> str:
+        return "a"
+
+    async def load_b() -> str:
+        return "b"
+
+    results = await asyncio.gather(
+        flight.run("a", load_a), flight.run("b", load_b)
+    )
+
+    assert results == ["a", "b"]
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_leader_error_propagates_to_waiters() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> int:
+        await release.wait()
+        raise RuntimeError("db down")
+
+    tasks = [asyncio.create_task(flight.run("k", load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(item, RuntimeError) for item in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_leader_is_cancelled() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    blocked = asyncio.Event()
+
+    async def slow_load() -> int:
+        await blocked.wait()
+        return 1
+
+    async def fast_load() -> int:
+        return 2
+
+    leader = asyncio.create_task(flight.run("k", slow_load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.run("k", fast_load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+
+    assert await waiter == 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
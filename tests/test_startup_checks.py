@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from backend.presentation.di.startup_checks import assert_closed_by_default
+from backend.presentation.http.api.routing.router import api_router
+
+
+def test_api_router_passes_closed_by_default() -> None:
+    app = FastAPI()
+    app.include_router(api_router)
+
+    assert_closed_by_default(app)
+
+
+def test_only_the_system_status_route_is_public() -> None:
+    open_router = APIRouter()
+
+    @open_router.get("/system/debug")
+    async def debug() -> None:
+        return None
+
+    app = FastAPI()
+    app.include_router(open_router)
+
+    with pytest.raises(RuntimeError, match="/system/debug"):
+        assert_closed_by_default(app)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import pytest
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.handlers.queries.rbac.get_users_by_role import (
+    GetUsersByRoleHandler,
+    GetUsersByRoleQuery,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.domain.core.entities.user import User
+from backend.infrastructure.persistence.adapters.users import SqlUsersAdapter
+from backend.infrastructure.persistence.records import (
+    UserRoleCodeRecord,
+    UserRowRecord,
+)
+
+_FIRST: UUID = UUID("aaaaaaaa-0000-0000-0000-000000000001")
+_SECOND: UUID = UUID("aaaaaaaa-0000-0000-0000-000000000002")
+_MISSING: UUID = UUID("aaaaaaaa-0000-0000-0000-000000000003")
+
+
+def _build_password_hash() -> str:
+    return "".join(("$argon2id", "$stub"))
+
+
+def _row(user_id: UUID, login: str) -> UserRowRecord:
+    return UserRowRecord(
+        id=user_id,
+        email=f"{login}@example.com",
+        login=login,
+        username=login,
+        password_hash=_build_password_hash(),
+        is_active=True,
+    )
+
+
+@dataclass(slots=True)
+class _ScriptedManager:
+    replies: list[object]
+    sent: int = 0
+
+    async def send(self: _ScriptedManager, query: object, /) -> object:
+        self.sent += 1
+        return self.replies.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_uses_two_queries_and_keeps_order() -> None:
+    manager = _ScriptedManager(
+        replies=[
+            [_row(_SECOND, "second"), _row(_FIRST, "first")],
+            [
+                UserRoleCodeRecord(user_id=_FIRST, role="admin"),
+                UserRoleCodeRecord(user_id=_FIRST, role="user"),
+                UserRoleCodeRecord(user_id=_SECOND, role="user"),
+            ],
+        ]
+    )
+    adapter = SqlUsersAdapter(manager)  # type: ignore[arg-type]
+
+    result = await adapter.get_many_by_ids([_FIRST, _MISSING, _SECOND, _FIRST])
+
+    users = result.unwrap()
+    assert manager.sent == 2
+    assert [user.id for user in users] == [_FIRST, _SECOND]
+    assert users[0].roles == {"admin", "user"}
+    assert users[1].roles == {"user"}
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_skips_roles_query_when_nothing_found() -> None:
+    manager = _ScriptedManager(replies=[[]])
+    adapter = SqlUsersAdapter(manager)  # type: ignore[arg-type]
+
+    result = await adapter.get_many_by_ids([_MISSING])
+
+    assert result.unwrap() == []
+    assert manager.sent == 1
+
+
+@dataclass(slots=True)
+class _FakeRbac:
+    user_ids: list[UUID]
+
+    async def list_user_ids_by_role(
+        self: _FakeRbac,
+        role: str,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
+    ) -> Result[list[UUID], StorageError]:
+        return ResultImpl.ok(self.user_ids)
+
+
+@dataclass(slots=True)
+class _FakeUsers:
+    users: list[User]
+    batches: list[list[UUID]] = field(default_factory=list)
+
+    async def get_many_by_ids(
+        self: _FakeUsers,
+        user_ids: Sequence[UUID],
+        *,
+        include_roles: bool = True,
+    ) -> Result[list[User], StorageError]:
+        self.batches.append(list(user_ids))
+        return ResultImpl.ok(self.users)
+
+    async def get_by_id(self: _FakeUsers, user_id: UUID) -> object:
+        raise AssertionError("handler must not load users one by one")
+
+
+@dataclass(slots=True)
+class _FakeGateway:
+    users: _FakeUsers
+    rbac: _FakeRbac
+
+
+@pytest.mark.asyncio
+async def test_users_by_role_loads_members_in_one_batch() -> None:
+    members = [
+        User(
+            id=user_id,
+            email=f"{login}@example.com",
+            login=login,
+            username=login,
+            password=_build_password_hash(),
+        )
+        for user_id, login in ((_FIRST, "first"), (_SECOND, "second"))
+    ]
+    users = _FakeUsers(users=members)
+    handler = GetUsersByRoleHandler(
+        gateway=_FakeGateway(users=users, rbac=_FakeRbac([_FIRST, _SECOND]))  # type: ignore[arg-type]
+    )
+
+    result = await handler(GetUsersByRoleQuery(role="user"))
+
+    dto = result.unwrap()
+    assert users.batches == [[_FIRST, _SECOND]]
+    assert [user.id for user in dto.users] == [_FIRST, _SECOND]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.handlers.queries.rbac.get_users_by_role import (
+    GetUsersByRoleHandler,
+    GetUsersByRoleQuery,
+)
+from backend.application.handlers.queries.rbac.stream_users_by_role import (
+    StreamUsersByRoleHandler,
+    StreamUsersByRoleQuery,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.domain.core.entities.user import User
+from backend.presentation.http.api.schemas.pagination import (
+    PageCursor,
+    encode_cursor,
+)
+from backend.presentation.http.api.schemas.rbac import UsersByRoleResponse
+
+_IDS: list[UUID] = [
+    UUID(f"bbbbbbbb-0000-0000-0000-00000000000{n}") for n in range(1, 6)
+]
+
+
+def _build_password_hash() -> str:
+    return "".join(("$argon2id", "$stub"))
+
+
+def _user(user_id: UUID) -> User:
+    login = f"user{str(user_id)[-1]}"
+    return User(
+        id=user_id,
+        email=f"{login}@example.com",
+        login=login,
+        username=login,
+        password=_build_password_hash(),
+    )
+
+
+@dataclass(slots=True)
+class _FakeRbac:
+    member_ids: list[UUID]
+    pages: list[tuple[UUID | None, int | None]] = field(default_factory=list)
+
+    async def list_user_ids_by_role(
+        self: _FakeRbac,
+        role: str,
+        *,
+        after: UUID | None = None,
+        limit: int | None = None,
+    ) -> Result[list[UUID], StorageError]:
+        self.pages.append((after, limit))
+        ids = [uid for uid in self.member_ids if after is None or uid > after]
+        return ResultImpl.ok(ids if limit is None else ids[:limit])
+
+    async def stream_users_by_role(
+        self: _FakeRbac, role: str, *, chunk_size: int
+    ) -> Result[AsyncIterator[list[User]], StorageError]:
+        async def _chunks() -> AsyncIterator[list[User]]:
+            for start in range(0, len(self.member_ids), chunk_size):
+                chunk = self.member_ids[start : start + chunk_size]
+                yield [_user(uid) for uid in chunk]
+
+        return ResultImpl.ok(_chunks())
+
+
+@dataclass(slots=True)
+class _FakeUsers:
+    batches: list[tuple[list[UUID], bool]] = field(default_factory=list)
+
+    async def get_many_by_ids(
+        self: _FakeUsers,
+        user_ids: Sequence[UUID],
+        *,
+        include_roles: bool = True,
+    ) -> Result[list[User], StorageError]:
+        self.batches.append((list(user_ids), include_roles))
+        return ResultImpl.ok([_user(uid) for uid in user_ids])
+
+
+@dataclass(slots=True)
+class _FakeGateway:
+    users: _FakeUsers
+    rbac: _FakeRbac
+
+
+def _gateway() -> _FakeGateway:
+    return _FakeGateway(users=_FakeUsers(), rbac=_FakeRbac(list(_IDS)))
+
+
+@pytest.mark.asyncio
+async def test_pages_walk_members_by_cursor_without_overlap() -> None:
+    gateway = _gateway()
+    handler = GetUsersByRoleHandler(gateway=gateway)  # type: ignore[arg-type]
+
+    first = (await handler(GetUsersByRoleQuery(role="user", limit=2))).unwrap()
+    second = (
+        await handler(
+            GetUsersByRoleQuery(role="user", limit=2, after=first.next_after)
+        )
+    ).unwrap()
+    last = (
+        await handler(
+            GetUsersByRoleQuery(role="user", limit=2, after=second.next_after)
+        )
+    ).unwrap()
+
+    assert [u.id for u in first.users] == _IDS[:2]
+    assert [u.id for u in second.users] == _IDS[2:4]
+    assert [u.id for u in last.users] == _IDS[4:]
+    assert last.next_after is None
+    assert gateway.rbac.pages == [
+        (None, 3),
+        (_IDS[1], 3),
+        (_IDS[3], 3),
+    ]
+    assert all(not include_roles for _, include_roles in gateway.users.batches)
+
+
+@pytest.mark.asyncio
+async def test_unpaged_query_keeps_returning_every_member() -> None:
+    gateway = _gateway()
+    handler = GetUsersByRoleHandler(gateway=gateway)  # type: ignore[arg-type]
+
+    dto = (await handler(GetUsersByRoleQuery(role="user"))).unwrap()
+
+    assert [u.id for u in dto.users] == _IDS
+    assert dto.next_after is None
+
+
+@pytest.mark.asyncio
+async def test_stream_presents_members_chunk_by_chunk() -> None:
+    handler = StreamUsersByRoleHandler(gateway=_gateway())  # type: ignore[arg-type]
+
+    dto = (
+        await handler(StreamUsersByRoleQuery(role="user", chunk_size=2))
+    ).unwrap()
+    chunks = [[u.id for u in chunk] async for chunk in dto.chunks]
+
+    assert chunks == [_IDS[:2], _IDS[2:4], _IDS[4:]]
+
+
+def test_cursor_is_opaque_and_round_trips() -> None:
+    adapter: TypeAdapter[UUID | None] = TypeAdapter(PageCursor)
+    cursor = encode_cursor(_IDS[0])
+
+    assert str(_IDS[0]) not in cursor
+    assert adapter.validate_python(cursor) == _IDS[0]
+    assert adapter.validate_python(None) is None
+    with pytest.raises(ValidationError):
+        adapter.validate_python("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_page_response_exposes_encoded_next_cursor() -> None:
+    handler = GetUsersByRoleHandler(gateway=_gateway())  # type: ignore[arg-type]
+    dto = (await handler(GetUsersByRoleQuery(role="user", limit=1))).unwrap()
+
+    response = UsersByRoleResponse.from_page(dto)
+
+    assert response.next_cursor == encode_cursor(_IDS[0])
+    assert [u.id for u in response.users] == [_IDS[0]]
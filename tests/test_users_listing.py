@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from uuid_utils.compat import UUID
+
+from backend.application.common.exceptions.storage import StorageError
+from backend.application.common.interfaces.ports.persistence.users_adapter import (
+    UserListFilter,
+    UserPageKey,
+    UserSummary,
+)
+from backend.application.handlers.queries.users.list_users import (
+    ListUsersHandler,
+    ListUsersQuery,
+)
+from backend.application.handlers.result import Result, ResultImpl
+from backend.presentation.http.api.schemas.pagination import (
+    UserPageCursor,
+    encode_user_cursor,
+)
+from backend.presentation.http.api.schemas.users import UsersPageResponse
+
+_SUMMARIES: list[UserSummary] = [
+    UserSummary(
+        id=UUID(f"cccccccc-0000-0000-0000-00000000000{n}"),
+        email=f"user{n}@example.com",
+        login=f"user{n}",
+        username=f"user{n}",
+    )
+    for n in range(1, 4)
+]
+
+
+@dataclass(slots=True)
+class _FakeUsers:
+    calls: list[tuple[UserListFilter, UserPageKey | None, int]] = field(
+        default_factory=list
+    )
+
+    async def list_page(
+        self: _FakeUsers,
+        filters: UserListFilter,
+        *,
+        after: UserPageKey | None,
+        limit: int,
+    ) -> Result[list[UserSummary], StorageError]:
+        self.calls.append((filters, after, limit))
+        start = 0
+        if after is not None:
+            start = [s.id for s in _SUMMARIES].index(after.id) + 1
+        return ResultImpl.ok(_SUMMARIES[start : start + limit])
+
+
+@dataclass(slots=True)
+class _FakeGateway:
+    users: _FakeUsers
+
+
+@pytest.mark.asyncio
+async def test_list_users_pages_with_one_probe_row() -> None:
+    users = _FakeUsers()
+    handler = ListUsersHandler(gateway=_FakeGateway(users))  # type: ignore[arg-type]
+
+    first = (
+        await handler(ListUsersQuery(limit=2, is_active=True, role="user"))
+    ).unwrap()
+    rest = (
+        await handler(ListUsersQuery(limit=2, after=first.next_after))
+    ).unwrap()
+
+    assert [u.id for u in first.users] == [s.id for s in _SUMMARIES[:2]]
+    assert first.next_after == UserPageKey.of(_SUMMARIES[1])
+    assert [u.id for u in rest.users] == [_SUMMARIES[2].id]
+    assert rest.next_after is None
+    assert users.calls[0] == (
+        UserListFilter(is_active=True, role="user"),
+        None,
+        3,
+    )
+
+
+def test_user_cursor_round_trips_both_sort_keys() -> None:
+    adapter: TypeAdapter[UserPageKey | None] = TypeAdapter(UserPageCursor)
+    key = UserPageKey.of(_SUMMARIES[0])
+    cursor = encode_user_cursor(key)
+
+    assert _SUMMARIES[0].email not in cursor
+    assert adapter.validate_python(cursor) == key
+    with pytest.raises(ValidationError):
+        adapter.validate_python(cursor[:8])
+
+
+@pytest.mark.asyncio
+async def test_page_response_projects_user_fields() -> None:
+    handler = ListUsersHandler(gateway=_FakeGateway(_FakeUsers()))  # type: ignore[arg-type]
+    dto = (await handler(ListUsersQuery(limit=1))).unwrap()
+
+    response = UsersPageResponse.from_page(dto)
+
+    assert response.model_dump()["users"] == [
+        {
+            "id": _SUMMARIES[0].id,
+            "email": "user1@example.com",
+            "login": "user1",
+            "username": "user1",
+        }
+    ]
+    assert response.next_cursor == encode_user_cursor(
+        UserPageKey.of(_SUMMARIES[0])
+    )